@@ -0,0 +1,4 @@
+"""
+Framework Overhead Benchmarks
+Latency of page object primitives, fixtures and test data generation against a local page
+"""
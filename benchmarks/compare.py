@@ -0,0 +1,91 @@
+"""
+Benchmark Comparison
+Flags regressions of a benchmark run against a stored baseline
+
+Usage:
+    python -m benchmarks.compare                                  # latest run vs benchmarks/baseline.json
+    python -m benchmarks.compare baseline.json current.json --metric p99_ms --threshold 0.25
+
+Timings depend on the machine, so no baseline is shipped: record one on the machine (or CI runner) that
+runs the comparison with python -m benchmarks.run --save-baseline and commit benchmarks/baseline.json there.
+
+Exits with status 1 when any benchmark regressed and 2 when the baseline or results file is missing.
+"""
+import argparse
+import sys
+from pathlib import Path
+
+from benchmarks.run import BASELINE_FILE, RESULTS_DIR
+from benchmarks.stats import load_results
+
+
+def compare(baseline: dict, current: dict, metric: str, threshold: float, min_delta_ms: float) -> list[dict]:
+    """
+    Compare two result sets
+
+    A benchmark regresses when its metric grew by more than threshold (relative)
+    and by more than min_delta_ms (absolute, to ignore noise on sub-millisecond calls).
+
+    Args:
+        baseline: Results from load_results
+        current: Results from load_results
+        metric: Summary field to compare (p50_ms, p95_ms, p99_ms, mean_ms)
+        threshold: Allowed relative increase (0.2 = 20%)
+        min_delta_ms: Allowed absolute increase in ms
+
+    Returns:
+        One row per benchmark present in both runs, with 'status' of regressed, improved or ok
+    """
+    rows = []
+    for name, summary in current["results"].items():
+        reference = baseline["results"].get(name)
+        if reference is None:
+            continue
+        before, after = reference[metric], summary[metric]
+        delta = after - before
+        change = delta / before if before else 0.0
+        if delta > min_delta_ms and change > threshold:
+            status = "regressed"
+        elif -delta > min_delta_ms and -change > threshold:
+            status = "improved"
+        else:
+            status = "ok"
+        rows.append({"name": name, "baseline": before, "current": after, "change": change, "status": status})
+    return rows
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Compare benchmark results against a baseline")
+    parser.add_argument("baseline", nargs="?", default=str(BASELINE_FILE), help="Baseline results file")
+    parser.add_argument("current", nargs="?", default=str(RESULTS_DIR / "latest.json"), help="Results to check")
+    parser.add_argument("--metric", default="p95_ms", choices=("p50_ms", "p95_ms", "p99_ms", "mean_ms"))
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed relative increase (default 0.2)")
+    parser.add_argument("--min-delta-ms", type=float, default=0.5, help="Allowed absolute increase in ms")
+    args = parser.parse_args(argv)
+
+    for path, hint in ((args.baseline, "--save-baseline"), (args.current, "")):
+        if not Path(path).is_file():
+            print(f"{path} not found; create it with python -m benchmarks.run {hint}".rstrip())
+            return 2
+
+    rows = compare(
+        load_results(args.baseline), load_results(args.current), args.metric, args.threshold, args.min_delta_ms
+    )
+    print(f"{'benchmark':<44}{'baseline':>12}{'current':>12}{'change':>10}  status   ({args.metric})")
+    for row in rows:
+        print(
+            f"{row['name']:<44}{row['baseline']:>12.3f}{row['current']:>12.3f}"
+            f"{row['change']:>+10.1%}  {row['status']}"
+        )
+
+    regressed = [row["name"] for row in rows if row["status"] == "regressed"]
+    if regressed:
+        print(f"\n{len(regressed)} benchmarks regressed: {', '.join(regressed)}")
+        return 1
+    print("\nNo regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+"""
+Fixture Overhead Scenarios
+Run by benchmarks.run with tests/conftest.py loaded as a plugin; every test is one sample of
+its class's setup + teardown cost
+"""
+import os
+
+import pytest
+
+ITERATIONS = int(os.getenv("BENCHMARK_ITERATIONS", "20"))
+SAMPLES = range(ITERATIONS)
+
+
+class TestBaseline:
+    """Pytest's own per-test cost (framework autouse fixtures disabled)"""
+
+    @pytest.fixture(autouse=True)
+    def log_test_info(self):
+        yield
+
+    @pytest.fixture(autouse=True)
+    def action_timing(self):
+        yield
+
+    @pytest.mark.parametrize("sample", SAMPLES)
+    def test_sample(self, sample):
+        pass
+
+
+class TestLogTestInfo:
+    """log_test_info autouse fixture"""
+
+    @pytest.fixture(autouse=True)
+    def action_timing(self):
+        yield
+
+    @pytest.mark.parametrize("sample", SAMPLES)
+    def test_sample(self, sample):
+        pass
+
+
+class TestContext:
+    """pytest-playwright context fixture (context creation and close)"""
+
+    @pytest.mark.parametrize("sample", SAMPLES)
+    def test_sample(self, sample, context):
+        pass
+
+
+class TestPage:
+    """page fixture without tracing"""
+
+    @pytest.fixture(autouse=True)
+    def trace_mode(self, monkeypatch):
+        monkeypatch.setenv("TRACE_MODE", "off")
+
+    @pytest.mark.parametrize("sample", SAMPLES)
+    def test_sample(self, sample, page):
+        pass
+
+
+class TestPageTracing:
+    """page fixture with a retain-on-failure trace chunk per test"""
+
+    @pytest.fixture(autouse=True)
+    def trace_mode(self, monkeypatch):
+        monkeypatch.setenv("TRACE_MODE", "retain-on-failure")
+
+    @pytest.mark.parametrize("sample", SAMPLES)
+    def test_sample(self, sample, page):
+        pass
+
+
+class TestPooledPage:
+    """page fixture served from a one-context warm pool, without tracing"""
+
+    @pytest.fixture(autouse=True)
+    def pool_size(self, monkeypatch):
+        monkeypatch.setenv("CONTEXT_POOL_SIZE", "1")
+        monkeypatch.setenv("TRACE_MODE", "off")
+
+    @pytest.mark.parametrize("sample", SAMPLES)
+    def test_sample(self, sample, page):
+        pass
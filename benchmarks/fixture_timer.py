@@ -0,0 +1,65 @@
+"""
+Fixture Timer Plugin
+Collects setup + teardown duration per benchmark scenario class and writes them as JSON
+"""
+import json
+from pathlib import Path
+
+import pytest
+
+
+def pytest_addoption(parser):
+    """Register the output option"""
+    parser.addoption(
+        "--benchmark-fixture-output",
+        action="store",
+        default=None,
+        help="Write per-scenario fixture samples (ms) to this JSON file",
+    )
+
+
+class FixtureTimer:
+    """Sums the setup and teardown phases of each test into per-scenario samples"""
+
+    def __init__(self, output: str):
+        """
+        Initialize fixture timer
+
+        Args:
+            output: JSON file receiving {scenario: [samples_ms]}
+        """
+        self.output = Path(output)
+        self.phases: dict[str, dict] = {}
+        self.failures: list[str] = []
+
+    def pytest_runtest_logreport(self, report):
+        """Record the duration of each phase"""
+        if report.failed:
+            self.failures.append(report.nodeid)
+        if report.when in ("setup", "teardown"):
+            self.phases.setdefault(report.nodeid, {})[report.when] = report.duration * 1000
+
+    def pytest_sessionfinish(self, session):
+        """
+        Group samples by scenario class and write them
+
+        The first and last sample of each scenario are dropped: they carry the
+        setup and teardown of session fixtures (browser launch, context pool).
+        """
+        samples: dict[str, list[float]] = {}
+        for nodeid, phases in self.phases.items():
+            if nodeid in self.failures or len(phases) != 2:
+                continue
+            scenario = nodeid.split("::")[1]
+            samples.setdefault(scenario, []).append(phases["setup"] + phases["teardown"])
+        samples = {scenario: values[1:-1] for scenario, values in samples.items()}
+        self.output.parent.mkdir(parents=True, exist_ok=True)
+        self.output.write_text(json.dumps({"samples": samples, "failures": self.failures}), encoding="utf-8")
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_configure(config):
+    """Activate the timer when an output file is given"""
+    output = config.getoption("--benchmark-fixture-output")
+    if output:
+        config.pluginmanager.register(FixtureTimer(output), "benchmark-fixture-timer")
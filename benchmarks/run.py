@@ -0,0 +1,248 @@
+"""
+Benchmark Runner
+Measures BasePage primitives, browser/tracing costs, fixtures and test data generation
+
+Usage:
+    python -m benchmarks.run                          # all groups, results in reports/benchmarks/
+    python -m benchmarks.run --groups primitives --iterations 200
+    python -m benchmarks.run --save-baseline          # also store as benchmarks/baseline.json
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+from playwright.sync_api import Browser, sync_playwright
+
+from benchmarks.stats import measure, save_results, summarize
+from pages.base_page import BasePage
+from utils.stub_server import StubServer
+from utils.test_data import ContactFormData, UserData
+from utils.trace_recorder import TRACE_LEVELS, TraceRecorder
+
+BENCHMARKS_DIR = Path(__file__).parent
+FIXTURE_PAGE = BENCHMARKS_DIR / "fixture_page.html"
+BASELINE_FILE = BENCHMARKS_DIR / "baseline.json"
+RESULTS_DIR = Path("reports") / "benchmarks"
+
+GROUPS = ("primitives", "browser", "test_data", "fixtures")
+
+CONTEXT_ARGS = {"viewport": {"width": 1920, "height": 1080}, "locale": "en-US"}
+
+QUERY_LOCATORS = ["#heading", "#first-link", "#name", ".item", "#hidden"]
+
+
+def bench_primitives(browser: Browser, url: str, iterations: int) -> dict:
+    """
+    Time each BasePage primitive against the fixture page
+
+    Args:
+        browser: Browser
+        url: Fixture page URL
+        iterations: Samples per primitive
+
+    Returns:
+        Dict mapping benchmark name to samples in ms
+    """
+    context = browser.new_context(**CONTEXT_ARGS)
+    base_page = BasePage(context.new_page(), timeout=5000)
+    base_page.navigate(url)
+
+    cases = {
+        "navigate": lambda: base_page.navigate(url),
+        "get_title": base_page.get_title,
+        "click": lambda: base_page.click("#heading"),
+        "fill": lambda: base_page.fill("#name", "benchmark"),
+        "type_text": lambda: base_page.type_text("#name", "abc", delay=0),
+        "clear": lambda: base_page.clear("#name"),
+        "get_text": lambda: base_page.get_text("#heading"),
+        "get_attribute": lambda: base_page.get_attribute("#first-link", "href"),
+        "is_visible": lambda: base_page.is_visible("#heading"),
+        "is_enabled": lambda: base_page.is_enabled("#submit"),
+        "wait_for_element": lambda: base_page.wait_for_element("#heading"),
+        "select_option": lambda: base_page.select_option("#choice", "two"),
+        "check": lambda: base_page.check("#agree"),
+        "uncheck": lambda: base_page.uncheck("#agree"),
+        "hover": lambda: base_page.hover("#submit"),
+        "get_element_count": lambda: base_page.get_element_count(".item"),
+        "query_many": lambda: base_page.query_many(QUERY_LOCATORS),
+        "are_visible": lambda: base_page.are_visible(QUERY_LOCATORS),
+        "press_key": lambda: base_page.press_key("Shift"),
+        "execute_javascript": lambda: base_page.execute_javascript("() => document.title"),
+        "snapshot": lambda: base_page.snapshot(QUERY_LOCATORS),
+    }
+    samples = {f"base_page.{name}": measure(case, iterations) for name, case in cases.items()}
+
+    # Reads answered from a fresh DOM snapshot (captured by the last case)
+    samples["base_page.get_text.snapshot_hit"] = measure(lambda: base_page.get_text("#heading"), iterations)
+    samples["base_page.is_visible.snapshot_hit"] = measure(lambda: base_page.is_visible("#heading"), iterations)
+
+    context.close()
+    return samples
+
+
+def bench_browser(browser: Browser, url: str, iterations: int) -> dict:
+    """
+    Time context/page creation and navigation with each trace level
+
+    Args:
+        browser: Browser
+        url: Fixture page URL
+        iterations: Samples per benchmark
+
+    Returns:
+        Dict mapping benchmark name to samples in ms
+    """
+    samples = {"browser.new_context": measure(lambda: browser.new_context(**CONTEXT_ARGS).close(), iterations)}
+
+    context = browser.new_context(**CONTEXT_ARGS)
+    samples["context.new_page"] = measure(lambda: context.new_page().close(), iterations)
+    page = context.new_page()
+    samples["tracing.off"] = measure(lambda: page.goto(url, wait_until="domcontentloaded"), iterations)
+    context.close()
+
+    for level in TRACE_LEVELS:
+        context = browser.new_context(**CONTEXT_ARGS)
+        page = context.new_page()
+        recorder = TraceRecorder(context, level)
+
+        def traced_navigation(page=page, recorder=recorder):
+            recorder.start_chunk("benchmark")
+            page.goto(url, wait_until="domcontentloaded")
+            recorder.stop_chunk()
+
+        samples[f"tracing.{level}"] = measure(traced_navigation, iterations)
+        context.close()
+    return samples
+
+
+def bench_test_data(iterations: int) -> dict:
+    """
+    Time test data generation
+
+    Args:
+        iterations: Samples per benchmark
+
+    Returns:
+        Dict mapping benchmark name to samples in ms
+    """
+    return {
+        "test_data.contact_form_valid": measure(ContactFormData.get_valid_data, iterations),
+        "test_data.random_user": measure(UserData.get_random_user, iterations),
+        "test_data.multiple_users_5": measure(lambda: UserData.get_multiple_users(5), iterations),
+    }
+
+
+def bench_fixtures(browser_name: str, iterations: int) -> dict:
+    """
+    Time the framework fixtures by running fixture_scenarios.py in a pytest subprocess
+
+    Args:
+        browser_name: Browser for pytest-playwright
+        iterations: Samples per scenario (two more are run and dropped)
+
+    Returns:
+        Dict mapping benchmark name to samples in ms
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        output = Path(temp_dir) / "fixtures.json"
+        command = [
+            sys.executable, "-m", "pytest", str(BENCHMARKS_DIR / "fixture_scenarios.py"),
+            "-p", "tests.conftest",
+            "-p", "benchmarks.fixture_timer",
+            f"--benchmark-fixture-output={output}",
+            f"--browser={browser_name}",
+            "-o", "addopts=", "-o", "log_cli=false", "-q", "-p", "no:cacheprovider",
+        ]
+        env = dict(os.environ, BENCHMARK_ITERATIONS=str(iterations + 2))
+        subprocess.run(command, env=env, check=False)
+        if not output.exists():
+            raise RuntimeError("Fixture benchmark run did not produce results")
+        collected = json.loads(output.read_text(encoding="utf-8"))
+
+    if collected["failures"]:
+        print(f"Fixture scenarios failed and were left out: {', '.join(collected['failures'])}")
+    return {f"fixture.{scenario}": values for scenario, values in collected["samples"].items()}
+
+
+def run(groups: tuple, iterations: int, browser_name: str) -> dict:
+    """
+    Run the selected benchmark groups
+
+    Args:
+        groups: Group names (see GROUPS)
+        iterations: Samples per benchmark
+        browser_name: chromium, firefox or webkit
+
+    Returns:
+        Dictionary with 'meta' and 'results' (name -> summary)
+    """
+    samples = {}
+    if "test_data" in groups:
+        samples.update(bench_test_data(iterations))
+
+    if "primitives" in groups or "browser" in groups:
+        server = StubServer(pages={"/bench": FIXTURE_PAGE.read_bytes()}).start()
+        url = server.url_for("/bench")
+        try:
+            with sync_playwright() as playwright:
+                browser = getattr(playwright, browser_name).launch(headless=True)
+                if "primitives" in groups:
+                    samples.update(bench_primitives(browser, url, iterations))
+                if "browser" in groups:
+                    samples.update(bench_browser(browser, url, iterations))
+                browser.close()
+        finally:
+            server.stop()
+
+    if "fixtures" in groups:
+        samples.update(bench_fixtures(browser_name, iterations))
+
+    return {
+        "meta": {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "browser": browser_name,
+            "iterations": iterations,
+            "groups": list(groups),
+        },
+        "results": {name: summarize(values) for name, values in sorted(samples.items()) if values},
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Framework overhead benchmarks")
+    parser.add_argument("--groups", default=",".join(GROUPS), help=f"Comma-separated subset of {', '.join(GROUPS)}")
+    parser.add_argument("--iterations", type=int, default=50, help="Samples per benchmark")
+    parser.add_argument("--browser", default="chromium", choices=("chromium", "firefox", "webkit"))
+    parser.add_argument("--output", default=None, help="Results file (default: reports/benchmarks/<timestamp>.json)")
+    parser.add_argument("--save-baseline", action="store_true", help=f"Also write the results to {BASELINE_FILE}")
+    args = parser.parse_args(argv)
+
+    groups = tuple(group.strip() for group in args.groups.split(",") if group.strip())
+    unknown = set(groups) - set(GROUPS)
+    if unknown:
+        parser.error(f"Unknown groups: {', '.join(sorted(unknown))}")
+
+    results = run(groups, args.iterations, args.browser)
+    output = args.output or RESULTS_DIR / f"benchmark_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    print(f"Results written to {save_results(results, output)}")
+    save_results(results, RESULTS_DIR / "latest.json")
+    if args.save_baseline:
+        print(f"Baseline written to {save_results(results, BASELINE_FILE)}")
+
+    for name, summary in results["results"].items():
+        print(f"{name:<44} p50 {summary['p50_ms']:>9.3f} ms   p95 {summary['p95_ms']:>9.3f} ms   "
+              f"p99 {summary['p99_ms']:>9.3f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+"""
+Benchmark Statistics
+Timing loops, percentiles and result files
+"""
+import json
+import math
+import time
+from pathlib import Path
+from typing import Callable
+
+
+def percentile(values: list[float], q: float) -> float:
+    """
+    Get a percentile with linear interpolation
+
+    Args:
+        values: Samples
+        q: Percentile between 0 and 100
+
+    Returns:
+        Percentile value
+    """
+    ordered = sorted(values)
+    if not ordered:
+        return math.nan
+    position = (len(ordered) - 1) * q / 100
+    lower = math.floor(position)
+    upper = math.ceil(position)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def summarize(samples_ms: list[float]) -> dict:
+    """
+    Summarize timing samples
+
+    Args:
+        samples_ms: Samples in milliseconds
+
+    Returns:
+        Dictionary with n, mean, min, max, p50, p95 and p99 in milliseconds
+    """
+    return {
+        "n": len(samples_ms),
+        "mean_ms": round(sum(samples_ms) / len(samples_ms), 4) if samples_ms else math.nan,
+        "min_ms": round(min(samples_ms), 4) if samples_ms else math.nan,
+        "max_ms": round(max(samples_ms), 4) if samples_ms else math.nan,
+        "p50_ms": round(percentile(samples_ms, 50), 4),
+        "p95_ms": round(percentile(samples_ms, 95), 4),
+        "p99_ms": round(percentile(samples_ms, 99), 4),
+    }
+
+
+def measure(function: Callable[[], object], iterations: int, warmup: int = 3) -> list[float]:
+    """
+    Time repeated calls of a function
+
+    Args:
+        function: Function to call
+        iterations: Timed calls
+        warmup: Untimed calls made first
+
+    Returns:
+        Samples in milliseconds
+    """
+    for _ in range(warmup):
+        function()
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        function()
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+def save_results(results: dict, path: str | Path) -> Path:
+    """
+    Write benchmark results as JSON
+
+    Args:
+        results: Dictionary with 'meta' and 'results'
+        path: Destination file
+
+    Returns:
+        Path written
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(results, indent=2, sort_keys=True), encoding="utf-8")
+    return path
+
+
+def load_results(path: str | Path) -> dict:
+    """
+    Read benchmark results written by save_results
+
+    Args:
+        path: Results file
+
+    Returns:
+        Dictionary with 'meta' and 'results'
+    """
+    return json.loads(Path(path).read_text(encoding="utf-8"))
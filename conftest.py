@@ -0,0 +1,8 @@
+"""
+Root Pytest Configuration
+Loaded before tests/conftest.py, so framework startup is measured (and imports are timed with
+--startup-profile) from the first framework import on
+"""
+from utils.startup_profile import install_import_profiler
+
+install_import_profiler()
@@ -0,0 +1,76 @@
+"""
+Async Page Object Model for Ultimate QA Automation Page
+"""
+from pages.async_base_page import AsyncBasePage
+from pages.automation_page import AutomationPageLocators
+
+
+class AsyncAutomationPage(AutomationPageLocators, AsyncBasePage):
+    """Async Page Object for Ultimate QA Automation Practice page"""
+
+    async def navigate(self, url=None):
+        """Navigate to the automation page"""
+        target_url = url if url is not None else self.PAGE_URL
+        await super().navigate(target_url)
+        await self.verify_page_loaded()
+
+    async def verify_page_loaded(self):
+        """Verify the page has loaded successfully"""
+        await self.wait_for_element(self.PAGE_TITLE, state="visible")
+        return await self.is_visible(self.PAGE_TITLE)
+
+    # Navigation Actions
+    async def click_big_page_link(self):
+        """Click the Big Page link"""
+        await self.click(self.BIG_PAGE_LINK)
+
+    async def click_fake_landing_page_link(self):
+        """Click the Fake Landing Page link"""
+        await self.click(self.FAKE_LANDING_PAGE_LINK)
+
+    async def click_fake_pricing_page_link(self):
+        """Click the Fake Pricing Page link"""
+        await self.click(self.FAKE_PRICING_PAGE_LINK)
+
+    # Visibility Checks
+    async def is_big_page_link_visible(self):
+        """Check if Big Page link is visible"""
+        return await self.is_visible(self.BIG_PAGE_LINK)
+
+    async def is_fake_landing_page_link_visible(self):
+        """Check if Fake Landing Page link is visible"""
+        return await self.is_visible(self.FAKE_LANDING_PAGE_LINK)
+
+    async def is_twitter_icon_visible(self):
+        """Check if Twitter icon is visible"""
+        return await self.is_visible(self.TWITTER_ICON)
+
+    async def is_facebook_icon_visible(self):
+        """Check if Facebook icon is visible"""
+        return await self.is_visible(self.FACEBOOK_ICON)
+
+    async def is_linkedin_icon_visible(self):
+        """Check if LinkedIn icon is visible"""
+        return await self.is_visible(self.LINKEDIN_ICON)
+
+    async def has_navigation_links(self):
+        """Check if navigation links are present"""
+        results = await self.are_visible([
+            self.BIG_PAGE_LINK,
+            self.FAKE_LANDING_PAGE_LINK,
+            self.FAKE_PRICING_PAGE_LINK,
+        ])
+        return all(results.values())
+
+    async def has_social_media_icons(self):
+        """Check if social media icons are present"""
+        results = await self.are_visible([
+            self.LINKEDIN_ICON,
+            self.TWITTER_ICON,
+            self.FACEBOOK_ICON,
+        ])
+        return any(results.values())
+
+    async def get_page_heading_text(self):
+        """Get the main page heading text"""
+        return await self.get_text(self.PAGE_HEADING)
@@ -0,0 +1,511 @@
+"""
+Async Base Page Object Model
+Async counterpart of BasePage built on playwright.async_api
+"""
+from typing import Optional, List
+from playwright.async_api import Page, Locator, expect, Error
+from pages.base_page import EMPTY_QUERY_RESULT, QUERY_MANY_SCRIPT, SUMMARIZE_SCRIPT
+from pages.selectors import to_css_query, validate_selector_constants
+from utils.logger import get_logger
+
+
+class AsyncBasePage:
+    """Async Base Page Object with the same methods as BasePage"""
+
+    def __init__(self, page: Page, timeout: int = 30000):
+        """
+        Initialize async base page
+
+        Args:
+            page: Playwright async Page object
+            timeout: Default timeout in milliseconds
+        """
+        self.page = page
+        self.timeout = timeout
+        self.logger = get_logger(self.__class__.__name__)
+        # Selector -> Locator for this page (locators are lazy, so they stay valid across navigations)
+        self._locators: dict[str, Locator] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        """Fail at import time if a page object declares a malformed or whole-DOM-scanning selector"""
+        super().__init_subclass__(**kwargs)
+        validate_selector_constants(cls)
+
+    def _get_element(self, locator: str | Locator) -> Locator:
+        """
+        Get element locator
+
+        Args:
+            locator: Element locator (string or Locator object)
+
+        Returns:
+            Locator object (cached per selector)
+        """
+        if isinstance(locator, str):
+            element = self._locators.get(locator)
+            if element is None:
+                element = self._locators[locator] = self.page.locator(locator)
+            return element
+        return locator
+
+    async def navigate(self, url: str) -> None:
+        """
+        Navigate to a specific URL
+
+        Args:
+            url: URL to navigate to
+        """
+        self.logger.info("Navigating to: %s", url)
+        await self.page.goto(url, timeout=self.timeout, wait_until="domcontentloaded")
+
+    async def get_title(self) -> str:
+        """
+        Get page title
+
+        Returns:
+            Page title as string
+        """
+        title = await self.page.title()
+        self.logger.debug("Page title: %s", title)
+        return title
+
+    def get_url(self) -> str:
+        """
+        Get current page URL
+
+        Returns:
+            Current URL as string
+        """
+        url = self.page.url
+        self.logger.debug("Current URL: %s", url)
+        return url
+
+    async def click(self, locator: str | Locator, timeout: Optional[int] = None) -> None:
+        """
+        Click on an element
+
+        Args:
+            locator: Element locator (string or Locator object)
+            timeout: Custom timeout in milliseconds
+        """
+        timeout = timeout or self.timeout
+        element = self._get_element(locator)
+        self.logger.info("Clicking element: %s", locator)
+        await element.click(timeout=timeout)
+
+    async def double_click(self, locator: str | Locator) -> None:
+        """
+        Double click on an element
+
+        Args:
+            locator: Element locator
+        """
+        element = self._get_element(locator)
+        self.logger.info("Double clicking element: %s", locator)
+        await element.dblclick()
+
+    async def fill(self, locator: str | Locator, text: str, timeout: Optional[int] = None) -> None:
+        """
+        Fill text in an input field
+
+        Args:
+            locator: Element locator
+            text: Text to fill
+            timeout: Custom timeout in milliseconds
+        """
+        timeout = timeout or self.timeout
+        element = self._get_element(locator)
+        self.logger.info("Filling text '%s' in element: %s", text, locator)
+        await element.fill(text, timeout=timeout)
+
+    async def type_text(self, locator: str | Locator, text: str, delay: int = 50) -> None:
+        """
+        Type text character by character
+
+        Args:
+            locator: Element locator
+            text: Text to type
+            delay: Delay between keystrokes in milliseconds
+        """
+        element = self._get_element(locator)
+        self.logger.info("Typing text '%s' in element: %s", text, locator)
+        await element.type(text, delay=delay)
+
+    async def clear(self, locator: str | Locator) -> None:
+        """
+        Clear input field
+
+        Args:
+            locator: Element locator
+        """
+        element = self._get_element(locator)
+        await element.clear()
+
+    async def get_text(self, locator: str | Locator, timeout: Optional[int] = None) -> str:
+        """
+        Get text content of an element
+
+        Args:
+            locator: Element locator
+            timeout: Custom timeout in milliseconds
+
+        Returns:
+            Text content of the element
+        """
+        timeout = timeout or self.timeout
+        element = self._get_element(locator)
+        text = await element.text_content(timeout=timeout)
+        self.logger.debug("Text from element %s: %s", locator, text)
+        return text.strip() if text else ""
+
+    async def get_attribute(self, locator: str | Locator, attribute: str) -> str | None:
+        """
+        Get attribute value of an element
+
+        Args:
+            locator: Element locator
+            attribute: Attribute name
+
+        Returns:
+            Attribute value or None
+        """
+        element = self._get_element(locator)
+        value = await element.get_attribute(attribute)
+        self.logger.debug("Attribute '%s' from element %s: %s", attribute, locator, value)
+        return value
+
+    async def is_visible(self, locator: str | Locator, timeout: Optional[int] = None) -> bool:
+        """
+        Check if element is visible
+
+        Args:
+            locator: Element locator
+            timeout: Custom timeout in milliseconds
+
+        Returns:
+            True if visible, False otherwise
+        """
+        timeout = timeout or self.timeout
+        try:
+            element = self._get_element(locator)
+            result = await element.is_visible(timeout=timeout)
+            self.logger.debug("Element %s visible: %s", locator, result)
+            return result
+        except (TimeoutError, Error):
+            return False
+
+    async def is_enabled(self, locator: str | Locator) -> bool:
+        """
+        Check if element is enabled
+
+        Args:
+            locator: Element locator
+
+        Returns:
+            True if enabled, False otherwise
+        """
+        element = self._get_element(locator)
+        result = await element.is_enabled()
+        self.logger.debug("Element %s enabled: %s", locator, result)
+        return result
+
+    async def wait_for_element(
+        self,
+        locator: str | Locator,
+        state: str = "visible",
+        timeout: Optional[int] = None
+    ) -> None:
+        """
+        Wait for element to be in a specific state
+
+        Args:
+            locator: Element locator
+            state: State to wait for ('attached', 'detached', 'visible', 'hidden')
+            timeout: Custom timeout in milliseconds
+        """
+        timeout = timeout or self.timeout
+        element = self._get_element(locator)
+        self.logger.info("Waiting for element %s to be %s", locator, state)
+        await element.wait_for(state=state, timeout=timeout)
+
+    async def wait_for_url(self, url_pattern: str, timeout: Optional[int] = None) -> None:
+        """
+        Wait for URL to match pattern
+
+        Args:
+            url_pattern: URL pattern to match
+            timeout: Custom timeout in milliseconds
+        """
+        timeout = timeout or self.timeout
+        self.logger.info("Waiting for URL to match: %s", url_pattern)
+        await self.page.wait_for_url(url_pattern, timeout=timeout)
+
+    async def wait_for_url_change(self, from_url: str, timeout: Optional[int] = None) -> str:
+        """
+        Wait until the page has navigated away from a URL
+
+        Args:
+            from_url: URL before the action that navigates
+            timeout: Custom timeout in milliseconds
+
+        Returns:
+            The new URL
+        """
+        timeout = timeout or self.timeout
+        self.logger.info("Waiting for navigation away from: %s", from_url)
+        await self.page.wait_for_url(lambda url: url != from_url, wait_until="commit", timeout=timeout)
+        return self.page.url
+
+    async def wait_for_function(self, expression: str, arg=None, timeout: Optional[int] = None):
+        """
+        Wait for a JavaScript predicate to become truthy in the page
+
+        Args:
+            expression: JavaScript function
+            arg: Argument passed to the function
+            timeout: Custom timeout in milliseconds
+
+        Returns:
+            The value returned by the predicate
+        """
+        timeout = timeout or self.timeout
+        self.logger.info("Waiting for page condition: %s", expression)
+        handle = await self.page.wait_for_function(expression, arg=arg, timeout=timeout)
+        return await handle.json_value()
+
+    async def select_option(self, locator: str | Locator, value: str) -> None:
+        """
+        Select option from dropdown
+
+        Args:
+            locator: Element locator
+            value: Value to select
+        """
+        element = self._get_element(locator)
+        self.logger.info("Selecting option '%s' from dropdown: %s", value, locator)
+        await element.select_option(value)
+
+    async def check(self, locator: str | Locator) -> None:
+        """
+        Check a checkbox or radio button
+
+        Args:
+            locator: Element locator
+        """
+        element = self._get_element(locator)
+        self.logger.info("Checking element: %s", locator)
+        await element.check()
+
+    async def uncheck(self, locator: str | Locator) -> None:
+        """
+        Uncheck a checkbox
+
+        Args:
+            locator: Element locator
+        """
+        element = self._get_element(locator)
+        self.logger.info("Unchecking element: %s", locator)
+        await element.uncheck()
+
+    async def hover(self, locator: str | Locator) -> None:
+        """
+        Hover over an element
+
+        Args:
+            locator: Element locator
+        """
+        element = self._get_element(locator)
+        self.logger.info("Hovering over element: %s", locator)
+        await element.hover()
+
+    async def scroll_to(self, locator: str | Locator) -> None:
+        """
+        Scroll to element
+
+        Args:
+            locator: Element locator
+        """
+        element = self._get_element(locator)
+        self.logger.info("Scrolling to element: %s", locator)
+        await element.scroll_into_view_if_needed()
+
+    async def get_all_elements(self, locator: str) -> List[Locator]:
+        """
+        Get all elements matching locator
+
+        Args:
+            locator: Element locator
+
+        Returns:
+            List of Locator objects
+        """
+        elements = await self._get_element(locator).all()
+        self.logger.debug("Found %d elements for locator: %s", len(elements), locator)
+        return elements
+
+    async def get_element_count(self, locator: str) -> int:
+        """
+        Get count of elements matching locator
+
+        Args:
+            locator: Element locator
+
+        Returns:
+            Number of matching elements
+        """
+        count = await self._get_element(locator).count()
+        self.logger.debug("Element count for %s: %d", locator, count)
+        return count
+
+    async def query_many(
+        self,
+        locators: List[str | Locator],
+        attributes: Optional[List[str]] = None
+    ) -> dict:
+        """
+        Query several elements in a single browser round trip (see BasePage.query_many)
+
+        Args:
+            locators: Element locators
+            attributes: Attribute names to read from the first match of each locator
+
+        Returns:
+            Dict mapping each locator to {'count', 'visible', 'text', 'attributes'}
+        """
+        attributes = attributes or []
+        results = {}
+        batched = {}
+        for locator in locators:
+            query = to_css_query(locator) if isinstance(locator, str) else None
+            if query is None:
+                results[locator] = await self._query_one(locator, attributes)
+            else:
+                batched[locator] = query
+
+        if batched:
+            try:
+                summaries = await self.page.evaluate(QUERY_MANY_SCRIPT, [list(batched.values()), attributes])
+            except Error as e:
+                self.logger.debug("Batched query failed: %s", e)
+                summaries = [EMPTY_QUERY_RESULT] * len(batched)
+            for locator, summary in zip(batched, summaries):
+                results[locator] = summary if summary is not None else await self._query_one(locator, attributes)
+
+        self.logger.debug("Queried %d locators (%d batched)", len(locators), len(batched))
+        return {locator: results[locator] for locator in locators}
+
+    async def _query_one(self, locator: str | Locator, attributes: List[str]) -> dict:
+        """Summarize the matches of a single locator"""
+        try:
+            return await self._get_element(locator).evaluate_all(SUMMARIZE_SCRIPT, attributes)
+        except Error as e:
+            self.logger.debug("Query for %s failed: %s", locator, e)
+            return dict(EMPTY_QUERY_RESULT)
+
+    async def are_visible(self, locators: List[str | Locator]) -> dict:
+        """
+        Check visibility of several elements in a single browser round trip
+
+        Args:
+            locators: Element locators
+
+        Returns:
+            Dict mapping each locator to True if any of its matches is visible
+        """
+        results = await self.query_many(locators)
+        return {locator: result["visible"] for locator, result in results.items()}
+
+    async def press_key(self, key: str) -> None:
+        """
+        Press a keyboard key
+
+        Args:
+            key: Key to press (e.g., 'Enter', 'Escape', 'Tab')
+        """
+        self.logger.info("Pressing key: %s", key)
+        await self.page.keyboard.press(key)
+
+    async def take_screenshot(self, path: str, full_page: bool = False) -> None:
+        """
+        Take a screenshot
+
+        Args:
+            path: Path to save screenshot
+            full_page: Whether to capture full page
+        """
+        self.logger.info("Taking screenshot: %s", path)
+        await self.page.screenshot(path=path, full_page=full_page)
+
+    def switch_to_frame(self, frame_locator: str) -> None:
+        """
+        Switch to iframe
+
+        Args:
+            frame_locator: Frame locator
+        """
+        self.logger.info("Switching to frame: %s", frame_locator)
+        self.page.frame_locator(frame_locator)
+
+    async def execute_javascript(self, script: str, *args) -> any:
+        """
+        Execute JavaScript code
+
+        Args:
+            script: JavaScript code to execute
+            *args: Arguments to pass to the script
+
+        Returns:
+            Result of JavaScript execution
+        """
+        self.logger.info("Executing JavaScript: %s", script)
+        return await self.page.evaluate(script, *args)
+
+    async def reload(self) -> None:
+        """Reload the current page"""
+        self.logger.info("Reloading page")
+        await self.page.reload()
+
+    async def go_back(self) -> None:
+        """Navigate back in browser history"""
+        self.logger.info("Navigating back")
+        await self.page.go_back()
+
+    async def go_forward(self) -> None:
+        """Navigate forward in browser history"""
+        self.logger.info("Navigating forward")
+        await self.page.go_forward()
+
+    # Assertion Methods
+    async def assert_element_visible(self, locator: str | Locator) -> None:
+        """Assert element is visible"""
+        element = self._get_element(locator)
+        await expect(element).to_be_visible(timeout=self.timeout)
+        self.logger.info("Assertion passed: Element %s is visible", locator)
+
+    async def assert_element_hidden(self, locator: str | Locator) -> None:
+        """Assert element is hidden"""
+        element = self._get_element(locator)
+        await expect(element).to_be_hidden(timeout=self.timeout)
+        self.logger.info("Assertion passed: Element %s is hidden", locator)
+
+    async def assert_text_equals(self, locator: str | Locator, expected_text: str) -> None:
+        """Assert element text equals expected text"""
+        element = self._get_element(locator)
+        await expect(element).to_have_text(expected_text, timeout=self.timeout)
+        self.logger.info("Assertion passed: Text equals '%s'", expected_text)
+
+    async def assert_text_contains(self, locator: str | Locator, expected_text: str) -> None:
+        """Assert element text contains expected text"""
+        element = self._get_element(locator)
+        await expect(element).to_contain_text(expected_text, timeout=self.timeout)
+        self.logger.info("Assertion passed: Text contains '%s'", expected_text)
+
+    async def assert_url_contains(self, expected_url: str) -> None:
+        """Assert URL contains expected string"""
+        await expect(self.page).to_have_url(f"**{expected_url}**", timeout=self.timeout)
+        self.logger.info("Assertion passed: URL contains '%s'", expected_url)
+
+    async def assert_title_contains(self, expected_title: str) -> None:
+        """Assert page title contains expected string"""
+        await expect(self.page).to_have_title(f"**{expected_title}**", timeout=self.timeout)
+        self.logger.info("Assertion passed: Title contains '%s'", expected_title)
@@ -1,11 +1,23 @@
 ﻿"""
 Page Object Model for Ultimate QA Automation Page
 """
+import time
+from urllib.parse import urljoin
+
+from playwright.sync_api import Error
+
 from pages.base_page import BasePage
+from utils.action_timing import timed_action
 
+# Navigation Timing of the current document, in ms since its navigation started
+NAVIGATION_TIMING_SCRIPT = """() => {
+    const entry = performance.getEntriesByType("navigation")[0];
+    return entry ? entry.domContentLoadedEventEnd : null;
+}"""
 
-class AutomationPage(BasePage):
-    """Page Object for Ultimate QA Automation Practice page"""
+
+class AutomationPageLocators:
+    """Locators for the Ultimate QA Automation Practice page (shared by sync and async page objects)"""
 
     # Page URL
     PAGE_URL = "https://ultimateqa.com/automation"
@@ -14,13 +26,13 @@ class AutomationPage(BasePage):
     PAGE_TITLE = "h1"
     PAGE_HEADING = "h1:has-text('Automation Practice')"
 
-    # Navigation Links (main content)
-    BIG_PAGE_LINK = "a:has-text('Big page with many elements')"
-    FAKE_LANDING_PAGE_LINK = "a:has-text('Fake Landing Page')"
-    FAKE_PRICING_PAGE_LINK = "a:has-text('Fake Pricing Page')"
-    FILL_FORMS_LINK = "a:has-text('Fill out forms')"
-    LOGIN_AUTOMATION_LINK = "a:has-text('Login automation')"
-    SIMPLE_ELEMENTS_LINK = "a:has-text('Interactions with simple elements')"
+    # Navigation Links (main content) - matched by href, an attribute lookup instead of a text scan
+    BIG_PAGE_LINK = "a[href$='/complicated-page']"
+    FAKE_LANDING_PAGE_LINK = "a[href$='/fake-landing-page']"
+    FAKE_PRICING_PAGE_LINK = "a[href$='/fake-pricing-page']"
+    FILL_FORMS_LINK = "a[href$='/filling-out-forms/']"
+    LOGIN_AUTOMATION_LINK = "a[href$='/users/sign_in']"
+    SIMPLE_ELEMENTS_LINK = "a[href$='/simple-html-elements-for-automation/']"
 
     # Social Media Icons
     LINKEDIN_ICON = "a[href*='linkedin']"
@@ -36,6 +48,10 @@ class AutomationPage(BasePage):
     NEWSLETTER_LINK = "a:has-text('Newsletter')"
     EDUCATION_LINK = "a:has-text('Education')"
 
+
+class AutomationPage(AutomationPageLocators, BasePage):
+    """Page Object for Ultimate QA Automation Practice page"""
+
     def navigate(self, url=None):
         """Navigate to the automation page"""
         target_url = url if url is not None else self.PAGE_URL
@@ -83,20 +99,80 @@ class AutomationPage(BasePage):
 
     def has_navigation_links(self):
         """Check if navigation links are present"""
-        return (
-            self.is_visible(self.BIG_PAGE_LINK) and
-            self.is_visible(self.FAKE_LANDING_PAGE_LINK) and
-            self.is_visible(self.FAKE_PRICING_PAGE_LINK)
-        )
+        return all(self.are_visible([
+            self.BIG_PAGE_LINK,
+            self.FAKE_LANDING_PAGE_LINK,
+            self.FAKE_PRICING_PAGE_LINK,
+        ]).values())
 
     def has_social_media_icons(self):
         """Check if social media icons are present"""
-        return (
-            self.is_visible(self.LINKEDIN_ICON) or
-            self.is_visible(self.TWITTER_ICON) or
-            self.is_visible(self.FACEBOOK_ICON)
-        )
+        return any(self.are_visible([
+            self.LINKEDIN_ICON,
+            self.TWITTER_ICON,
+            self.FACEBOOK_ICON,
+        ]).values())
 
     def get_page_heading_text(self):
         """Get the main page heading text"""
         return self.get_text(self.PAGE_HEADING)
+
+    # Multi-tab Checks
+    @timed_action("navigation")
+    def follow_links_concurrently(self, locators, timeout=None):
+        """
+        Open each link in its own tab of the current context and wait for all of them
+
+        All navigations are started before any is waited on, so the batch takes
+        roughly as long as the slowest link.
+
+        Args:
+            locators: Link locators
+            timeout: Custom timeout per link in milliseconds
+
+        Returns:
+            List of dicts (in locator order) with 'locator', 'url', 'status',
+            'elapsed_ms' (navigation start to DOMContentLoaded) and 'error'
+        """
+        timeout = timeout or self.timeout
+        links = self.query_many(locators, attributes=["href"])
+        self.logger.info("Following %d links concurrently", len(locators))
+        started = time.perf_counter()
+
+        tabs = []
+        for locator in locators:
+            result = {"locator": locator, "url": None, "status": None, "elapsed_ms": None, "error": None}
+            href = links[locator]["attributes"].get("href")
+            if not href:
+                result["error"] = "link not found"
+                tabs.append((result, None))
+                continue
+            tab = self.page.context.new_page()
+            tab.on(
+                "response",
+                lambda response, tab=tab, result=result: self._record_document_status(tab, response, result)
+            )
+            tab.evaluate("url => window.location.assign(url)", urljoin(self.page.url, href))
+            tabs.append((result, tab))
+
+        results = []
+        for result, tab in tabs:
+            if tab is not None:
+                try:
+                    tab.wait_for_url(lambda url: url != "about:blank", wait_until="domcontentloaded", timeout=timeout)
+                    result["url"] = tab.url
+                    result["elapsed_ms"] = tab.evaluate(NAVIGATION_TIMING_SCRIPT)
+                except Error as e:
+                    result["error"] = str(e)
+                finally:
+                    tab.close()
+            results.append(result)
+
+        self.logger.info("Followed %d links in %.0f ms", len(locators), (time.perf_counter() - started) * 1000)
+        return results
+
+    @staticmethod
+    def _record_document_status(tab, response, result):
+        """Record the status of a tab's main document response"""
+        if response.request.is_navigation_request() and response.frame == tab.main_frame:
+            result["status"] = response.status
@@ -4,7 +4,36 @@ Contains common methods used across all page objects
 """
 from typing import Optional, List
 from playwright.sync_api import Page, Locator, expect, Error
+from pages.dom_snapshot import DomSnapshot, capture_dom_snapshot, get_dom_snapshot, invalidate_dom_snapshot
+from pages.network_tracker import DEFAULT_IGNORE, NetworkTracker, get_network_tracker
+from pages.performance import budget_violations, collect_performance_metrics
+from pages.selectors import (
+    ELEMENT_HELPERS_SCRIPT, selector_constants, to_css_query, validate_selector_constants
+)
+from utils.action_timing import timed_action
+from utils.config_reader import config
 from utils.logger import get_logger
+from utils.shared_page import get_shared_page
+from utils.waits import wait_for_page_condition, wait_for_url_change
+
+# Resolves many CSS queries (with optional :has-text filters) in one evaluation;
+# queries the browser rejects come back as null
+QUERY_MANY_SCRIPT = """([queries, attributes]) => {""" + ELEMENT_HELPERS_SCRIPT + """
+    return queries.map(([css, text]) => {
+        try {
+            return summarize(matchQuery(css, text), attributes);
+        } catch (e) {
+            return null;
+        }
+    });
+}"""
+
+# Summarizes the elements of a single Locator (fallback for Playwright-only selectors)
+SUMMARIZE_SCRIPT = """(elements, attributes) => {""" + ELEMENT_HELPERS_SCRIPT + """
+    return summarize(elements, attributes);
+}"""
+
+EMPTY_QUERY_RESULT = {"count": 0, "visible": False, "text": "", "attributes": {}}
 
 
 class BasePage:
@@ -21,6 +50,18 @@ class BasePage:
         self.page = page
         self.timeout = timeout
         self.logger = get_logger(self.__class__.__name__)
+        # Selector -> Locator for this page (locators are lazy, so they stay valid across navigations)
+        self._locators: dict[str, Locator] = {}
+
+    @property
+    def network(self) -> NetworkTracker:
+        """Request tracker of the page, attached on first use (requests started before are not seen)"""
+        return get_network_tracker(self.page)
+
+    def __init_subclass__(cls, **kwargs):
+        """Fail at import time if a page object declares a malformed or whole-DOM-scanning selector"""
+        super().__init_subclass__(**kwargs)
+        validate_selector_constants(cls)
 
     def _get_element(self, locator: str | Locator) -> Locator:
         """
@@ -30,12 +71,23 @@ class BasePage:
             locator: Element locator (string or Locator object)
 
         Returns:
-            Locator object
+            Locator object (cached per selector)
         """
         if isinstance(locator, str):
-            return self.page.locator(locator)
+            element = self._locators.get(locator)
+            if element is None:
+                element = self._locators[locator] = self.page.locator(locator)
+            return element
         return locator
 
+    def _mark_dirty(self) -> None:
+        """Record that an action may have changed the page (stale snapshot, mutated shared page)"""
+        invalidate_dom_snapshot(self.page)
+        shared_page = get_shared_page(self.page)
+        if shared_page is not None:
+            shared_page.mark_dirty()
+
+    @timed_action("navigation")
     def navigate(self, url: str) -> None:
         """
         Navigate to a specific URL
@@ -43,9 +95,38 @@ class BasePage:
         Args:
             url: URL to navigate to
         """
+        shared_page = get_shared_page(self.page)
+        if shared_page is not None and shared_page.reuse_navigation(url):
+            self.logger.info("Reusing shared page already at: %s", url)
+            return
+
         self.logger.info("Navigating to: %s", url)
+        invalidate_dom_snapshot(self.page)
+        if config.navigation_quiet_ms > 0:
+            # Attached before the navigation so the document's subresources are counted
+            get_network_tracker(self.page)
         self.page.goto(url, timeout=self.timeout, wait_until="domcontentloaded")
+        if config.navigation_quiet_ms > 0:
+            self.wait_for_network_quiet(config.navigation_quiet_ms)
+        if shared_page is not None:
+            shared_page.navigated(url)
+        if config.performance_metrics:
+            self.collect_performance_metrics()
+
+    def collect_performance_metrics(self) -> dict | None:
+        """
+        Record navigation, paint and resource timing of the current document
+
+        Returns:
+            Metrics dict (see pages.performance), or None if the page could not be read
+        """
+        try:
+            return collect_performance_metrics(self.page)
+        except Error as e:
+            self.logger.debug("Performance metrics unavailable: %s", e)
+            return None
 
+    @timed_action("query")
     def get_title(self) -> str:
         """
         Get page title
@@ -68,6 +149,7 @@ class BasePage:
         self.logger.debug("Current URL: %s", url)
         return url
 
+    @timed_action("action", probe=True)
     def click(self, locator: str | Locator, timeout: Optional[int] = None) -> None:
         """
         Click on an element
@@ -79,8 +161,10 @@ class BasePage:
         timeout = timeout or self.timeout
         element = self._get_element(locator)
         self.logger.info("Clicking element: %s", locator)
+        self._mark_dirty()
         element.click(timeout=timeout)
 
+    @timed_action("action")
     def double_click(self, locator: str | Locator) -> None:
         """
         Double click on an element
@@ -90,8 +174,10 @@ class BasePage:
         """
         element = self._get_element(locator)
         self.logger.info("Double clicking element: %s", locator)
+        self._mark_dirty()
         element.dblclick()
 
+    @timed_action("action", probe=True)
     def fill(self, locator: str | Locator, text: str, timeout: Optional[int] = None) -> None:
         """
         Fill text in an input field
@@ -104,8 +190,10 @@ class BasePage:
         timeout = timeout or self.timeout
         element = self._get_element(locator)
         self.logger.info("Filling text '%s' in element: %s", text, locator)
+        self._mark_dirty()
         element.fill(text, timeout=timeout)
 
+    @timed_action("action")
     def type_text(self, locator: str | Locator, text: str, delay: int = 50) -> None:
         """
         Type text character by character
@@ -117,8 +205,10 @@ class BasePage:
         """
         element = self._get_element(locator)
         self.logger.info("Typing text '%s' in element: %s", text, locator)
+        self._mark_dirty()
         element.type(text, delay=delay)
 
+    @timed_action("action")
     def clear(self, locator: str | Locator) -> None:
         """
         Clear input field
@@ -127,8 +217,10 @@ class BasePage:
             locator: Element locator
         """
         element = self._get_element(locator)
+        self._mark_dirty()
         element.clear()
 
+    @timed_action("query", probe=True)
     def get_text(self, locator: str | Locator, timeout: Optional[int] = None) -> str:
         """
         Get text content of an element
@@ -140,12 +232,19 @@ class BasePage:
         Returns:
             Text content of the element
         """
+        entry = self._snapshot_entry(locator)
+        if entry and entry["count"]:
+            text = entry["elements"][0]["text"]
+            self.logger.debug("Text from element %s (snapshot): %s", locator, text)
+            return text.strip()
+
         timeout = timeout or self.timeout
         element = self._get_element(locator)
         text = element.text_content(timeout=timeout)
         self.logger.debug("Text from element %s: %s", locator, text)
         return text.strip() if text else ""
 
+    @timed_action("query")
     def get_attribute(self, locator: str | Locator, attribute: str) -> str | None:
         """
         Get attribute value of an element
@@ -157,11 +256,18 @@ class BasePage:
         Returns:
             Attribute value or None
         """
+        entry = self._snapshot_entry(locator)
+        if entry and entry["count"]:
+            value = entry["elements"][0]["attributes"].get(attribute)
+            self.logger.debug("Attribute '%s' from element %s (snapshot): %s", attribute, locator, value)
+            return value
+
         element = self._get_element(locator)
         value = element.get_attribute(attribute)
         self.logger.debug("Attribute '%s' from element %s: %s", attribute, locator, value)
         return value
 
+    @timed_action("query")
     def is_visible(self, locator: str | Locator, timeout: Optional[int] = None) -> bool:
         """
         Check if element is visible
@@ -173,6 +279,11 @@ class BasePage:
         Returns:
             True if visible, False otherwise
         """
+        entry = self._snapshot_entry(locator)
+        if entry is not None:
+            self.logger.debug("Element %s visible (snapshot): %s", locator, entry["visible"])
+            return entry["visible"]
+
         timeout = timeout or self.timeout
         try:
             element = self._get_element(locator)
@@ -182,6 +293,7 @@ class BasePage:
         except (TimeoutError, Error):
             return False
 
+    @timed_action("query")
     def is_enabled(self, locator: str | Locator) -> bool:
         """
         Check if element is enabled
@@ -197,6 +309,7 @@ class BasePage:
         self.logger.debug("Element %s enabled: %s", locator, result)
         return result
 
+    @timed_action("wait")
     def wait_for_element(
         self,
         locator: str | Locator,
@@ -216,6 +329,7 @@ class BasePage:
         self.logger.info("Waiting for element %s to be %s", locator, state)
         element.wait_for(state=state, timeout=timeout)
 
+    @timed_action("wait")
     def wait_for_url(self, url_pattern: str, timeout: Optional[int] = None) -> None:
         """
         Wait for URL to match pattern
@@ -228,6 +342,73 @@ class BasePage:
         self.logger.info("Waiting for URL to match: %s", url_pattern)
         self.page.wait_for_url(url_pattern, timeout=timeout)
 
+    @timed_action("wait")
+    def wait_for_network_quiet(
+        self,
+        idle_ms: int = 500,
+        ignore: tuple = DEFAULT_IGNORE,
+        allow_hosts: tuple = (),
+        third_party: bool = False,
+        timeout: Optional[int] = None
+    ) -> dict:
+        """
+        Wait until no first-party request has been in flight for idle_ms
+
+        The page's request tracker is attached on first use. Requests started
+        before that are not seen, so the first wait observes at least idle_ms
+        of quiet; touch self.network before an action to count its requests.
+
+        Args:
+            idle_ms: Quiet period in milliseconds
+            ignore: URL glob strings, compiled regexes or predicates to ignore
+            allow_hosts: Third-party domains whose requests still count
+            third_party: Count requests to every host
+            timeout: Custom timeout in milliseconds
+
+        Returns:
+            Dict with 'waited_ms', 'relevant' and 'ignored' request counts
+        """
+        timeout = timeout or self.timeout
+        self.logger.info("Waiting for %d ms of network quiet", idle_ms)
+        return self.network.wait_for_quiet(idle_ms, timeout, ignore, allow_hosts, third_party)
+
+    @timed_action("wait")
+    def wait_for_url_change(self, from_url: str, timeout: Optional[int] = None) -> str:
+        """
+        Wait until the page has navigated away from a URL
+
+        Returns as soon as the new document is committed (immediately if the
+        navigation already happened).
+
+        Args:
+            from_url: URL before the action that navigates (e.g. self.get_url() before a click)
+            timeout: Custom timeout in milliseconds
+
+        Returns:
+            The new URL
+        """
+        timeout = timeout or self.timeout
+        self.logger.info("Waiting for navigation away from: %s", from_url)
+        return wait_for_url_change(self.page, from_url, timeout)
+
+    @timed_action("wait")
+    def wait_for_function(self, expression: str, arg=None, timeout: Optional[int] = None):
+        """
+        Wait for a JavaScript predicate to become truthy in the page
+
+        Args:
+            expression: JavaScript function, e.g. "() => document.querySelectorAll('.row').length > 10"
+            arg: Argument passed to the function
+            timeout: Custom timeout in milliseconds
+
+        Returns:
+            The value returned by the predicate
+        """
+        timeout = timeout or self.timeout
+        self.logger.info("Waiting for page condition: %s", expression)
+        return wait_for_page_condition(self.page, expression, arg, timeout)
+
+    @timed_action("action")
     def select_option(self, locator: str | Locator, value: str) -> None:
         """
         Select option from dropdown
@@ -238,8 +419,10 @@ class BasePage:
         """
         element = self._get_element(locator)
         self.logger.info("Selecting option '%s' from dropdown: %s", value, locator)
+        self._mark_dirty()
         element.select_option(value)
 
+    @timed_action("action")
     def check(self, locator: str | Locator) -> None:
         """
         Check a checkbox or radio button
@@ -249,8 +432,10 @@ class BasePage:
         """
         element = self._get_element(locator)
         self.logger.info("Checking element: %s", locator)
+        self._mark_dirty()
         element.check()
 
+    @timed_action("action")
     def uncheck(self, locator: str | Locator) -> None:
         """
         Uncheck a checkbox
@@ -260,8 +445,10 @@ class BasePage:
         """
         element = self._get_element(locator)
         self.logger.info("Unchecking element: %s", locator)
+        self._mark_dirty()
         element.uncheck()
 
+    @timed_action("action")
     def hover(self, locator: str | Locator) -> None:
         """
         Hover over an element
@@ -273,6 +460,7 @@ class BasePage:
         self.logger.info("Hovering over element: %s", locator)
         element.hover()
 
+    @timed_action("action")
     def scroll_to(self, locator: str | Locator) -> None:
         """
         Scroll to element
@@ -284,6 +472,7 @@ class BasePage:
         self.logger.info("Scrolling to element: %s", locator)
         element.scroll_into_view_if_needed()
 
+    @timed_action("query")
     def get_all_elements(self, locator: str) -> List[Locator]:
         """
         Get all elements matching locator
@@ -294,10 +483,11 @@ class BasePage:
         Returns:
             List of Locator objects
         """
-        elements = self.page.locator(locator).all()
+        elements = self._get_element(locator).all()
         self.logger.debug("Found %d elements for locator: %s", len(elements), locator)
         return elements
 
+    @timed_action("query")
     def get_element_count(self, locator: str) -> int:
         """
         Get count of elements matching locator
@@ -308,10 +498,109 @@ class BasePage:
         Returns:
             Number of matching elements
         """
-        count = self.page.locator(locator).count()
+        entry = self._snapshot_entry(locator)
+        if entry is not None:
+            self.logger.debug("Element count for %s (snapshot): %d", locator, entry["count"])
+            return entry["count"]
+
+        count = self._get_element(locator).count()
         self.logger.debug("Element count for %s: %d", locator, count)
         return count
 
+    @timed_action("query")
+    def query_many(
+        self,
+        locators: List[str | Locator],
+        attributes: Optional[List[str]] = None
+    ) -> dict:
+        """
+        Query several elements in a single browser round trip
+
+        CSS selectors and "<css>:has-text('...')" selectors are resolved together
+        in one in-page evaluation; other Playwright selectors and Locator objects
+        fall back to one evaluation each.
+
+        Args:
+            locators: Element locators
+            attributes: Attribute names to read from the first match of each locator
+
+        Returns:
+            Dict mapping each locator to {'count', 'visible', 'text', 'attributes'},
+            where 'visible' is True if any match is visible and 'text'/'attributes'
+            come from the first match
+        """
+        attributes = attributes or []
+        results = {}
+        batched = {}
+        for locator in locators:
+            query = to_css_query(locator) if isinstance(locator, str) else None
+            if query is None:
+                results[locator] = self._query_one(locator, attributes)
+            else:
+                batched[locator] = query
+
+        if batched:
+            try:
+                summaries = self.page.evaluate(QUERY_MANY_SCRIPT, [list(batched.values()), attributes])
+            except Error as e:
+                self.logger.debug("Batched query failed: %s", e)
+                summaries = [EMPTY_QUERY_RESULT] * len(batched)
+            for locator, summary in zip(batched, summaries):
+                results[locator] = summary if summary is not None else self._query_one(locator, attributes)
+
+        self.logger.debug("Queried %d locators (%d batched)", len(locators), len(batched))
+        return {locator: results[locator] for locator in locators}
+
+    def _query_one(self, locator: str | Locator, attributes: List[str]) -> dict:
+        """Summarize the matches of a single locator"""
+        try:
+            return self._get_element(locator).evaluate_all(SUMMARIZE_SCRIPT, attributes)
+        except Error as e:
+            self.logger.debug("Query for %s failed: %s", locator, e)
+            return dict(EMPTY_QUERY_RESULT)
+
+    @timed_action("query")
+    def are_visible(self, locators: List[str | Locator]) -> dict:
+        """
+        Check visibility of several elements in a single browser round trip
+
+        Args:
+            locators: Element locators
+
+        Returns:
+            Dict mapping each locator to True if any of its matches is visible
+        """
+        return {locator: result["visible"] for locator, result in self.query_many(locators).items()}
+
+    @timed_action("query")
+    def snapshot(self, locators: Optional[List[str]] = None) -> DomSnapshot:
+        """
+        Capture the page's elements into a Python-side index in one round trip
+
+        While the snapshot is fresh, get_text, get_attribute, is_visible and
+        get_element_count answer captured locators without calling the browser.
+        Navigations and BasePage actions mark it stale directly. DOM changes
+        made by page scripts are reported by an injected MutationObserver and
+        take effect at the next browser call; call DomSnapshot.is_fresh() once
+        before reads that must see such changes.
+
+        Args:
+            locators: Selectors to capture (defaults to the page object's selector constants)
+
+        Returns:
+            DomSnapshot
+        """
+        if locators is None:
+            locators = list(selector_constants(type(self)).values())
+        self.logger.info("Capturing DOM snapshot of %d locators", len(locators))
+        return capture_dom_snapshot(self.page, locators)
+
+    def _snapshot_entry(self, locator: str | Locator) -> dict | None:
+        """Get the fresh snapshot entry for a locator, if any"""
+        snapshot = get_dom_snapshot(self.page)
+        return snapshot.lookup(locator) if snapshot is not None else None
+
+    @timed_action("action")
     def press_key(self, key: str) -> None:
         """
         Press a keyboard key
@@ -320,8 +609,10 @@ class BasePage:
             key: Key to press (e.g., 'Enter', 'Escape', 'Tab')
         """
         self.logger.info("Pressing key: %s", key)
+        self._mark_dirty()
         self.page.keyboard.press(key)
 
+    @timed_action("action")
     def take_screenshot(self, path: str, full_page: bool = False) -> None:
         """
         Take a screenshot
@@ -343,6 +634,7 @@ class BasePage:
         self.logger.info("Switching to frame: %s", frame_locator)
         self.page.frame_locator(frame_locator)
 
+    @timed_action("action")
     def execute_javascript(self, script: str, *args) -> any:
         """
         Execute JavaScript code
@@ -355,54 +647,112 @@ class BasePage:
             Result of JavaScript execution
         """
         self.logger.info("Executing JavaScript: %s", script)
+        self._mark_dirty()
         return self.page.evaluate(script, *args)
 
+    @timed_action("navigation")
     def reload(self) -> None:
         """Reload the current page"""
         self.logger.info("Reloading page")
+        self._mark_dirty()
         self.page.reload()
 
+    @timed_action("navigation")
     def go_back(self) -> None:
         """Navigate back in browser history"""
         self.logger.info("Navigating back")
+        self._mark_dirty()
         self.page.go_back()
 
+    @timed_action("navigation")
     def go_forward(self) -> None:
         """Navigate forward in browser history"""
         self.logger.info("Navigating forward")
+        self._mark_dirty()
         self.page.go_forward()
 
     # Assertion Methods
+    @timed_action("assertion")
     def assert_element_visible(self, locator: str | Locator) -> None:
         """Assert element is visible"""
         element = self._get_element(locator)
         expect(element).to_be_visible(timeout=self.timeout)
         self.logger.info("Assertion passed: Element %s is visible", locator)
 
+    @timed_action("assertion")
     def assert_element_hidden(self, locator: str | Locator) -> None:
         """Assert element is hidden"""
         element = self._get_element(locator)
         expect(element).to_be_hidden(timeout=self.timeout)
         self.logger.info("Assertion passed: Element %s is hidden", locator)
 
+    @timed_action("assertion")
     def assert_text_equals(self, locator: str | Locator, expected_text: str) -> None:
         """Assert element text equals expected text"""
         element = self._get_element(locator)
         expect(element).to_have_text(expected_text, timeout=self.timeout)
         self.logger.info("Assertion passed: Text equals '%s'", expected_text)
 
+    @timed_action("assertion")
     def assert_text_contains(self, locator: str | Locator, expected_text: str) -> None:
         """Assert element text contains expected text"""
         element = self._get_element(locator)
         expect(element).to_contain_text(expected_text, timeout=self.timeout)
         self.logger.info("Assertion passed: Text contains '%s'", expected_text)
 
+    @timed_action("assertion")
     def assert_url_contains(self, expected_url: str) -> None:
         """Assert URL contains expected string"""
         expect(self.page).to_have_url(f"**{expected_url}**", timeout=self.timeout)
         self.logger.info("Assertion passed: URL contains '%s'", expected_url)
 
+    @timed_action("assertion")
     def assert_title_contains(self, expected_title: str) -> None:
         """Assert page title contains expected string"""
         expect(self.page).to_have_title(f"**{expected_title}**", timeout=self.timeout)
         self.logger.info("Assertion passed: Title contains '%s'", expected_title)
+
+    @timed_action("assertion")
+    def assert_performance_budget(
+        self,
+        *,
+        ttfb_ms: Optional[float] = None,
+        dcl_ms: Optional[float] = None,
+        load_ms: Optional[float] = None,
+        fcp_ms: Optional[float] = None,
+        lcp_ms: Optional[float] = None,
+        cls: Optional[float] = None,
+        request_count: Optional[int] = None,
+        transfer_bytes: Optional[int] = None
+    ) -> dict:
+        """
+        Assert the current document stays within a performance budget
+
+        Waits for the load event so load, FCP and LCP are final. Metrics the
+        browser does not report (e.g. LCP outside Chromium) are logged and skipped.
+
+        Args:
+            ttfb_ms: Maximum time to first byte
+            dcl_ms: Maximum DOMContentLoaded end
+            load_ms: Maximum load event end
+            fcp_ms: Maximum first contentful paint
+            lcp_ms: Maximum largest contentful paint
+            cls: Maximum cumulative layout shift
+            request_count: Maximum number of requests (document + resources)
+            transfer_bytes: Maximum bytes transferred
+
+        Returns:
+            Metrics the budget was checked against
+        """
+        budget = {name: limit for name, limit in {
+            "ttfb_ms": ttfb_ms, "dcl_ms": dcl_ms, "load_ms": load_ms, "fcp_ms": fcp_ms, "lcp_ms": lcp_ms,
+            "cls": cls, "request_count": request_count, "transfer_bytes": transfer_bytes,
+        }.items() if limit is not None}
+        self.page.wait_for_load_state("load", timeout=self.timeout)
+        metrics = collect_performance_metrics(self.page)
+        violations, unavailable = budget_violations(metrics, budget)
+        if unavailable:
+            self.logger.warning("Not reported by the browser, not checked: %s", ", ".join(unavailable))
+        assert not violations, f"Performance budget exceeded on {metrics['url']}: {'; '.join(violations)}"
+        self.logger.info("Assertion passed: Performance within budget %s", budget)
+        return metrics
@@ -0,0 +1,200 @@
+"""
+DOM Snapshot
+Python-side index of page elements captured in one browser round trip
+"""
+from weakref import WeakKeyDictionary
+
+from playwright.sync_api import Error, Page
+
+from pages.selectors import ELEMENT_HELPERS_SCRIPT, to_css_query
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Name of the binding the MutationObserver calls when the DOM changes
+INVALIDATE_BINDING = "__pomSnapshotInvalidated"
+
+# Elements kept per selector (count is always exact)
+MAX_ELEMENTS_PER_SELECTOR = 50
+
+# Captures every query and (re)arms a MutationObserver for the given generation
+SNAPSHOT_SCRIPT = """([queries, generation, maxElements]) => {""" + ELEMENT_HELPERS_SCRIPT + """
+    window.__pomSnapshotGeneration = generation;
+    window.__pomSnapshotDirty = false;
+    if (!window.__pomSnapshotObserver) {
+        window.__pomSnapshotObserver = new MutationObserver(() => {
+            if (!window.__pomSnapshotDirty) {
+                window.__pomSnapshotDirty = true;
+                window.""" + INVALIDATE_BINDING + """(window.__pomSnapshotGeneration);
+            }
+        });
+        window.__pomSnapshotObserver.observe(document, {
+            subtree: true, childList: true, attributes: true, characterData: true,
+        });
+    }
+    const describe = (element) => {
+        const rect = element.getBoundingClientRect();
+        return {
+            tag: element.tagName.toLowerCase(),
+            text: element.textContent || "",
+            attributes: Object.fromEntries(
+                element.getAttributeNames().map((name) => [name, element.getAttribute(name)])
+            ),
+            box: {x: rect.x, y: rect.y, width: rect.width, height: rect.height},
+            visible: isVisible(element),
+        };
+    };
+    return queries.map(([css, text]) => {
+        try {
+            const elements = matchQuery(css, text);
+            return {
+                count: elements.length,
+                visible: elements.some(isVisible),
+                elements: elements.slice(0, maxElements).map(describe),
+            };
+        } catch (e) {
+            return null;
+        }
+    });
+}"""
+
+# True while the page still holds the given snapshot generation and nothing changed since
+FRESHNESS_SCRIPT = """(generation) => window.__pomSnapshotGeneration === generation && !window.__pomSnapshotDirty"""
+
+# Page -> latest DomSnapshot
+_snapshots: "WeakKeyDictionary[Page, DomSnapshot]" = WeakKeyDictionary()
+
+
+class DomSnapshot:
+    """Index of the elements matched by a set of selectors at one point in time"""
+
+    def __init__(self, page: Page, generation: int, entries: dict):
+        """
+        Initialize DOM snapshot
+
+        Args:
+            page: Playwright Page object
+            generation: Capture number, used to ignore late invalidations of older snapshots
+            entries: Mapping of selector to {'count', 'visible', 'elements'}
+        """
+        self.page = page
+        self.generation = generation
+        self.entries = entries
+        self.dirty = False
+
+    def is_fresh(self) -> bool:
+        """
+        Check in the page that nothing changed since the capture
+
+        Reads trust the snapshot until it is invalidated, and DOM changes made
+        by page scripts are reported through a binding that Python only sees
+        at its next browser call. The MutationObserver also sets an in-page
+        flag synchronously with the change, so call this once before a batch
+        of reads that must not miss such changes. Costs one small evaluate.
+
+        Returns:
+            True if the snapshot still matches the DOM
+        """
+        if self.dirty:
+            return False
+        try:
+            fresh = self.page.evaluate(FRESHNESS_SCRIPT, self.generation)
+        except Error:
+            fresh = False
+        if not fresh:
+            self.invalidate()
+        return fresh
+
+    def invalidate(self) -> None:
+        """Mark the snapshot stale so reads go back to the browser"""
+        if not self.dirty:
+            self.dirty = True
+            logger.debug("DOM snapshot %d invalidated", self.generation)
+
+    def lookup(self, locator) -> dict | None:
+        """
+        Get the captured entry for a locator
+
+        Args:
+            locator: Element locator
+
+        Returns:
+            {'count', 'visible', 'elements'} or None if the snapshot is stale or did not capture the locator
+        """
+        if self.dirty or not isinstance(locator, str):
+            return None
+        return self.entries.get(locator)
+
+
+def get_dom_snapshot(page: Page) -> DomSnapshot | None:
+    """
+    Get the latest snapshot of a page if it has not been invalidated (no browser call)
+
+    Args:
+        page: Playwright Page object
+
+    Returns:
+        DomSnapshot or None
+    """
+    snapshot = _snapshots.get(page)
+    if snapshot is None or snapshot.dirty:
+        return None
+    return snapshot
+
+
+def invalidate_dom_snapshot(page: Page) -> None:
+    """
+    Invalidate the snapshot of a page (after actions that may change the DOM)
+
+    Args:
+        page: Playwright Page object
+    """
+    snapshot = _snapshots.get(page)
+    if snapshot is not None:
+        snapshot.invalidate()
+
+
+def _on_mutation(page: Page, generation: int) -> None:
+    """Handle a MutationObserver report from the page"""
+    snapshot = _snapshots.get(page)
+    if snapshot is not None and snapshot.generation == generation:
+        snapshot.invalidate()
+
+
+def _watch_page(page: Page) -> None:
+    """Register the invalidation binding and navigation listener once per page"""
+    page.expose_binding(INVALIDATE_BINDING, lambda source, generation: _on_mutation(page, generation))
+    page.on("framenavigated", lambda frame: frame == page.main_frame and invalidate_dom_snapshot(page))
+
+
+def capture_dom_snapshot(page: Page, locators: list[str]) -> DomSnapshot:
+    """
+    Capture the elements matched by a set of selectors in one evaluation
+
+    Selectors that cannot be resolved in-page (see to_css_query) are left out
+    and keep being answered by the browser.
+
+    Args:
+        page: Playwright Page object
+        locators: Selector strings
+
+    Returns:
+        Fresh DomSnapshot, also registered as the page's latest snapshot
+    """
+    previous = _snapshots.get(page)
+    if previous is None:
+        _watch_page(page)
+    generation = previous.generation + 1 if previous is not None else 1
+
+    queries = {}
+    for locator in locators:
+        query = to_css_query(locator)
+        if query is not None:
+            queries[locator] = query
+
+    captured = page.evaluate(SNAPSHOT_SCRIPT, [list(queries.values()), generation, MAX_ELEMENTS_PER_SELECTOR])
+    entries = {locator: entry for locator, entry in zip(queries, captured) if entry is not None}
+    snapshot = DomSnapshot(page, generation, entries)
+    _snapshots[page] = snapshot
+    logger.debug("Captured DOM snapshot %d with %d selectors", generation, len(entries))
+    return snapshot
@@ -0,0 +1,73 @@
+"""
+Page Object Model for the Ultimate QA courses sign-in page
+"""
+from typing import Optional
+
+from playwright.sync_api import Error
+
+from pages.base_page import BasePage
+from utils.waits import wait_until
+
+
+class LoginPage(BasePage):
+    """Page Object for the sign-in form linked from the automation page ('Login automation')"""
+
+    PAGE_URL = "https://courses.ultimateqa.com/users/sign_in"
+
+    EMAIL_INPUT = "input[name='user[email]']"
+    PASSWORD_INPUT = "input[name='user[password]']"
+    SUBMIT_BUTTON = "button[type='submit']"
+    # Message shown when the form re-renders after rejected credentials
+    LOGIN_ERROR = "[role='alert'], .form-error, .alert-danger"
+
+    # Path the site redirects to when a session is missing or expired
+    SIGN_IN_PATH = "/users/sign_in"
+
+    def navigate(self, url=None):
+        """Navigate to the sign-in page"""
+        super().navigate(url if url is not None else self.PAGE_URL)
+        self.wait_for_element(self.EMAIL_INPUT, state="visible")
+
+    def login(self, email: str, password: str, timeout: Optional[int] = None) -> bool:
+        """
+        Sign in and wait until the browser leaves the sign-in page or the form shows an error
+
+        Args:
+            email: Account email
+            password: Account password
+            timeout: Custom timeout in milliseconds
+
+        Returns:
+            True if signed in, False if the credentials were rejected
+
+        Raises:
+            TimeoutError: If neither happens within timeout
+        """
+        start_url = self.get_url()
+        self.fill(self.EMAIL_INPUT, email)
+        self.fill(self.PASSWORD_INPUT, password)
+        self.click(self.SUBMIT_BUTTON)
+
+        error = self._get_element(self.LOGIN_ERROR)
+
+        def outcome() -> str | None:
+            if self.page.url != start_url:
+                return "signed in"
+            try:
+                return "rejected" if error.first.is_visible() else None
+            except Error:
+                # The sign-in page is being replaced
+                return None
+
+        result = wait_until(outcome, timeout_ms=timeout or self.timeout, description="sign-in result")
+        self.logger.info("Login as %s: %s", email, result)
+        return result == "signed in"
+
+    def get_login_error(self) -> str:
+        """Get the error message of a rejected sign-in (empty if none is shown)"""
+        error = self._get_element(self.LOGIN_ERROR).first
+        return error.text_content().strip() if error.is_visible() else ""
+
+    def is_on_sign_in_page(self) -> bool:
+        """Check if the browser was sent to the sign-in page (not or no longer logged in)"""
+        return self.SIGN_IN_PATH in self.get_url()
@@ -0,0 +1,229 @@
+"""
+Network Tracker
+Counts in-flight requests of a page from its request events and waits for relevant traffic to go quiet
+"""
+import fnmatch
+import re
+import time
+from collections import deque
+from weakref import WeakKeyDictionary
+
+from playwright.sync_api import Page, Request
+
+from utils.logger import get_logger
+from utils.route_policies import FIRST_PARTY_DOMAINS, is_first_party
+from utils.waits import Deadline, timed_wait
+
+logger = get_logger(__name__)
+
+# Longest pause between event checks while requests are in flight
+POLL_SLICE_MS = 25
+
+# Requests never worth waiting for (long-polling analytics and beacons)
+DEFAULT_IGNORE = ("*google-analytics.com/*", "*googletagmanager.com/*", "*/collect?*", "*/beacon*")
+
+# Most recent requests kept per page (quiet detection and slowest requests); counts cover every request
+MAX_RECORDS = 500
+
+
+def _matches(url: str, patterns: tuple) -> bool:
+    """Check a URL against glob strings, compiled regexes or predicates"""
+    for pattern in patterns:
+        if isinstance(pattern, str):
+            if fnmatch.fnmatchcase(url, pattern):
+                return True
+        elif isinstance(pattern, re.Pattern):
+            if pattern.search(url):
+                return True
+        elif pattern(url):
+            return True
+    return False
+
+
+class NetworkTracker:
+    """In-flight and recent requests of one page"""
+
+    def __init__(self, page: Page, max_records: int = MAX_RECORDS):
+        """
+        Start tracking a page's requests
+
+        Args:
+            page: Playwright Page object
+            max_records: Most recent requests kept (older ones only stay in the counts)
+        """
+        self.page = page
+        self.records: deque[dict] = deque(maxlen=max_records)
+        self._in_flight: dict[Request, dict] = {}
+        self.max_in_flight = 0
+        self.request_count = 0
+        self.failed_count = 0
+        self.by_type: dict[str, int] = {}
+        page.on("request", self._on_request)
+        page.on("requestfinished", lambda request: self._on_done(request, failed=False))
+        page.on("requestfailed", lambda request: self._on_done(request, failed=True))
+
+    def _on_request(self, request: Request) -> None:
+        """Record a started request"""
+        record = {
+            "url": request.url,
+            "resource_type": request.resource_type,
+            "started": time.monotonic(),
+            "ended": None,
+            "failed": False,
+        }
+        self._in_flight[request] = record
+        self.records.append(record)
+        self.request_count += 1
+        self.by_type[record["resource_type"]] = self.by_type.get(record["resource_type"], 0) + 1
+        self.max_in_flight = max(self.max_in_flight, len(self._in_flight))
+
+    def _on_done(self, request: Request, failed: bool) -> None:
+        """Record a finished or failed request"""
+        record = self._in_flight.pop(request, None)
+        if record is not None:
+            record["ended"] = time.monotonic()
+            record["failed"] = failed
+            self.failed_count += failed
+
+    @property
+    def in_flight_count(self) -> int:
+        """Number of requests currently in flight"""
+        return len(self._in_flight)
+
+    def _relevant(self, ignore: tuple, allow_hosts: tuple, third_party: bool):
+        """Build the filter deciding which requests a wait cares about"""
+        first_party = FIRST_PARTY_DOMAINS + tuple(allow_hosts)
+
+        def relevant(record: dict) -> bool:
+            if _matches(record["url"], ignore):
+                return False
+            return third_party or is_first_party(record["url"], first_party)
+        return relevant
+
+    def wait_for_quiet(
+        self,
+        idle_ms: int = 500,
+        timeout_ms: float = 30000,
+        ignore: tuple = DEFAULT_IGNORE,
+        allow_hosts: tuple = (),
+        third_party: bool = False
+    ) -> dict:
+        """
+        Wait until no relevant request has been in flight for idle_ms
+
+        Unlike wait_until="networkidle" this only counts the requests the test
+        cares about: third-party hosts are ignored unless allowed, as are URLs
+        matching the ignore patterns, so analytics and long polling do not hold
+        the wait open. Returns as soon as the relevant traffic has been quiet
+        for idle_ms.
+
+        Args:
+            idle_ms: Quiet period in milliseconds
+            timeout_ms: Deadline in milliseconds
+            ignore: URL glob strings, compiled regexes or predicates to ignore
+            allow_hosts: Third-party domains (and subdomains) that still count
+            third_party: Count every host
+
+        Returns:
+            Dict with 'waited_ms', 'relevant' (requests considered) and 'ignored'
+
+        Raises:
+            TimeoutError: If relevant requests are still in flight at the deadline
+        """
+        relevant = self._relevant(ignore, allow_hosts, third_party)
+        deadline = Deadline(timeout_ms)
+        with timed_wait("wait_for_network_quiet", f"{idle_ms} ms"):
+            while True:
+                pending = [record for record in self._in_flight.values() if relevant(record)]
+                now = time.monotonic()
+                last_activity = max(
+                    [record["started"] for record in pending]
+                    + [record["ended"] for record in self.records if record["ended"] and relevant(record)],
+                    default=deadline.started,
+                )
+                quiet_ms = (now - last_activity) * 1000
+                if not pending and quiet_ms >= idle_ms:
+                    break
+                if deadline.expired:
+                    urls = ", ".join(record["url"] for record in pending[:5])
+                    raise TimeoutError(f"Network not quiet within {timeout_ms:.0f} ms, in flight: {urls}")
+
+                # The sync API only dispatches request events while it waits on the browser
+                remaining = POLL_SLICE_MS if pending else idle_ms - quiet_ms
+                self.page.wait_for_timeout(max(1.0, min(remaining, deadline.remaining_ms)))
+
+        considered = sum(relevant(record) for record in self.records)
+        return {
+            "waited_ms": round(deadline.elapsed_ms, 1),
+            "relevant": considered,
+            "ignored": len(self.records) - considered,
+        }
+
+    def stats(self) -> dict:
+        """
+        Summarize the tracked requests
+
+        Returns:
+            Dict with 'requests', 'failed', 'in_flight', 'max_in_flight', 'by_type'
+            (resource type -> count) and 'slowest' (five longest of the recent finished requests)
+        """
+        finished = [record for record in self.records if record["ended"] is not None]
+        slowest = sorted(finished, key=lambda record: record["ended"] - record["started"], reverse=True)[:5]
+        return {
+            "requests": self.request_count,
+            "failed": self.failed_count,
+            "in_flight": self.in_flight_count,
+            "max_in_flight": self.max_in_flight,
+            "by_type": dict(self.by_type),
+            "slowest": [
+                {"url": record["url"], "duration_ms": round((record["ended"] - record["started"]) * 1000, 1)}
+                for record in slowest
+            ],
+        }
+
+    def reset(self) -> None:
+        """Forget finished requests (pages reused across tests); in-flight requests stay tracked"""
+        self.records = deque(self._in_flight.values(), maxlen=self.records.maxlen)
+        self.max_in_flight = self.in_flight_count
+        self.request_count = self.in_flight_count
+        self.failed_count = 0
+        self.by_type = {}
+        for record in self.records:
+            self.by_type[record["resource_type"]] = self.by_type.get(record["resource_type"], 0) + 1
+
+
+# Page -> its tracker
+_trackers: "WeakKeyDictionary[Page, NetworkTracker]" = WeakKeyDictionary()
+
+
+def get_network_tracker(page: Page) -> NetworkTracker:
+    """
+    Get the tracker of a page, attaching one on first use
+
+    Trackers are attached on demand (wait_for_network_quiet, NAVIGATION_QUIET_MS)
+    so pages that never wait for quiet carry no request listeners. Requests
+    started before the tracker was attached are not seen.
+
+    Args:
+        page: Playwright Page object
+
+    Returns:
+        NetworkTracker
+    """
+    tracker = _trackers.get(page)
+    if tracker is None:
+        tracker = _trackers[page] = NetworkTracker(page)
+    return tracker
+
+
+def find_network_tracker(page: Page) -> NetworkTracker | None:
+    """
+    Get the tracker of a page without attaching one
+
+    Args:
+        page: Playwright Page object
+
+    Returns:
+        NetworkTracker or None
+    """
+    return _trackers.get(page)
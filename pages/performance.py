@@ -0,0 +1,145 @@
+"""
+Performance Metrics
+Navigation, paint and resource timing of the current document, read in one evaluation
+"""
+from weakref import WeakKeyDictionary
+
+from playwright.sync_api import Page
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Metrics collected per navigation (budgets are upper bounds)
+METRIC_NAMES = ("ttfb_ms", "dcl_ms", "load_ms", "fcp_ms", "lcp_ms", "cls", "request_count", "transfer_bytes")
+
+# Reads timing entries of the current document; LCP and layout shifts come from
+# buffered PerformanceObservers (they are not exposed through getEntriesByType)
+PERFORMANCE_SCRIPT = """async () => {
+    const observed = async (type) => {
+        try {
+            const entries = [];
+            const observer = new PerformanceObserver((list) => entries.push(...list.getEntries()));
+            observer.observe({type, buffered: true});
+            await new Promise((resolve) => setTimeout(resolve, 0));
+            entries.push(...observer.takeRecords());
+            observer.disconnect();
+            return entries;
+        } catch (e) {
+            return [];
+        }
+    };
+    const round = (value) => (value === null || value === undefined ? null : Math.round(value * 10) / 10);
+    const navigation = performance.getEntriesByType("navigation")[0];
+    const resources = performance.getEntriesByType("resource");
+    const paint = performance.getEntriesByName("first-contentful-paint")[0];
+    const lcpEntries = await observed("largest-contentful-paint");
+    const lcp = lcpEntries.length ? lcpEntries[lcpEntries.length - 1] : null;
+
+    // CLS: largest session window (shifts < 1 s apart, window < 5 s), ignoring input-driven shifts
+    let cls = 0, windowValue = 0, windowStart = 0, previous = 0;
+    for (const shift of await observed("layout-shift")) {
+        if (shift.hadRecentInput) {
+            continue;
+        }
+        if (windowValue && (shift.startTime - previous > 1000 || shift.startTime - windowStart > 5000)) {
+            windowValue = 0;
+        }
+        if (!windowValue) {
+            windowStart = shift.startTime;
+        }
+        windowValue += shift.value;
+        previous = shift.startTime;
+        cls = Math.max(cls, windowValue);
+    }
+
+    return {
+        url: location.href,
+        time_origin: performance.timeOrigin,
+        ttfb_ms: navigation ? round(navigation.responseStart) : null,
+        dcl_ms: navigation && navigation.domContentLoadedEventEnd ? round(navigation.domContentLoadedEventEnd) : null,
+        load_ms: navigation && navigation.loadEventEnd ? round(navigation.loadEventEnd) : null,
+        fcp_ms: paint ? round(paint.startTime) : null,
+        lcp_ms: lcp ? round(lcp.startTime) : null,
+        cls: Math.round(cls * 10000) / 10000,
+        request_count: resources.length + (navigation ? 1 : 0),
+        transfer_bytes: resources.reduce((total, entry) => total + (entry.transferSize || 0),
+            navigation ? navigation.transferSize || 0 : 0),
+    };
+}"""
+
+# Page -> metrics of the documents it loaded, one dict per navigation
+_metrics: "WeakKeyDictionary[Page, list[dict]]" = WeakKeyDictionary()
+
+
+def collect_performance_metrics(page: Page) -> dict:
+    """
+    Read the performance metrics of the page's current document
+
+    Repeated reads of the same document replace its earlier entry, so the
+    stored metrics always hold the latest (most complete) values.
+
+    Transfer sizes of cross-origin resources without Timing-Allow-Origin are
+    reported by the browser as 0.
+
+    Args:
+        page: Playwright Page object
+
+    Returns:
+        Dict with url, time_origin and METRIC_NAMES (None where the browser has no value)
+    """
+    metrics = page.evaluate(PERFORMANCE_SCRIPT)
+    history = _metrics.setdefault(page, [])
+    if history and history[-1]["time_origin"] == metrics["time_origin"]:
+        history[-1] = metrics
+    else:
+        history.append(metrics)
+    logger.debug("Performance metrics for %s: %s", metrics["url"], metrics)
+    return metrics
+
+
+def get_performance_metrics(page: Page) -> list[dict]:
+    """
+    Get the metrics collected for a page
+
+    Args:
+        page: Playwright Page object
+
+    Returns:
+        List of metric dicts, one per navigation
+    """
+    return list(_metrics.get(page, []))
+
+
+def clear_performance_metrics(page: Page) -> None:
+    """
+    Forget the metrics collected for a page (pages reused across tests)
+
+    Args:
+        page: Playwright Page object
+    """
+    _metrics.pop(page, None)
+
+
+def budget_violations(metrics: dict, budget: dict) -> tuple[list[str], list[str]]:
+    """
+    Compare metrics against a budget
+
+    Args:
+        metrics: Metrics from collect_performance_metrics
+        budget: Metric name -> maximum allowed value
+
+    Returns:
+        Tuple of (violations, metrics the browser did not report)
+    """
+    violations = []
+    unavailable = []
+    for name, limit in budget.items():
+        if name not in METRIC_NAMES:
+            raise ValueError(f"Unknown performance metric '{name}'. Available: {', '.join(METRIC_NAMES)}")
+        value = metrics.get(name)
+        if value is None:
+            unavailable.append(name)
+        elif value > limit:
+            violations.append(f"{name}={value} exceeds budget {limit}")
+    return violations, unavailable
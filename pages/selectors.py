@@ -0,0 +1,192 @@
+"""
+Selector Utilities
+Translates Playwright selectors into plain CSS queries that can be resolved in-page
+"""
+import re
+from functools import lru_cache
+
+# "<css>:has-text('<text>')" with single or double quotes
+HAS_TEXT_PATTERN = re.compile(r"""^(?P<css>.*?):has-text\((?:'(?P<single>[^']*)'|"(?P<double>[^"]*)")\)$""")
+
+# Engine prefixes such as "text=", "xpath=", "role=", "data-testid="
+ENGINE_PREFIX_PATTERN = re.compile(r"^\s*(?:internal:|[a-z_-]+=)", re.IGNORECASE)
+
+# Playwright-only syntax that document.querySelectorAll does not understand
+PLAYWRIGHT_ONLY_TOKENS = (
+    ">>",
+    ":has-text(",
+    ":text(",
+    ":text-is(",
+    ":text-matches(",
+    ":visible",
+    ":nth-match(",
+    ":left-of(",
+    ":right-of(",
+    ":above(",
+    ":below(",
+    ":near(",
+)
+
+# In-page helpers matching CSS queries and summarizing matched elements
+# (visibility follows Playwright: non-empty bounding box and not visibility:hidden)
+ELEMENT_HELPERS_SCRIPT = """
+    const normalizeText = (value) => (value || "").replace(/\\s+/g, " ").trim();
+    const matchQuery = (css, text) => {
+        const elements = Array.from(document.querySelectorAll(css));
+        if (text === null) {
+            return elements;
+        }
+        const needle = normalizeText(text).toLowerCase();
+        return elements.filter((element) => normalizeText(element.textContent).toLowerCase().includes(needle));
+    };
+    const isVisible = (element) => {
+        const rect = element.getBoundingClientRect();
+        return rect.width > 0 && rect.height > 0 && getComputedStyle(element).visibility !== "hidden";
+    };
+    const summarize = (elements, attributes) => {
+        const first = elements[0];
+        return {
+            count: elements.length,
+            visible: elements.some(isVisible),
+            text: first ? normalizeText(first.textContent) : "",
+            attributes: first ? Object.fromEntries(attributes.map((name) => [name, first.getAttribute(name)])) : {},
+        };
+    };
+"""
+
+
+@lru_cache(maxsize=1024)
+def to_css_query(selector: str) -> tuple[str, str | None] | None:
+    """
+    Translate a selector into a CSS query plus an optional text filter
+
+    Supports plain CSS and "<css>:has-text('...')". The text filter follows
+    Playwright's :has-text semantics: case-insensitive substring match on the
+    whitespace-normalized text content. Results are cached, page object
+    constants are translated once when their class is created.
+
+    Args:
+        selector: Playwright selector string
+
+    Returns:
+        Tuple of (css, text or None), or None if the selector needs Playwright's engine
+    """
+    if selector.startswith("//") or selector.startswith("..") or ENGINE_PREFIX_PATTERN.match(selector):
+        return None
+
+    css, text = selector, None
+    match = HAS_TEXT_PATTERN.match(selector)
+    if match:
+        css = match.group("css") or "*"
+        text = match.group("single") if match.group("single") is not None else match.group("double")
+        if "," in css:
+            # The text filter would apply to every selector in the group
+            return None
+
+    if any(token in css for token in PLAYWRIGHT_ONLY_TOKENS):
+        return None
+    return css, text
+
+
+def selector_constants(page_class: type) -> dict[str, str]:
+    """
+    Get the selector constants declared on a page object class
+
+    Selector constants are UPPER_CASE string attributes; *_URL constants are skipped.
+
+    Args:
+        page_class: Page object class
+
+    Returns:
+        Dict mapping constant name to selector, including inherited constants
+    """
+    constants = {}
+    for klass in reversed(page_class.__mro__):
+        for name, value in vars(klass).items():
+            if name.isupper() and isinstance(value, str) and not name.endswith("_URL"):
+                constants[name] = value
+    return constants
+
+
+def _unbalanced(selector: str) -> str | None:
+    """Find the first unclosed or stray bracket or quote outside of quoted text"""
+    closing = {"(": ")", "[": "]"}
+    stack, quote = [], None
+    for char in selector:
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in "'\"":
+            quote = char
+        elif char in closing:
+            stack.append(closing[char])
+        elif char in ")]":
+            if not stack or stack.pop() != char:
+                return char
+    if quote:
+        return quote
+    return stack[-1] if stack else None
+
+
+def selector_problems(selector: str) -> list[str]:
+    """
+    Check a selector for syntax errors and patterns that scan the whole DOM
+
+    Catches what can be checked without a browser: empty selectors, unbalanced
+    brackets/quotes, empty '>>' chain segments and :has-text filters without an
+    element type or id/class to narrow the candidates (every element's text
+    would be read).
+
+    Args:
+        selector: Playwright selector string
+
+    Returns:
+        List of problem descriptions (empty if the selector looks fine)
+    """
+    if not selector.strip():
+        return ["empty selector"]
+
+    problems = []
+    stray = _unbalanced(selector)
+    if stray:
+        problems.append(f"unbalanced '{stray}'")
+    if any(not segment.strip() for segment in selector.split(">>")):
+        problems.append("empty '>>' segment")
+
+    for segment in selector.split(">>"):
+        match = HAS_TEXT_PATTERN.match(segment.strip())
+        if not match:
+            continue
+        if match.group("css").strip() in ("", "*"):
+            problems.append(":has-text without an element to narrow it scans every element")
+        text = match.group("single") if match.group("single") is not None else match.group("double")
+        if not text.strip():
+            problems.append(":has-text with empty text matches every element")
+    return problems
+
+
+def validate_selector_constants(page_class: type) -> dict[str, str]:
+    """
+    Validate and pre-translate the selector constants of a page object class
+
+    Args:
+        page_class: Page object class
+
+    Returns:
+        Dict mapping constant name to selector
+
+    Raises:
+        ValueError: If any selector constant is malformed or pathologically expensive
+    """
+    constants = selector_constants(page_class)
+    errors = [
+        f"{name} = {selector!r}: {problem}"
+        for name, selector in constants.items()
+        for problem in selector_problems(selector)
+    ]
+    if errors:
+        raise ValueError(f"Invalid selectors on {page_class.__name__}: " + "; ".join(errors))
+
+    for selector in constants.values():
+        to_css_query(selector)
+    return constants
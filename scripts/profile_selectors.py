@@ -0,0 +1,317 @@
+"""
+Selector Cost Profiler
+Times the selector constants of a page object against a saved page snapshot and suggests cheaper, stable equivalents
+
+Usage:
+    python -m scripts.profile_selectors                                   # AutomationPage vs scripts/page_content.html
+    python -m scripts.profile_selectors --snapshot test_data/snapshots/complicated_page.html --iterations 500
+    python -m scripts.profile_selectors --selector "BIG_PAGE_TEXT=a:has-text('Big page with many elements')"
+
+The snapshot is loaded with all network requests blocked. Each selector is
+resolved 'iterations' times through Playwright (the cost a test pays per
+lookup); plain CSS and :has-text selectors are also timed inside the page.
+"""
+import argparse
+import importlib
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+
+from playwright.sync_api import Error, Page, sync_playwright
+
+from benchmarks.stats import measure, summarize
+from pages.selectors import ELEMENT_HELPERS_SCRIPT, selector_constants, to_css_query
+
+DEFAULT_SNAPSHOT = Path("scripts") / "page_content.html"
+DEFAULT_PAGE_CLASS = "pages.automation_page:AutomationPage"
+RESULTS_DIR = Path("reports") / "selector_profile"
+
+# Stability order of suggested selectors (most stable first)
+CANDIDATE_KINDS = ("id", "data", "name", "href", "role")
+
+# Selectors resolved by text or accessibility tree scans rather than an index or attribute match
+EXPENSIVE_MARKERS = (":has-text(", ":text(", "text=", "role=", "xpath=", "//", ":visible")
+
+# Average in-page cost of one CSS query (+ text filter) over many repetitions
+IN_PAGE_COST_SCRIPT = """([css, text, iterations]) => {""" + ELEMENT_HELPERS_SCRIPT + """
+    const started = performance.now();
+    for (let i = 0; i < iterations; i++) {
+        matchQuery(css, text);
+    }
+    return (performance.now() - started) / iterations;
+}"""
+
+# Selectors identifying an element by id, data attributes, name, href or ARIA role + accessible name
+CANDIDATES_SCRIPT = """(element) => {
+    const quote = (value) => '"' + value.replace(/\\\\/g, "\\\\\\\\").replace(/"/g, '\\\\"') + '"';
+    const normalize = (value) => (value || "").replace(/\\s+/g, " ").trim();
+    const tag = element.tagName.toLowerCase();
+    const candidates = [];
+    if (element.id) {
+        candidates.push({kind: "id", selector: "#" + CSS.escape(element.id)});
+    }
+    for (const attribute of element.attributes) {
+        if (attribute.name.startsWith("data-") && attribute.value) {
+            candidates.push({kind: "data", selector: `${tag}[${attribute.name}=${quote(attribute.value)}]`});
+        }
+    }
+    const name = element.getAttribute("name");
+    if (name) {
+        candidates.push({kind: "name", selector: `${tag}[name=${quote(name)}]`});
+    }
+    const href = element.getAttribute("href");
+    if (tag === "a" && href && !href.startsWith("#") && !href.startsWith("javascript:")) {
+        candidates.push({kind: "href", selector: `a[href=${quote(href)}]`});
+    }
+    const implicitRoles = {
+        a: href ? "link" : null, button: "button", select: "combobox", textarea: "textbox", img: "img",
+        h1: "heading", h2: "heading", h3: "heading", h4: "heading", h5: "heading", h6: "heading",
+    };
+    const inputRoles = {checkbox: "checkbox", radio: "radio", submit: "button", button: "button"};
+    const role = element.getAttribute("role")
+        || (tag === "input" ? inputRoles[element.type] || "textbox" : implicitRoles[tag]);
+    const accessibleName = normalize(
+        element.getAttribute("aria-label") || element.getAttribute("alt") || element.textContent
+    );
+    if (role && accessibleName && accessibleName.length <= 80) {
+        candidates.push({kind: "role", selector: `role=${role}[name=${quote(accessibleName)}]`});
+    }
+    return candidates;
+}"""
+
+
+def load_page_class(path: str) -> type:
+    """
+    Import a page object class
+
+    Args:
+        path: 'module:Class', e.g. 'pages.automation_page:AutomationPage'
+
+    Returns:
+        Page object class
+    """
+    module_name, _, class_name = path.partition(":")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def in_page_cost(page: Page, selector: str, iterations: int) -> float | None:
+    """
+    Time a selector with the in-page query helpers (no Playwright round trip)
+
+    Args:
+        page: Page with the snapshot loaded
+        selector: Selector string
+        iterations: Repetitions averaged in the page
+
+    Returns:
+        Average ms per resolution, or None for selectors that need Playwright's engine
+    """
+    query = to_css_query(selector)
+    if query is None:
+        return None
+    try:
+        return round(page.evaluate(IN_PAGE_COST_SCRIPT, [query[0], query[1], iterations]), 5)
+    except Error:
+        return None
+
+
+def round_trip(page: Page, selector: str, iterations: int) -> tuple[dict, float]:
+    """
+    Time resolving a selector through Playwright
+
+    Args:
+        page: Page with the snapshot loaded
+        selector: Selector string
+        iterations: Samples
+
+    Returns:
+        Tuple of (timing summary, resolve_ms = p50 minus the p50 of an empty evaluate round trip)
+    """
+    locator = page.locator(selector)
+    summary = summarize(measure(locator.count, iterations))
+    baseline = summarize(measure(lambda: page.evaluate("() => 0"), iterations))
+    return summary, round(max(summary["p50_ms"] - baseline["p50_ms"], 0.0), 4)
+
+
+def verified_candidates(page: Page, selector: str, iterations: int) -> list[dict]:
+    """
+    Build and time candidate selectors for the first element a selector matches
+
+    A candidate is kept only if it matches exactly that element.
+
+    Args:
+        page: Page with the snapshot loaded
+        selector: Original selector (must match at least one element)
+        iterations: Samples per candidate
+
+    Returns:
+        Candidates with 'kind', 'selector', 'p50_ms' and 'resolve_ms', most stable kind first
+    """
+    target = page.locator(selector).first
+    target.evaluate("element => { window.__profiledElement = element; }")
+    candidates = []
+    for candidate in target.evaluate(CANDIDATES_SCRIPT):
+        try:
+            unique = page.locator(candidate["selector"]).evaluate_all(
+                "elements => elements.length === 1 && elements[0] === window.__profiledElement"
+            )
+        except Error:
+            continue
+        if unique:
+            summary, resolve_ms = round_trip(page, candidate["selector"], iterations)
+            candidates.append({**candidate, "p50_ms": summary["p50_ms"], "resolve_ms": resolve_ms})
+    return sorted(candidates, key=lambda candidate: CANDIDATE_KINDS.index(candidate["kind"]))
+
+
+def profile_selector(page: Page, name: str, selector: str, iterations: int) -> dict:
+    """
+    Profile one selector and pick a suggestion
+
+    A suggestion is made when the selector is expensive (text, role or XPath based)
+    or ambiguous (several matches): the most stable verified candidate that is not
+    slower than the selector.
+
+    Args:
+        page: Page with the snapshot loaded
+        name: Constant name
+        selector: Selector string
+        iterations: Samples
+
+    Returns:
+        Row of the report
+    """
+    row = {"name": name, "selector": selector, "count": 0, "visible": 0, "unique": False}
+    try:
+        row["count"] = page.locator(selector).count()
+        row["visible"] = page.locator(selector).evaluate_all(
+            "elements => elements.filter((e) => e.getClientRects().length > 0).length"
+        )
+    except Error as e:
+        row["error"] = str(e).splitlines()[0]
+        return row
+
+    summary, resolve_ms = round_trip(page, selector, iterations)
+    row.update({
+        "unique": row["count"] == 1,
+        "expensive": any(marker in selector for marker in EXPENSIVE_MARKERS),
+        "p50_ms": summary["p50_ms"],
+        "p95_ms": summary["p95_ms"],
+        "resolve_ms": resolve_ms,
+        "in_page_ms": in_page_cost(page, selector, iterations),
+        "candidates": [],
+        "suggestion": None,
+    })
+
+    if row["count"] and (row["expensive"] or not row["unique"]):
+        row["candidates"] = verified_candidates(page, selector, iterations)
+        faster = [candidate for candidate in row["candidates"] if candidate["p50_ms"] <= row["p50_ms"]]
+        if faster or not row["unique"]:
+            row["suggestion"] = (faster or row["candidates"] or [None])[0]
+    return row
+
+
+def profile(snapshot: Path, selectors: dict[str, str], iterations: int, browser_name: str) -> dict:
+    """
+    Profile selectors against a snapshot
+
+    Args:
+        snapshot: HTML file
+        selectors: Constant name -> selector
+        iterations: Samples per selector
+        browser_name: chromium, firefox or webkit
+
+    Returns:
+        Dictionary with 'meta' and 'selectors' (rows ranked by resolve cost, most expensive first)
+    """
+    with sync_playwright() as playwright:
+        browser = getattr(playwright, browser_name).launch(headless=True)
+        context = browser.new_context()
+        context.route("**/*", lambda route: route.abort())
+        page = context.new_page()
+        page.set_content(snapshot.read_text(encoding="utf-8"), wait_until="domcontentloaded")
+        element_count = page.evaluate("() => document.getElementsByTagName('*').length")
+        rows = [profile_selector(page, name, selector, iterations) for name, selector in selectors.items()]
+        browser.close()
+
+    rows.sort(key=lambda row: row.get("resolve_ms", -1), reverse=True)
+    return {
+        "meta": {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "snapshot": str(snapshot),
+            "elements": element_count,
+            "browser": browser_name,
+            "iterations": iterations,
+        },
+        "selectors": rows,
+    }
+
+
+def to_markdown(report: dict) -> str:
+    """
+    Render the ranked report as a Markdown table
+
+    Args:
+        report: Result of profile()
+
+    Returns:
+        Markdown text
+    """
+    meta = report["meta"]
+    lines = [
+        f"# Selector profile: {meta['snapshot']}",
+        "",
+        f"{meta['elements']} elements, {meta['iterations']} iterations, {meta['browser']}, {meta['created']}",
+        "",
+        "| # | Constant | Selector | Matches | Resolve ms | In-page ms | Suggestion |",
+        "|---|----------|----------|---------|------------|------------|------------|",
+    ]
+    for rank, row in enumerate(report["selectors"], 1):
+        if "error" in row:
+            lines.append(f"| {rank} | {row['name']} | `{row['selector']}` | error | | | {row['error']} |")
+            continue
+        suggestion = row["suggestion"]
+        suggested = f"`{suggestion['selector']}` ({suggestion['resolve_ms']:.3f} ms)" if suggestion else ""
+        in_page = f"{row['in_page_ms']:.4f}" if row["in_page_ms"] is not None else "n/a"
+        matches = f"{row['count']}" + ("" if row["unique"] else " (ambiguous)" if row["count"] else " (none)")
+        lines.append(
+            f"| {rank} | {row['name']} | `{row['selector']}` | {matches} | {row['resolve_ms']:.3f} | "
+            f"{in_page} | {suggested} |"
+        )
+    return "\n".join(lines) + "\n"
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Profile page object selectors against a page snapshot")
+    parser.add_argument("--snapshot", type=Path, default=DEFAULT_SNAPSHOT, help="HTML snapshot to load")
+    parser.add_argument("--page-class", default=DEFAULT_PAGE_CLASS, help="Page object as module:Class")
+    parser.add_argument(
+        "--selector", action="append", default=[], metavar="NAME=SELECTOR",
+        help="Additional selector to profile (repeatable)"
+    )
+    parser.add_argument("--iterations", type=int, default=200, help="Samples per selector")
+    parser.add_argument("--browser", default="chromium", choices=("chromium", "firefox", "webkit"))
+    parser.add_argument("--output", type=Path, default=None, help="Report file (default: reports/selector_profile/)")
+    args = parser.parse_args(argv)
+
+    selectors = selector_constants(load_page_class(args.page_class))
+    for extra in args.selector:
+        name, separator, selector = extra.partition("=")
+        if not separator:
+            parser.error(f"--selector expects NAME=SELECTOR, got '{extra}'")
+        selectors[name] = selector
+
+    report = profile(args.snapshot, selectors, args.iterations, args.browser)
+    output = args.output or RESULTS_DIR / f"{args.snapshot.stem}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    markdown = to_markdown(report)
+    output.with_suffix(".md").write_text(markdown, encoding="utf-8")
+    print(markdown)
+    print(f"Report written to {output} and {output.with_suffix('.md')}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,25 +2,87 @@
 Pytest Configuration and Fixtures
 Central configuration for all tests
 """
-from typing import Generator
+import importlib.util
+import json
+from typing import TYPE_CHECKING, Generator
 
 import pytest
-from playwright.sync_api import Page, BrowserContext
 
+from utils.auth_state import StorageStateCache
 from utils.config_reader import config
+from utils.data_source import DataSource, get_data_source
+from utils.helpers import create_directory, get_timestamp, sanitize_filename
 from utils.logger import get_logger
-from utils.helpers import create_directory, get_timestamp
 
-# Optional allure import
+# Playwright, allure and the browser-facing framework modules are imported by the fixtures and
+# hooks that use them, so collection and browser-free tests do not pay for them
+if TYPE_CHECKING:
+    from playwright.sync_api import Browser, BrowserContext, Page
+
+    from utils.async_runner import AsyncRunner
+    from utils.context_pool import ContextPool
+    from utils.route_policies import RouteBlocker
+    from utils.shared_page import SharedPagePool
+    from utils.stub_server import StubServer
+    from utils.trace_recorder import TraceRecorder
+
+# Optional allure (imported where attachments are made)
+ALLURE_AVAILABLE = importlib.util.find_spec("allure") is not None
+
+# Optional pytest-xdist (duration-based scheduling); the scheduler is imported on the controller only
+XDIST_AVAILABLE = importlib.util.find_spec("xdist") is not None
+
+# Optional pytest-html import
 try:
-    import allure
-    ALLURE_AVAILABLE = True
+    from pytest_html import extras as html_extras
+    PYTEST_HTML_AVAILABLE = True
 except ImportError:
-    ALLURE_AVAILABLE = False
+    PYTEST_HTML_AVAILABLE = False
 
 logger = get_logger(__name__)
 
 
+def pytest_addoption(parser):
+    """Register framework command line options"""
+    parser.addoption(
+        "--duration-schedule",
+        action="store_true",
+        dest="duration_schedule",
+        default=False,
+        help="With -n: dispatch tests longest-first using the recorded duration history",
+    )
+    parser.addoption(
+        "--impact",
+        action="store",
+        dest="impact_base",
+        default=None,
+        metavar="REVISION",
+        help="Run only tests affected by changes since REVISION (plus smoke/critical and unmapped tests)",
+    )
+    parser.addoption(
+        "--impact-record",
+        action="store_true",
+        dest="impact_record",
+        default=False,
+        help="Record the page object methods and selectors each test touches into the impact map",
+    )
+    parser.addoption(
+        "--startup-profile",
+        action="store_true",
+        dest="startup_profile",
+        default=False,
+        help="Report import time per module, fixture setup cost and startup overhead before the first test",
+    )
+    parser.addoption(
+        "--startup-budget-ms",
+        action="store",
+        dest="startup_budget_ms",
+        type=float,
+        default=None,
+        help="Fail the run if the framework (conftest import to first test) uses more CPU ms than this in a process",
+    )
+
+
 def pytest_configure(config):
     """Pytest configuration hook"""
     # Create necessary directories
@@ -28,9 +90,57 @@ def pytest_configure(config):
     create_directory("screenshots")
     create_directory("traces")
     create_directory("logs")
+
+    # Record test durations (controller / single process) for longest-first scheduling
+    if XDIST_AVAILABLE and not hasattr(config, "workerinput"):
+        from utils.duration_scheduler import DurationSchedulerPlugin
+        config.pluginmanager.register(DurationSchedulerPlugin(config), "duration-scheduler")
+
+    # Change-based test selection; selecting also refreshes the map for the tests that run
+    impact_base = config.getoption("impact_base")
+    if impact_base or config.getoption("impact_record"):
+        from utils.impact import ImpactPlugin
+        config.pluginmanager.register(ImpactPlugin(config, impact_base, record=True), "impact")
+
+    # Import times, fixture setup costs and the startup budget check
+    if config.getoption("startup_profile") or config.getoption("startup_budget_ms") is not None:
+        from utils.startup_profile import StartupProfilePlugin
+        config.pluginmanager.register(
+            StartupProfilePlugin(config, config.getoption("startup_budget_ms")), "startup-profile"
+        )
     logger.info("Test session started")
 
 
+def _marker_data_source(pytest_config, marker) -> DataSource:
+    """Get the data source of a data_source marker (paths are relative to the rootdir)"""
+    path = pytest_config.rootpath / marker.args[0]
+    return get_data_source(path, marker.kwargs.get("sheet"), marker.kwargs.get("id_field"))
+
+
+def pytest_generate_tests(metafunc):
+    """
+    Parametrize data_row from a data_source marker
+
+    The file is scanned once for record ids and offsets (cached while the
+    file is unchanged); each test seeks to its own record when it runs.
+    """
+    marker = metafunc.definition.get_closest_marker("data_source")
+    if marker is None:
+        return
+    source = _marker_data_source(metafunc.config, marker)
+    ids = source.ids(marker.kwargs.get("limit"), getattr(metafunc.config, "cache", None))
+    metafunc.parametrize("data_row", range(len(ids)), ids=ids, indirect=True)
+
+
+def pytest_sessionfinish(session):
+    """Wait for failure artifacts still being written in the background"""
+    from utils.artifact_writer import get_artifact_writer
+
+    failed_writes = get_artifact_writer().flush()
+    if failed_writes:
+        logger.error("%d failure artifacts could not be written", failed_writes)
+
+
 def pytest_unconfigure(config):
     """Pytest unconfiguration hook"""
     logger.info("Test session ended")
@@ -98,94 +208,586 @@ def browser_context_args(browser_name: str):
     return context_args
 
 
+@pytest.fixture(scope="session")
+def async_runner() -> Generator["AsyncRunner", None, None]:
+    """
+    Event loop for async page objects, one per session (per xdist worker)
+
+    Yields:
+        AsyncRunner driving its loop in a background thread
+    """
+    from utils.async_runner import AsyncRunner
+
+    runner = AsyncRunner()
+    yield runner
+    runner.close()
+
+
+@pytest.fixture(scope="session")
+def async_browser(async_runner: "AsyncRunner", browser_name: str, browser_type_launch_args: dict):
+    """
+    Browser launched through playwright.async_api on the worker's event loop
+
+    Args:
+        async_runner: Worker event loop
+        browser_name: Name of the browser (chromium, firefox, webkit)
+        browser_type_launch_args: Browser launch arguments
+
+    Yields:
+        playwright.async_api Browser
+    """
+    from playwright.async_api import async_playwright
+
+    async def _launch():
+        playwright = await async_playwright().start()
+        return playwright, await getattr(playwright, browser_name).launch(**browser_type_launch_args)
+
+    playwright, browser = async_runner.run(_launch())
+    yield browser
+
+    async def _shutdown():
+        await browser.close()
+        await playwright.stop()
+
+    async_runner.run(_shutdown())
+
+
+@pytest.fixture(scope="function")
+def async_context(async_runner: "AsyncRunner", async_browser, browser_context_args: dict, request):
+    """
+    Async browser context for a test; pages opened in it can be driven concurrently
+
+    Usage:
+        pages = async_runner.gather(check(await async_context.new_page()), ...)
+
+    Args:
+        async_runner: Worker event loop
+        async_browser: Async browser
+        browser_context_args: Browser context arguments
+        request: Pytest request object
+
+    Yields:
+        playwright.async_api BrowserContext
+    """
+    context = async_runner.run(async_browser.new_context(**browser_context_args))
+    if config.offline_mode or request.node.get_closest_marker("offline"):
+        from utils.offline_site import get_offline_site
+        async_runner.run(get_offline_site().install_async(context))
+
+    yield context
+
+    async_runner.run(context.close())
+
+
+@pytest.fixture(scope="session")
+def stub_server() -> Generator["StubServer", None, None]:
+    """
+    Local stand-in for the practice site, started once per session (per xdist worker)
+
+    Yields:
+        Running StubServer
+    """
+    from utils.stub_server import StubServer
+
+    server = StubServer().start()
+    yield server
+    server.stop()
+
+
 @pytest.fixture(scope="function")
-def page(context: BrowserContext, request) -> Generator[Page, None, None]:
+def stub_site(stub_server: "StubServer", request) -> Generator["StubServer", None, None]:
+    """
+    Stub server with the test's network conditions applied
+
+    Usage:
+        @pytest.mark.network_profile(latency_ms=200, jitter_ms=50, path="/automation")
+
+    Args:
+        stub_server: Session stub server
+        request: Pytest request object
+
+    Yields:
+        StubServer with network_profile markers applied
+    """
+    from utils.stub_server import RouteProfile
+
+    # Apply outermost markers first so the closest one wins
+    for marker in reversed(list(request.node.iter_markers("network_profile"))):
+        profile_args = dict(marker.kwargs)
+        path = profile_args.pop("path", None)
+        stub_server.set_profile(RouteProfile(**profile_args), path)
+
+    yield stub_server
+
+    stub_server.reset_profiles()
+
+
+@pytest.fixture(scope="session")
+def shared_page_pool(browser: "Browser", browser_context_args: dict) -> Generator["SharedPagePool", None, None]:
+    """
+    Pool of pages shared by tests marked with shared_page (one pool per worker)
+
+    Args:
+        browser: Browser fixture
+        browser_context_args: Browser context arguments
+
+    Yields:
+        SharedPagePool
+    """
+    from utils.shared_page import SharedPagePool
+
+    pool = SharedPagePool(lambda: browser.new_context(**browser_context_args))
+    yield pool
+    pool.close()
+
+
+@pytest.fixture(scope="session")
+def context_pool(browser: "Browser", browser_context_args: dict) -> Generator["ContextPool", None, None]:
+    """
+    Pool of warm browser contexts used by the page fixture when CONTEXT_POOL_SIZE > 0
+
+    Args:
+        browser: Browser fixture
+        browser_context_args: Browser context arguments
+
+    Yields:
+        ContextPool warmed with CONTEXT_POOL_SIZE contexts (one pool per worker)
+    """
+    from utils.context_pool import ContextPool
+
+    pool = ContextPool(
+        lambda: browser.new_context(**browser_context_args),
+        size=config.context_pool_size,
+        max_uses=config.context_pool_max_uses
+    )
+    pool.warm()
+    yield pool
+    pool.close()
+
+
+@pytest.fixture(scope="function")
+def page(request, browser_name: str) -> Generator["Page", None, None]:
     """
     Create a new page for each test
 
+    Tests marked with @pytest.mark.shared_page(scope="class"|"module") reuse
+    one page per class or module instead (see _shared_page). With
+    CONTEXT_POOL_SIZE > 0 the context comes from the worker's warm pool.
+
     Args:
-        context: Browser context fixture
         request: Pytest request object
+        browser_name: Browser of the test; requested statically so pytest-playwright
+            parametrizes the test per --browser (contexts are resolved dynamically below)
 
     Yields:
         Page object
     """
-    logger.info("Creating new page for test: %s", request.node.name)
+    shared_marker = request.node.get_closest_marker("shared_page")
+    if shared_marker:
+        yield from _shared_page(request, shared_marker.kwargs.get("scope", "class"))
+        return
 
-    # Start tracing if enabled
-    if config.trace_on_failure:
-        context.tracing.start(screenshots=True, snapshots=True, sources=True)
+    logger.info("Creating new page for test: %s", request.node.name)
+    pooled = None
+    if config.context_pool_size > 0:
+        pool = request.getfixturevalue("context_pool")
+        pooled = pool.checkout()
+        context = pooled.context
+    else:
+        context = request.getfixturevalue("context")
+    route_blocker = _prepare_context(context, request)
+    trace_recorder = _start_trace_chunk(context, request)
 
-    # Create new page
-    test_page = context.new_page()
+    # Create new page (pooled contexts hand out their pre-opened page)
+    test_page = pooled.take_page() if pooled else context.new_page()
 
     # Run test
     yield test_page
 
     # Post-test actions
-    _handle_test_completion(test_page, context, request)
+    if route_blocker:
+        _report_route_savings(route_blocker, request)
+    _report_performance_metrics(test_page, request)
+    # Pooled pages stay open: checkin clears their origin's storage before closing them
+    _handle_test_completion(test_page, trace_recorder, request, close_page=pooled is None)
+    if pooled:
+        failed = not hasattr(request.node, "rep_call") or request.node.rep_call.failed
+        request.node.user_properties.append(("context_pool", pool.checkin(pooled, failed)))
 
 
-def _handle_test_completion(
-    test_page: Page,
-    context: BrowserContext,
+@pytest.fixture(scope="session")
+def storage_state_cache() -> StorageStateCache:
+    """
+    Logged-in storage states shared by all workers (AUTH_STATE_DIR, AUTH_STATE_TTL_MINUTES)
+
+    Returns:
+        StorageStateCache
+    """
+    return StorageStateCache(config.auth_state_dir, config.auth_state_ttl_minutes * 60)
+
+
+@pytest.fixture(scope="function")
+def auth_user(request) -> dict:
+    """
+    Test account of the test
+
+    Usage:
+        @pytest.mark.auth_user("admin")
+
+    Args:
+        request: Pytest request object
+
+    Returns:
+        User dict from test_data/test_users.json ('user' role by default)
+    """
+    from utils.test_data import UserData
+
+    marker = request.node.get_closest_marker("auth_user")
+    return UserData.get_test_user(marker.args[0] if marker and marker.args else "user")
+
+
+@pytest.fixture(scope="function")
+def data_row(request) -> dict:
+    """
+    Record of a data-driven test
+
+    Usage:
+        @pytest.mark.data_source("test_data/contact_form_cases.csv", id_field="case")
+        def test_x(data_row): ...
+
+    Args:
+        request: Pytest request object
+
+    Returns:
+        Record dict read from the marker's data file
+    """
+    source = _marker_data_source(request.config, request.node.get_closest_marker("data_source"))
+    return source.record(request.param)
+
+
+@pytest.fixture(scope="function")
+def authenticated_context(
+    browser: "Browser",
+    browser_context_args: dict,
+    storage_state_cache: StorageStateCache,
+    auth_user: dict,
     request
+) -> Generator["BrowserContext", None, None]:
+    """
+    Browser context already logged in as the test's user
+
+    The UI login runs once per user until the cached state expires (TTL or
+    expired cookies). If a page of the test ends up back on the sign-in page,
+    the session is treated as stale and the next test logs in again. Offline
+    routing, the route policy and tracing apply as for the page fixture.
+
+    Args:
+        browser: Browser instance
+        browser_context_args: Browser context arguments
+        storage_state_cache: Storage state cache
+        auth_user: Test account
+        request: Pytest request object
+
+    Yields:
+        BrowserContext with the user's cookies and localStorage
+    """
+    from pages.login_page import LoginPage
+
+    def login() -> dict:
+        login_context = browser.new_context(**browser_context_args)
+        try:
+            login_page = LoginPage(login_context.new_page())
+            login_page.navigate()
+            if not login_page.login(auth_user["email"], auth_user["password"]):
+                raise AssertionError(
+                    f"Login failed for test user '{auth_user['email']}': {login_page.get_login_error()}"
+                )
+            return login_context.storage_state()
+        finally:
+            login_context.close()
+
+    state_path = storage_state_cache.get(auth_user["email"], login)
+    context = browser.new_context(**browser_context_args, storage_state=str(state_path))
+    route_blocker = _prepare_context(context, request)
+    trace_recorder = _start_trace_chunk(context, request)
+
+    yield context
+
+    if route_blocker:
+        _report_route_savings(route_blocker, request)
+    if trace_recorder and hasattr(request.node, "rep_call"):
+        _stop_trace_chunk(trace_recorder, request, request.node.rep_call.failed)
+    elif trace_recorder:
+        trace_recorder.stop_chunk()
+    if any(LoginPage.SIGN_IN_PATH in test_page.url for test_page in context.pages):
+        storage_state_cache.invalidate(auth_user["email"])
+    context.close()
+
+
+@pytest.fixture(scope="function")
+def authenticated_page(authenticated_context: "BrowserContext", request) -> Generator["Page", None, None]:
+    """
+    Page of a logged-in context, with the page fixture's metrics and failure artifacts
+
+    Args:
+        authenticated_context: Logged-in browser context
+        request: Pytest request object
+
+    Yields:
+        Page object
+    """
+    test_page = authenticated_context.new_page()
+
+    yield test_page
+
+    _report_performance_metrics(test_page, request)
+    # The trace chunk is stopped by authenticated_context; the page stays open for its sign-in check
+    _handle_test_completion(test_page, None, request, close_page=False)
+
+
+def _shared_page(request, scope: str) -> Generator["Page", None, None]:
+    """
+    Check out the shared page of the test's class or module
+
+    The page is reset between tests (scroll position, storage, cookies) and
+    navigations to the URL it is parked at are skipped. Pages of failed tests,
+    pages mutated through BasePage actions and pages whose session history
+    grew are discarded.
+
+    Args:
+        request: Pytest request object
+        scope: 'class' or 'module'
+
+    Yields:
+        Shared Page object
+    """
+    from pages.network_tracker import find_network_tracker
+    from pages.performance import clear_performance_metrics
+
+    owner = request.node.getparent(pytest.Class if scope == "class" else pytest.Module)
+    key = owner.nodeid if owner is not None else request.node.nodeid
+    pool = request.getfixturevalue("shared_page_pool")
+    shared_page, created = pool.checkout(key)
+    if created:
+        shared_page.route_blocker = _prepare_context(shared_page.context, request)
+    elif shared_page.route_blocker:
+        shared_page.route_blocker.reset_counts()
+
+    trace_recorder = _start_trace_chunk(shared_page.context, request)
+    clear_performance_metrics(shared_page.page)
+    network_tracker = find_network_tracker(shared_page.page)
+    if network_tracker is not None:
+        network_tracker.reset()
+
+    yield shared_page.page
+
+    if shared_page.route_blocker:
+        _report_route_savings(shared_page.route_blocker, request)
+    _report_performance_metrics(shared_page.page, request)
+    _handle_test_completion(shared_page.page, trace_recorder, request, close_page=False)
+    failed = not hasattr(request.node, "rep_call") or request.node.rep_call.failed
+    pool.checkin(shared_page, failed)
+
+
+def _prepare_context(context: "BrowserContext", request) -> "RouteBlocker | None":
+    """
+    Install offline routing and the route policy on a context
+
+    Args:
+        context: Browser context
+        request: Pytest request object
+
+    Returns:
+        RouteBlocker or None if the test runs unblocked
+    """
+    # Serve pages from local snapshots in offline mode
+    if config.offline_mode or request.node.get_closest_marker("offline"):
+        from utils.offline_site import get_offline_site
+        get_offline_site().install(context)
+
+    # Block resources the test does not need (installed last so it runs first)
+    return _install_route_blocker(context, request)
+
+
+def _install_route_blocker(context: "BrowserContext", request) -> "RouteBlocker | None":
+    """
+    Install the route policy selected for a test
+
+    Args:
+        context: Browser context
+        request: Pytest request object
+
+    Returns:
+        RouteBlocker or None if the test runs unblocked
+    """
+    from utils.route_policies import RouteBlocker, select_policy
+
+    policy_marker = request.node.get_closest_marker("route_policy")
+    override = policy_marker.args[0] if policy_marker else config.route_policy
+    marker_names = {marker.name for marker in request.node.iter_markers()}
+    policy = select_policy(marker_names, override)
+    if policy is None:
+        return None
+
+    logger.info("Applying route policy: %s", policy.name)
+    route_blocker = RouteBlocker(policy)
+    route_blocker.install(context)
+    return route_blocker
+
+
+def _report_route_savings(route_blocker: "RouteBlocker", request) -> None:
+    """
+    Log and record what the route policy saved for a test
+
+    Args:
+        route_blocker: Route blocker used by the test
+        request: Pytest request object
+    """
+    savings = route_blocker.summary()
+    logger.info(
+        "Route policy %s blocked %d requests (~%d KB saved, estimated from typical resource sizes)",
+        savings["policy"], savings["blocked_requests"], savings["estimated_bytes_saved"] // 1024
+    )
+    request.node.user_properties.append(("route_policy_savings", savings))
+
+
+def _report_performance_metrics(test_page: "Page", request) -> None:
+    """
+    Record the performance metrics and request counts of the test's navigations and attach the metrics to Allure
+
+    Args:
+        test_page: Page object
+        request: Pytest request object
+    """
+    from playwright.sync_api import Error
+    from pages.network_tracker import find_network_tracker
+    from pages.performance import collect_performance_metrics, get_performance_metrics
+
+    network_tracker = find_network_tracker(test_page)
+    if network_tracker is not None and network_tracker.request_count:
+        request.node.user_properties.append(("network", network_tracker.stats()))
+
+    metrics = get_performance_metrics(test_page)
+    if not metrics:
+        return
+    # navigate() reads metrics at DOMContentLoaded; re-read the last document, usually loaded by now,
+    # so its load, FCP and LCP are filled in
+    if not test_page.is_closed():
+        try:
+            collect_performance_metrics(test_page)
+            metrics = get_performance_metrics(test_page)
+        except Error as e:
+            logger.debug("Final performance metrics unavailable: %s", e)
+    request.node.user_properties.append(("performance_metrics", metrics))
+    if ALLURE_AVAILABLE:
+        import allure
+        allure.attach(
+            json.dumps(metrics, indent=2),
+            name="Performance Metrics",
+            attachment_type=allure.attachment_type.JSON
+        )
+
+
+def _start_trace_chunk(context: "BrowserContext", request) -> "TraceRecorder | None":
+    """
+    Start the test's trace chunk according to TRACE_MODE
+
+    Tracing is started once per context; each test records its own chunk,
+    so long-lived (pooled, shared) contexts only pay for chunk boundaries.
+
+    Args:
+        context: Browser context
+        request: Pytest request object
+
+    Returns:
+        TraceRecorder or None if the test is not traced
+    """
+    from utils.trace_recorder import get_trace_recorder, should_record
+
+    if not should_record(config.trace_mode, getattr(request.node, "execution_count", 1)):
+        return None
+    trace_recorder = get_trace_recorder(context, config.trace_level)
+    trace_recorder.start_chunk(request.node.nodeid)
+    return trace_recorder
+
+
+def _stop_trace_chunk(trace_recorder: "TraceRecorder", request, failed: bool) -> None:
+    """
+    Stop the test's trace chunk, save it if the trace mode keeps it and record the chunk start/stop time
+
+    Args:
+        trace_recorder: Recorder returned by _start_trace_chunk
+        request: Pytest request object
+        failed: Whether the test failed
+    """
+    from utils.artifact_writer import get_artifact_writer
+    from utils.trace_recorder import should_keep
+
+    trace_path = None
+    if should_keep(config.trace_mode, failed):
+        trace_dir = create_directory("traces")
+        trace_path = trace_dir / f"{request.node.name}_{get_timestamp()}.zip"
+
+    chunk_ms = trace_recorder.stop_chunk(str(trace_path) if trace_path else None)
+    logger.info("Trace chunk start/stop time (%s): %.1f ms", trace_recorder.level, chunk_ms)
+    request.node.user_properties.append((
+        "trace_chunk_time",
+        {"mode": config.trace_mode, "level": trace_recorder.level, "chunk_ms": round(chunk_ms, 1)}
+    ))
+    if trace_path is None:
+        return
+
+    logger.info("Trace saved: %s", trace_path)
+    # Attach to Allure report by path (copied in the background)
+    get_artifact_writer().attach(trace_path, "Trace", attachment_type="application/zip", extension="zip")
+
+
+def _handle_test_completion(
+    test_page: "Page",
+    trace_recorder: "TraceRecorder | None",
+    request,
+    close_page: bool = True
 ) -> None:
     """
     Handle test completion (screenshot, trace, cleanup)
 
     Args:
         test_page: Page object
-        context: Browser context
+        trace_recorder: Recorder of the test's trace chunk, or None if not traced
         request: Pytest request object
+        close_page: Whether to close the page (False for shared pages)
     """
     # Get test result
     if not hasattr(request.node, 'rep_call'):
+        if trace_recorder:
+            trace_recorder.stop_chunk()
         return
 
     # Handle test failure
     if request.node.rep_call.failed:
         logger.error("Test FAILED: %s", request.node.name)
 
-        # Take screenshot on failure
+        # Take screenshot on failure; the file and Allure attachment are written in the background
         if config.screenshot_on_failure:
+            from utils.artifact_writer import get_artifact_writer
             screenshot_dir = create_directory("screenshots")
             screenshot_name = f"{request.node.name}_{get_timestamp()}.png"
-            screenshot_path = screenshot_dir / screenshot_name
-            test_page.screenshot(path=str(screenshot_path), full_page=True)
-            logger.info("Screenshot saved: %s", screenshot_path)
-
-            # Attach to Allure report if available
-            if ALLURE_AVAILABLE:
-                allure.attach.file(
-                    str(screenshot_path),
-                    name="Failure Screenshot",
-                    attachment_type=allure.attachment_type.PNG
-                )
+            get_artifact_writer().write(
+                screenshot_dir / screenshot_name,
+                test_page.screenshot(full_page=True),
+                allure_name="Failure Screenshot",
+                attachment_type="image/png",
+                extension="png"
+            )
 
-        # Save trace on failure
-        if config.trace_on_failure:
-            trace_dir = create_directory("traces")
-            trace_name = f"{request.node.name}_{get_timestamp()}.zip"
-            trace_path = trace_dir / trace_name
-            context.tracing.stop(path=str(trace_path))
-            logger.info("Trace saved: %s", trace_path)
-
-            # Attach to Allure report if available
-            if ALLURE_AVAILABLE:
-                with open(trace_path, 'rb') as trace_file:
-                    allure.attach(
-                        trace_file.read(),
-                        name="Trace",
-                        attachment_type="application/zip",
-                        extension=".zip"
-                    )
     else:
         logger.info("Test PASSED: %s", request.node.name)
-        if config.trace_on_failure:
-            context.tracing.stop()
 
-    test_page.close()
+    if trace_recorder:
+        _stop_trace_chunk(trace_recorder, request, request.node.rep_call.failed)
+
+    if close_page:
+        test_page.close()
 
 
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
@@ -203,6 +805,114 @@ def pytest_runtest_makereport(item, call):
     # Store test result in item for later access
     setattr(item, f"rep_{rep.when}", rep)
 
+    # Show the test's performance metrics in the HTML report
+    test_page = getattr(item, "funcargs", {}).get("page") if rep.when == "call" else None
+    if PYTEST_HTML_AVAILABLE and test_page is not None:
+        from pages.performance import get_performance_metrics
+        metrics = get_performance_metrics(test_page)
+        if metrics:
+            rep.extras = getattr(rep, "extras", []) + [html_extras.json(metrics, name="Performance Metrics")]
+
+
+def pytest_terminal_summary(terminalreporter):
+    """
+    Summarize route policy savings, action timing and trace chunk start/stop time across the session
+
+    Args:
+        terminalreporter: Terminal reporter plugin
+    """
+    blocked_requests = 0
+    bytes_saved = 0
+    traced_tests = 0
+    tracing_ms = 0.0
+    action_totals: dict[str, dict] = {}
+    for reports in terminalreporter.stats.values():
+        for report in reports:
+            if getattr(report, "when", None) != "teardown":
+                continue
+            for name, value in report.user_properties:
+                if name == "route_policy_savings":
+                    blocked_requests += value["blocked_requests"]
+                    bytes_saved += value["estimated_bytes_saved"]
+                elif name == "trace_chunk_time":
+                    traced_tests += 1
+                    tracing_ms += value["chunk_ms"]
+                elif name == "action_timing":
+                    for action, totals in value.items():
+                        entry = action_totals.setdefault(action, dict.fromkeys(totals, 0))
+                        for key, amount in totals.items():
+                            entry[key] += amount
+
+    if blocked_requests:
+        terminalreporter.write_sep("-", "route policy savings")
+        terminalreporter.write_line(
+            f"Blocked {blocked_requests} requests, ~{bytes_saved / 1024 / 1024:.1f} MB not downloaded "
+            f"(estimated from typical resource sizes, not measured)"
+        )
+
+    if action_totals:
+        _write_action_timing_table(terminalreporter, action_totals)
+
+    if traced_tests:
+        terminalreporter.write_sep("-", "trace chunk start/stop time")
+        terminalreporter.write_line(
+            f"{config.trace_mode} ({config.trace_level}): {tracing_ms / 1000:.2f} s over {traced_tests} tests, "
+            f"{tracing_ms / traced_tests:.1f} ms per test"
+        )
+        terminalreporter.write_line(
+            "Excludes the slowdown of traced actions; compare traced vs untraced with python -m benchmarks.run "
+            "--groups browser"
+        )
+
+
+def _write_action_timing_table(terminalreporter, action_totals: dict) -> None:
+    """
+    Write the per-action timing table, slowest actions first
+
+    Args:
+        terminalreporter: Terminal reporter plugin
+        action_totals: Dict mapping action name to summed {'calls', 'total_ms', 'wait_ms', 'exec_ms', 'errors'}
+    """
+    terminalreporter.write_sep("-", "action timing")
+    terminalreporter.write_line(
+        f"{'action':<28}{'calls':>7}{'total s':>10}{'mean ms':>10}{'wait s':>9}{'exec s':>9}{'errors':>8}"
+    )
+    for action, totals in sorted(action_totals.items(), key=lambda item: item[1]["total_ms"], reverse=True):
+        terminalreporter.write_line(
+            f"{action:<28}{totals['calls']:>7}{totals['total_ms'] / 1000:>10.2f}"
+            f"{totals['total_ms'] / totals['calls']:>10.1f}{totals['wait_ms'] / 1000:>9.2f}"
+            f"{totals['exec_ms'] / 1000:>9.2f}{totals['errors']:>8}"
+        )
+
+
+@pytest.fixture(scope="function", autouse=True)
+def action_timing(request):
+    """
+    Time page object actions of each test when ACTION_TIMING is enabled
+
+    Events go to reports/action_timing/<test>.jsonl; per-action totals go to
+    user_properties and the terminal summary.
+
+    Args:
+        request: Pytest request object
+    """
+    if not config.action_timing:
+        yield
+        return
+
+    from utils.action_timing import start_action_timing, stop_action_timing
+    from utils.artifact_writer import get_artifact_writer
+
+    start_action_timing(request.node.nodeid)
+    yield
+    timer = stop_action_timing()
+    if timer.events:
+        timing_dir = create_directory("reports/action_timing")
+        get_artifact_writer().write(
+            timing_dir / f"{sanitize_filename(request.node.nodeid)}.jsonl", timer.to_jsonl()
+        )
+        request.node.user_properties.append(("action_timing", timer.summary()))
+
 
 @pytest.fixture(scope="function", autouse=True)
 def log_test_info(request):
@@ -0,0 +1,31 @@
+"""
+Context Pool Tests
+Isolation of pooled browser contexts, served from the local stub server
+"""
+from utils.context_pool import ContextPool
+
+
+class TestContextPool:
+    """Isolation of pooled browser contexts between tests"""
+
+    def test_storage_does_not_leak_to_next_test(self, browser, browser_context_args, stub_server):
+        """Test that localStorage set by one test is gone for the next test served by the same context"""
+        pool = ContextPool(lambda: browser.new_context(**browser_context_args), size=1)
+        pool.warm()
+        try:
+            # First test: the page fixture checks the context in while the test page is still open
+            first = pool.checkout()
+            first_page = first.take_page()
+            first_page.goto(stub_server.url_for("/automation"))
+            first_page.evaluate("() => localStorage.setItem('leak', 'first test')")
+            assert pool.checkin(first, failed=False)["action"] == "reset"
+
+            # Next test on the same context
+            second = pool.checkout()
+            assert second.context is first.context
+            second_page = second.take_page()
+            second_page.goto(stub_server.url_for("/automation"))
+            assert second_page.evaluate("() => localStorage.getItem('leak')") is None
+            pool.checkin(second, failed=False)
+        finally:
+            pool.close()
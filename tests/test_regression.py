@@ -4,6 +4,7 @@ Comprehensive tests for all functionality
 """
 import pytest
 from pages.automation_page import AutomationPage
+from utils.shared_page import get_shared_page
 
 
 @pytest.mark.regression
@@ -38,18 +39,35 @@ class TestNavigationLinks:
         """Test navigation to Fake Pricing Page"""
         automation_page = AutomationPage(page)
         automation_page.navigate()
+        start_url = automation_page.get_url()
         
-        # Click link
+        # Click link and wait for navigation
         automation_page.click_fake_pricing_page_link()
-        
-        # Wait a bit for navigation
-        page.wait_for_timeout(2000)
+        automation_page.wait_for_url_change(start_url, timeout=10000)
         
         # Verify URL changed
         assert "pricing" in page.url.lower()
 
+    def test_practice_links_navigate_concurrently(self, page):
+        """Test all practice links in parallel tabs"""
+        automation_page = AutomationPage(page)
+        automation_page.navigate()
+
+        results = automation_page.follow_links_concurrently([
+            automation_page.BIG_PAGE_LINK,
+            automation_page.FAKE_LANDING_PAGE_LINK,
+            automation_page.FAKE_PRICING_PAGE_LINK,
+        ])
+
+        expected_paths = ["complicated-page", "fake-landing-page", "fake-pricing-page"]
+        for result, expected_path in zip(results, expected_paths):
+            assert result["error"] is None, f"{result['locator']}: {result['error']}"
+            assert expected_path in result["url"]
+            assert result["status"] is not None and result["status"] < 400
+
 
 @pytest.mark.regression
+@pytest.mark.shared_page(scope="class")
 class TestPageElements:
     """Test page element visibility and interaction"""
 
@@ -70,13 +88,13 @@ class TestPageElements:
         automation_page.navigate()
         
         # Check at least 3 social icons are present
-        social_icons = [
-            automation_page.is_visible(automation_page.LINKEDIN_ICON),
-            automation_page.is_visible(automation_page.TWITTER_ICON),
-            automation_page.is_visible(automation_page.FACEBOOK_ICON),
-            automation_page.is_visible(automation_page.INSTAGRAM_ICON),
-        ]
-        assert sum(social_icons) >= 3
+        social_icons = automation_page.are_visible([
+            automation_page.LINKEDIN_ICON,
+            automation_page.TWITTER_ICON,
+            automation_page.FACEBOOK_ICON,
+            automation_page.INSTAGRAM_ICON,
+        ])
+        assert sum(social_icons.values()) >= 3
 
     def test_page_heading_contains_text(self, page):
         """Test that page heading contains expected text"""
@@ -86,3 +104,99 @@ class TestPageElements:
         heading = automation_page.get_page_heading_text()
         assert "Automation" in heading
         assert "Practice" in heading
+
+    def test_page_properties_from_snapshot(self, page, monkeypatch):
+        """Test that capturing and reading many properties costs one round trip and a DOM change invalidates it"""
+        automation_page = AutomationPage(page)
+        automation_page.navigate()
+
+        evaluate, get_element = page.evaluate, automation_page._get_element
+        evaluations, element_queries = [], []
+        monkeypatch.setattr(page, "evaluate", lambda *args: evaluations.append(args) or evaluate(*args))
+        monkeypatch.setattr(
+            automation_page, "_get_element", lambda *args: element_queries.append(args) or get_element(*args)
+        )
+
+        snapshot = automation_page.snapshot()
+        assert "Automation" in automation_page.get_page_heading_text()
+        assert automation_page.is_visible(automation_page.BIG_PAGE_LINK)
+        assert automation_page.get_attribute(automation_page.FAKE_PRICING_PAGE_LINK, "href")
+        assert automation_page.get_element_count(automation_page.PAGE_TITLE) >= 1
+        assert len(evaluations) == 1
+        assert not element_queries
+
+        # A page script changes the DOM behind the page object's back; the page is shared
+        # with the rest of the class, so it is discarded after this test
+        get_shared_page(page).mark_dirty()
+        mark_changed = "(css) => document.querySelector(css).setAttribute('data-changed', 'yes')"
+        evaluate(mark_changed, automation_page.BIG_PAGE_LINK)
+        assert not snapshot.is_fresh()
+        assert automation_page.get_attribute(automation_page.BIG_PAGE_LINK, "data-changed") == "yes"
+        assert element_queries
+
+
+@pytest.mark.regression
+@pytest.mark.offline
+class TestLocalSiteNavigation:
+    """Navigation tests against the local stub server under known network conditions"""
+
+    @pytest.mark.network_profile(latency_ms=150, jitter_ms=50)
+    def test_navigate_to_big_page_with_latency(self, page, stub_site):
+        """Test navigation to Big Page with injected latency"""
+        automation_page = AutomationPage(page)
+        automation_page.navigate(stub_site.url_for("/automation"))
+
+        automation_page.click_big_page_link()
+        automation_page.wait_for_url("**/complicated-page**", timeout=10000)
+
+        assert "complicated-page" in page.url
+
+    @pytest.mark.network_profile(bandwidth_kbps=256, path="/fake-landing-page")
+    def test_navigate_to_fake_landing_page_throttled(self, page, stub_site):
+        """Test navigation to Fake Landing Page with a throughput cap"""
+        automation_page = AutomationPage(page)
+        automation_page.navigate(stub_site.url_for("/automation"))
+
+        automation_page.click_fake_landing_page_link()
+        automation_page.wait_for_url("**/fake-landing-page**", timeout=10000)
+
+        assert "landing" in page.url.lower()
+
+    @pytest.mark.network_profile(latency_ms=300, path="/automation")
+    def test_performance_budget_catches_slow_document(self, page, stub_site):
+        """Test that the performance budget fails on a slow document and passes a realistic budget"""
+        automation_page = AutomationPage(page)
+        automation_page.navigate(stub_site.url_for("/automation"))
+
+        metrics = automation_page.assert_performance_budget(ttfb_ms=5000, cls=0.25, transfer_bytes=5_000_000)
+        assert metrics["ttfb_ms"] >= 300
+
+        with pytest.raises(AssertionError, match="ttfb_ms"):
+            automation_page.assert_performance_budget(ttfb_ms=100)
+
+
+@pytest.mark.regression
+class TestConcurrentNavigation:
+    """Navigation checks driven concurrently through the async page objects"""
+
+    def test_practice_pages_load_concurrently(self, async_runner, async_context):
+        """Test navigation to Big Page, Fake Landing Page and Fake Pricing Page concurrently"""
+        # Imported here so collecting the suite does not load playwright.async_api
+        from pages.async_automation_page import AsyncAutomationPage
+
+        async def follow_link(click_link, url_pattern):
+            automation_page = AsyncAutomationPage(await async_context.new_page())
+            await automation_page.navigate()
+            await click_link(automation_page)
+            await automation_page.wait_for_url(url_pattern, timeout=10000)
+            return automation_page.get_url()
+
+        big_page_url, landing_url, pricing_url = async_runner.gather(
+            follow_link(AsyncAutomationPage.click_big_page_link, "**/complicated-page**"),
+            follow_link(AsyncAutomationPage.click_fake_landing_page_link, "**/fake-landing-page**"),
+            follow_link(AsyncAutomationPage.click_fake_pricing_page_link, "**/fake-pricing-page**"),
+        )
+
+        assert "complicated-page" in big_page_url
+        assert "landing" in landing_url.lower()
+        assert "pricing" in pricing_url.lower()
@@ -8,6 +8,7 @@ from pages.automation_page import AutomationPage
 
 @pytest.mark.smoke
 @pytest.mark.critical
+@pytest.mark.shared_page(scope="class")
 class TestBasicFunctionality:
     """Basic smoke tests for critical functionality"""
 
@@ -41,3 +42,16 @@ class TestBasicFunctionality:
             automation_page.is_facebook_icon_visible() or
             automation_page.is_linkedin_icon_visible()
         )
+
+
+@pytest.mark.smoke
+@pytest.mark.offline
+class TestOfflineSnapshot:
+    """Smoke tests served from local snapshots (no network access)"""
+
+    def test_page_loads_from_snapshot(self, page):
+        """Test that the automation page loads from its snapshot"""
+        automation_page = AutomationPage(page)
+        automation_page.navigate()
+        assert automation_page.verify_page_loaded()
+        assert automation_page.has_navigation_links()
@@ -0,0 +1,102 @@
+"""
+Action Timing Unit Tests
+Probe timeout budget and timer lifecycle, with a stub page object
+"""
+import pytest
+
+from utils.action_timing import start_action_timing, stop_action_timing, timed_action
+
+
+class StubLocator:
+    """Stand-in for a Playwright Locator that records wait_for timeouts"""
+
+    def __init__(self, waits: list):
+        """Initialize stub locator"""
+        self.waits = waits
+
+    @property
+    def first(self) -> "StubLocator":
+        """First match"""
+        return self
+
+    def wait_for(self, state: str, timeout: float) -> None:
+        """Record the probe's timeout"""
+        self.waits.append(timeout)
+
+
+class StubPageObject:
+    """Page object with one probed and one unprobed action"""
+
+    def __init__(self):
+        """Initialize stub page object"""
+        self.timeout = 30000
+        self.probe_timeouts: list = []
+        self.action_timeouts: list = []
+
+    def _snapshot_entry(self, locator):
+        """No DOM snapshot is fresh"""
+        return None
+
+    def _get_element(self, locator) -> StubLocator:
+        """Locator recording the probe"""
+        return StubLocator(self.probe_timeouts)
+
+    @timed_action("action", probe=True)
+    def click(self, locator: str, timeout=None) -> None:
+        """Probed action"""
+        self.action_timeouts.append(timeout)
+
+    @timed_action("action")
+    def hover(self, locator: str) -> None:
+        """Unprobed action"""
+        self.action_timeouts.append(None)
+
+
+@pytest.fixture
+def timer():
+    """Action timer active for the test"""
+    yield start_action_timing("tests/unit/test_action_timing.py::test")
+    stop_action_timing()
+
+
+class TestTimedAction:
+    """timed_action decorator"""
+
+    def test_probe_passes_remaining_budget(self, timer):
+        """Test that the action gets the caller's timeout minus the probe time, never more"""
+        page_object = StubPageObject()
+        page_object.click("#button", timeout=5000)
+
+        assert page_object.probe_timeouts == [5000]
+        assert 1 <= page_object.action_timeouts[0] <= 5000
+        assert timer.events[0]["action"] == "click"
+
+    def test_probe_uses_page_timeout_by_default(self, timer):
+        """Test that a call without a timeout probes with the page object's timeout"""
+        page_object = StubPageObject()
+        page_object.click("#button")
+
+        assert page_object.probe_timeouts == [30000]
+        assert page_object.action_timeouts[0] <= 30000
+
+    def test_unprobed_action_does_not_wait(self, timer):
+        """Test that an action without probe runs straight away"""
+        page_object = StubPageObject()
+        page_object.hover("#menu")
+
+        assert not page_object.probe_timeouts
+        assert timer.events[0]["action"] == "hover"
+
+    def test_probe_requires_timeout_parameter(self):
+        """Test that probing a method without a timeout parameter is rejected at definition"""
+        with pytest.raises(TypeError, match="timeout parameter"):
+            timed_action("action", probe=True)(lambda self, locator: None)
+
+    def test_no_recording_without_timer(self):
+        """Test that actions run undecorated and unrecorded outside action timing"""
+        page_object = StubPageObject()
+        page_object.click("#button", timeout=5000)
+
+        assert page_object.probe_timeouts == []
+        assert page_object.action_timeouts == [5000]
+        assert stop_action_timing() is None
@@ -0,0 +1,63 @@
+"""
+Artifact Writer Unit Tests
+Background writes, the pending-artifact bound and the private Allure API the deferred attach relies on
+"""
+import inspect
+import threading
+
+import pytest
+
+from utils.artifact_writer import ArtifactWriter
+
+
+class TestAllureContract:
+    """The allure-pytest internals pinned in requirements.txt"""
+
+    def test_reporter_attach_signature(self):
+        """Test that AllureReporter._attach still exists and takes the arguments the deferred attach passes"""
+        reporter = pytest.importorskip("allure_commons.reporter")
+        attach = getattr(reporter.AllureReporter, "_attach", None)
+
+        assert attach is not None, "AllureReporter._attach is gone; update utils.artifact_writer for this allure"
+        parameters = inspect.signature(attach).parameters
+        assert list(parameters)[:5] == ["self", "uuid", "name", "attachment_type", "extension"]
+
+
+class TestArtifactWriter:
+    """Background writes"""
+
+    def test_write_and_flush(self, tmp_path):
+        """Test that queued artifacts are on disk after flush"""
+        writer = ArtifactWriter(max_workers=2, max_pending=2)
+        for index in range(5):
+            writer.write(tmp_path / "shots" / f"{index}.png", b"png")
+
+        assert writer.flush() == 0
+        assert sorted(path.name for path in (tmp_path / "shots").iterdir()) == [f"{i}.png" for i in range(5)]
+        writer.close()
+
+    def test_pending_artifacts_bounded(self):
+        """Test that submit blocks while max_pending artifacts are in flight and frees the slot when done"""
+        writer = ArtifactWriter(max_workers=1, max_pending=1)
+        release = threading.Event()
+        writer._submit(release.wait)
+
+        blocked = threading.Thread(target=writer._submit, args=(lambda: None,))
+        blocked.start()
+        blocked.join(timeout=0.2)
+        assert blocked.is_alive()
+
+        release.set()
+        blocked.join(timeout=5)
+        assert not blocked.is_alive()
+        assert writer.flush(timeout=5) == 0
+        writer.close()
+
+    def test_slot_released_when_submit_fails(self):
+        """Test that a failed submit does not use up a pending slot"""
+        writer = ArtifactWriter(max_workers=1, max_pending=1)
+        writer.executor.shutdown()
+
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                writer._submit(lambda: None)
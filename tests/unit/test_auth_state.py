@@ -0,0 +1,52 @@
+"""
+Storage State Cache Unit Tests
+Logins shared across processes, expiry and invalidation
+"""
+import multiprocessing
+import time
+
+from utils.auth_state import StorageStateCache
+
+
+def _shared_login(directory: str) -> str:
+    """Get the cached state of one user from a separate process, counting the logins it performs"""
+    def login() -> dict:
+        with open(f"{directory}/logins.txt", "a", encoding="utf-8") as f:
+            f.write("login\n")
+        # Keep the lock held long enough for the other processes to queue on it
+        time.sleep(0.5)
+        return {"cookies": [{"name": "session", "expires": time.time() + 3600}], "origins": []}
+
+    return str(StorageStateCache(f"{directory}/auth", ttl_seconds=60).get("user@example.com", login))
+
+
+class TestStorageStateCache:
+    """Login shared across processes through the storage state cache"""
+
+    def test_processes_share_one_login(self, tmp_path):
+        """Test that concurrent processes log the same user in once and reuse the saved state"""
+        with multiprocessing.get_context("spawn").Pool(4) as pool:
+            paths = pool.map(_shared_login, [str(tmp_path)] * 4)
+
+        assert len(set(paths)) == 1
+        assert (tmp_path / "logins.txt").read_text(encoding="utf-8").count("login") == 1
+        assert not list((tmp_path / "auth").glob("*.lock"))
+
+    def test_expired_or_invalidated_state_logs_in_again(self, tmp_path):
+        """Test that an expired cookie and an explicit invalidation both trigger a new login"""
+        cache = StorageStateCache(tmp_path, ttl_seconds=60)
+        logins = []
+
+        def login() -> dict:
+            logins.append(time.time())
+            expires = time.time() - 1 if len(logins) == 1 else time.time() + 3600
+            return {"cookies": [{"name": "session", "expires": expires}], "origins": []}
+
+        cache.get("user", login)
+        cache.get("user", login)
+        cache.get("user", login)
+        assert len(logins) == 2
+
+        cache.invalidate("user")
+        cache.get("user", login)
+        assert len(logins) == 3
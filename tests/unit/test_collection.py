@@ -0,0 +1,33 @@
+"""
+Collection Unit Tests
+Test ids produced by the framework's fixtures, checked without launching a browser
+"""
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+def collect_ids(*args: str) -> list[str]:
+    """Collect test ids in a separate pytest process"""
+    result = subprocess.run(
+        [sys.executable, "-m", "pytest", "--collect-only", "-q", "-o", "addopts=", "-p", "no:cacheprovider", *args],
+        cwd=ROOT, capture_output=True, text=True, timeout=120,
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
+    return [line for line in result.stdout.splitlines() if "::" in line]
+
+
+class TestMultiBrowserCollection:
+    """pytest-playwright --browser parametrization of page tests"""
+
+    def test_page_tests_collected_per_browser(self):
+        """Test that every page test is collected once per --browser, with the browser in its id"""
+        ids = collect_ids("tests/test_smoke.py", "--browser", "chromium", "--browser", "firefox")
+
+        chromium = {test_id.removesuffix("[chromium]") for test_id in ids if test_id.endswith("[chromium]")}
+        firefox = {test_id.removesuffix("[firefox]") for test_id in ids if test_id.endswith("[firefox]")}
+        assert chromium
+        assert chromium == firefox
+        assert len(ids) == 2 * len(chromium)
@@ -0,0 +1,29 @@
+"""
+Data Pool Unit Tests
+Seeded pool generation and per-worker slicing
+"""
+from utils.data_pool import USER_SCHEMA, DataPool, load_pool, worker_slice
+
+
+class TestDataPools:
+    """Seeded, pre-generated test data"""
+
+    def test_seeded_pool_is_reproducible_and_split_between_workers(self, tmp_path):
+        """Test that a seed always yields the same users and worker slices partition the pool"""
+        first = load_pool(USER_SCHEMA, size=50, seed=7, directory=tmp_path / "first")
+        second = load_pool(USER_SCHEMA, size=50, seed=7, directory=tmp_path / "second")
+        assert first == second
+        assert len(set(first["email"])) == 50
+
+        slices = [set(worker_slice(50, f"gw{index}", 3)) for index in range(3)]
+        assert sum(len(indices) for indices in slices) == 50
+        assert set().union(*slices) == set(range(50))
+
+    def test_take_stays_in_the_worker_slice_and_wraps(self):
+        """Test that records come from the worker's slice in order and start over once it is used up"""
+        columns = {"email": [f"user{index}@example.com" for index in range(6)]}
+        pool = DataPool(USER_SCHEMA, columns, seed=7, indices=worker_slice(6, "gw1", 2))
+
+        assert [record["email"] for record in pool.take(4)] == [
+            "user3@example.com", "user4@example.com", "user5@example.com", "user3@example.com"
+        ]
@@ -0,0 +1,37 @@
+"""
+Data Source Unit Tests
+Streamed records, stable ids and data_source parametrization
+"""
+import json
+
+import pytest
+from utils.data_source import DataSource
+
+
+class TestDataSources:
+    """Streaming data-driven parametrization"""
+
+    @pytest.mark.data_source("test_data/contact_form_cases.csv", id_field="case")
+    def test_contact_form_case_matches_required_fields(self, data_row):
+        """Test that each contact form case is marked valid exactly when name and message are filled"""
+        assert (data_row["valid"] == "true") == bool(data_row["name"] and data_row["message"])
+
+    def test_formats_stream_the_same_records(self, tmp_path):
+        """Test that JSON-lines, multi-document YAML and XLSX yield the same records and stable ids"""
+        from openpyxl import Workbook
+
+        rows = [{"id": "first", "value": 1}, {"id": "first", "value": 2}, {"id": None, "value": 3}]
+        (tmp_path / "rows.jsonl").write_text("\n".join(json.dumps(row) for row in rows), encoding="utf-8")
+        (tmp_path / "rows.yaml").write_text(
+            "\n---\n".join(f"id: {row['id'] or 'null'}\nvalue: {row['value']}" for row in rows), encoding="utf-8"
+        )
+        workbook = Workbook()
+        workbook.active.append(["id", "value"])
+        for row in rows:
+            workbook.active.append([row["id"], row["value"]])
+        workbook.save(tmp_path / "rows.xlsx")
+
+        for name in ("rows.jsonl", "rows.yaml", "rows.xlsx"):
+            source = DataSource(tmp_path / name)
+            assert source.ids() == ["first", "first-2", "row3"]
+            assert [source.record(index)["value"] for index in (0, 2, 1)] == [1, 3, 2]
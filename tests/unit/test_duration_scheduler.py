@@ -0,0 +1,204 @@
+"""
+Duration Scheduler Unit Tests
+Estimate fallbacks, history smoothing, LPT makespan and dispatch order with stub xdist workers
+"""
+import pytest
+
+from utils.duration_scheduler import (
+    DEFAULT_ESTIMATE,
+    DurationHistory,
+    DurationSchedulingMixin,
+    _estimate_groups,
+    lpt_makespan,
+)
+
+
+class StubNode:
+    """Stand-in for an xdist WorkerController"""
+
+    def __init__(self, name: str):
+        """Initialize stub worker"""
+        self.name = name
+        self.shutting_down = False
+        self.sent: list[int] = []
+
+    def send_runtest_some(self, indices: list[int]) -> None:
+        """Record the tests sent to the worker"""
+        self.sent.extend(indices)
+
+    def shutdown(self) -> None:
+        """Mark the worker as shutting down"""
+        self.shutting_down = True
+
+
+class StubLoadScheduling:
+    """The parts of xdist's LoadScheduling the mixin relies on"""
+
+    def __init__(self, config, log=None):
+        """Initialize stub scheduler state"""
+        self.config = config
+        self.node2collection: dict = {}
+        self.node2pending: dict = {}
+        self.pending: list[int] = []
+        self.collection: list[str] | None = None
+        self.messages: list = []
+
+    def log(self, *args) -> None:
+        """Record log messages"""
+        self.messages.append(args)
+
+    @property
+    def nodes(self) -> list:
+        """Workers known to the scheduler"""
+        return list(self.node2pending)
+
+    @property
+    def collection_is_completed(self) -> bool:
+        """Every worker has reported its collection"""
+        return bool(self.node2collection)
+
+    def _check_nodes_have_same_collection(self) -> bool:
+        """Every worker collected the same tests"""
+        return len({tuple(collection) for collection in self.node2collection.values()}) == 1
+
+    def _send_tests(self, node: StubNode, num: int) -> None:
+        """Move the next pending tests to the worker"""
+        tests = self.pending[:num]
+        if tests:
+            del self.pending[:num]
+            self.node2pending[node].extend(tests)
+            node.send_runtest_some(tests)
+
+    def mark_test_complete(self, node: StubNode, item_index: int, duration: float = 0) -> None:
+        """Drop a finished test from the worker and top it up"""
+        self.node2pending[node].remove(item_index)
+        self.check_schedule(node, duration=duration)
+
+
+class StubDurationScheduling(DurationSchedulingMixin, StubLoadScheduling):
+    """Duration scheduling on top of the stub xdist scheduler"""
+
+
+class TestEstimates:
+    """Duration history and estimate fallbacks"""
+
+    def test_estimate_groups_closest_first(self):
+        """Test that a test falls back to its parametrization group, then class, then module"""
+        assert _estimate_groups("tests/test_a.py::TestA::test_b[1]") == [
+            "tests/test_a.py::TestA::test_b",
+            "tests/test_a.py::TestA",
+            "tests/test_a.py",
+        ]
+        assert _estimate_groups("tests/test_a.py::test_c") == ["tests/test_a.py::test_c", "tests/test_a.py"]
+
+    def test_record_smooths_runs(self):
+        """Test that a new run moves the average halfway towards it"""
+        history = DurationHistory()
+        history.record("tests/test_a.py::test_b", 10.0)
+        assert history.durations["tests/test_a.py::test_b"] == 10.0
+
+        history.record("tests/test_a.py::test_b", 20.0)
+        assert history.durations["tests/test_a.py::test_b"] == 15.0
+
+    def test_estimate_fallback_chain(self):
+        """Test that unknown tests take the mean of their closest known group, else the median"""
+        history = DurationHistory({
+            "tests/test_a.py::TestA::test_b[1]": 8.0,
+            "tests/test_a.py::TestA::test_c": 2.0,
+            "tests/test_a.py::TestB::test_d": 6.0,
+            "tests/test_e.py::test_f": 1.0,
+            "tests/test_e.py::test_g": 3.0,
+        })
+
+        estimates = history.estimate_all([
+            "tests/test_a.py::TestA::test_b[1]",
+            "tests/test_a.py::TestA::test_b[2]",
+            "tests/test_a.py::TestA::test_new",
+            "tests/test_a.py::TestNew::test_new",
+            "tests/test_new.py::test_new",
+        ])
+
+        assert estimates == [
+            8.0,  # known
+            8.0,  # other parametrization
+            pytest.approx(5.0),  # class mean of 8 and 2
+            pytest.approx(16.0 / 3),  # module mean of 8, 2 and 6
+            3.0,  # median of all known tests
+        ]
+
+    def test_estimate_without_history(self):
+        """Test that every test gets the default estimate on the first run"""
+        assert DurationHistory().estimate_all(["tests/test_a.py::test_b"]) == [DEFAULT_ESTIMATE]
+
+    @pytest.mark.parametrize("estimates, workers, makespan", [
+        ([5.0, 4.0, 3.0, 3.0, 3.0], 2, 10.0),  # LPT, not the optimal 9
+        ([7.0, 1.0, 1.0, 1.0], 2, 7.0),
+        ([2.0, 2.0, 2.0], 1, 6.0),
+        ([2.0, 2.0], 0, 4.0),
+        ([], 3, 0.0),
+    ])
+    def test_lpt_makespan(self, estimates, workers, makespan):
+        """Test the simulated longest-first makespan"""
+        assert lpt_makespan(estimates, workers) == makespan
+
+
+class TestDurationScheduling:
+    """Dispatch order with stub xdist workers"""
+
+    COLLECTION = [
+        "tests/test_a.py::test_short",
+        "tests/test_a.py::test_longest",
+        "tests/test_a.py::test_medium",
+        "tests/test_a.py::test_long",
+        "tests/test_a.py::test_shortest",
+    ]
+
+    @pytest.fixture
+    def scheduler(self):
+        """Scheduler with two stub workers that collected COLLECTION"""
+        history = DurationHistory(dict(zip(self.COLLECTION, [2.0, 10.0, 5.0, 8.0, 1.0])))
+        scheduled = []
+        scheduler = StubDurationScheduling(None, history=history, on_schedule=lambda *args: scheduled.append(args))
+        scheduler.scheduled = scheduled
+        for name in ("gw0", "gw1"):
+            node = StubNode(name)
+            scheduler.node2pending[node] = []
+            scheduler.node2collection[node] = list(self.COLLECTION)
+        return scheduler
+
+    def names(self, scheduler, indices: list[int]) -> list[str]:
+        """Test names of collection indices"""
+        return [scheduler.collection[index].rsplit("::", 1)[1] for index in indices]
+
+    def test_schedule_sends_two_longest_tests_per_worker(self, scheduler):
+        """Test that the initial dispatch hands out the longest tests, two per worker"""
+        scheduler.schedule()
+        gw0, gw1 = scheduler.nodes
+
+        assert self.names(scheduler, gw0.sent) == ["test_longest", "test_medium"]
+        assert self.names(scheduler, gw1.sent) == ["test_long", "test_short"]
+        assert self.names(scheduler, scheduler.pending) == ["test_shortest"]
+        assert len(scheduler.scheduled) == 1
+        assert scheduler.scheduled[0][2] == 2
+
+    def test_check_schedule_tops_up_to_two_tests(self, scheduler):
+        """Test that a finished test is replaced by the longest pending one and idle workers shut down"""
+        scheduler.schedule()
+        gw0, gw1 = scheduler.nodes
+
+        scheduler.mark_test_complete(gw1, gw1.sent[0])
+        assert self.names(scheduler, scheduler.node2pending[gw1]) == ["test_short", "test_shortest"]
+        assert not scheduler.pending
+
+        scheduler.check_schedule(gw0)
+        assert len(scheduler.node2pending[gw0]) == 2
+        assert gw0.shutting_down
+
+    def test_schedule_shuts_down_when_everything_is_sent(self, scheduler):
+        """Test that workers shut down straight away when the collection fits in the first dispatch"""
+        for node in scheduler.nodes:
+            scheduler.node2collection[node] = self.COLLECTION[:3]
+        scheduler.schedule()
+
+        assert sum(len(node.sent) for node in scheduler.nodes) == 3
+        assert all(node.shutting_down for node in scheduler.nodes)
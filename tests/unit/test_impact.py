@@ -0,0 +1,244 @@
+"""
+Test Impact Unit Tests
+Diff hunk parsing, page symbol lookup and test selection against a sample page module
+"""
+import subprocess
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from utils import impact
+from utils.impact import IMPACT_MAP_KEY, ImpactPlugin, PageIndex, changed_lines
+
+SAMPLE_PAGE = textwrap.dedent('''\
+    """Sample page"""
+    from pages.base_page import BasePage
+
+    SEARCH_SCRIPT = "() => 1"
+
+
+    class SamplePage(BasePage):
+        """Sample page object"""
+
+        SEARCH_INPUT = "#search"
+        RESULTS = ".results"
+
+        def search(self, text):
+            """Search for text"""
+            self.fill(self.SEARCH_INPUT, text)
+            return self.page.evaluate(SEARCH_SCRIPT)
+
+        @property
+        def results(self):
+            """Result rows"""
+            return self.get_element_count(self.RESULTS)
+''')
+
+# Lines 4 (SEARCH_SCRIPT) and 18-19 (the results property and its decorator) of SAMPLE_PAGE,
+# a pure deletion after line 12, a new file, a deleted file and a docs change
+FIXTURE_DIFF = textwrap.dedent("""\
+    diff --git a/pages/sample_page.py b/pages/sample_page.py
+    --- a/pages/sample_page.py
+    +++ b/pages/sample_page.py
+    @@ -4 +4 @@
+    -SEARCH_SCRIPT = "() => 0"
+    +SEARCH_SCRIPT = "() => 1"
+    @@ -13 +12,0 @@
+    -
+    @@ -20,2 +18,2 @@ class SamplePage(BasePage):
+    -    @property
+    -    def results(self):
+    +    @property
+    +    def results(self):
+    diff --git a/tests/test_new.py b/tests/test_new.py
+    new file mode 100644
+    --- /dev/null
+    +++ b/tests/test_new.py
+    @@ -0,0 +1,3 @@
+    +def test_new():
+    +    pass
+    +
+    diff --git a/pages/old_page.py b/pages/old_page.py
+    deleted file mode 100644
+    --- a/pages/old_page.py
+    +++ /dev/null
+    @@ -1,2 +0,0 @@
+    -class OldPage:
+    -    pass
+    diff --git a/README.md b/README.md
+    --- a/README.md
+    +++ b/README.md
+    @@ -10,0 +11,2 @@ Intro
+    +More
+    +Docs
+""")
+
+SEARCH = "pages/sample_page.py::SamplePage.search"
+RESULTS = "pages/sample_page.py::SamplePage.results"
+
+
+@pytest.fixture
+def rootdir(tmp_path: Path) -> Path:
+    """Project root with the sample page module"""
+    (tmp_path / "pages").mkdir()
+    (tmp_path / "pages" / "sample_page.py").write_text(SAMPLE_PAGE)
+    return tmp_path
+
+
+def git_output(diff: str, untracked: str = ""):
+    """Stand-in for subprocess.run answering git diff and git ls-files"""
+    def run(args, **kwargs):
+        stdout = diff if args[1] == "diff" else untracked
+        return subprocess.CompletedProcess(args, 0, stdout=stdout)
+    return run
+
+
+class StubItem:
+    """Stand-in for a collected pytest item"""
+
+    def __init__(self, nodeid: str, markers: tuple = ()):
+        """Initialize stub item"""
+        self.nodeid = nodeid
+        self.markers = markers
+
+    def get_closest_marker(self, name: str):
+        """Get a marker by name"""
+        return name if name in self.markers else None
+
+
+class StubHook:
+    """Stand-in for config.hook"""
+
+    def __init__(self):
+        """Initialize stub hook"""
+        self.deselected = []
+
+    def pytest_deselected(self, items):
+        """Record deselected items"""
+        self.deselected.extend(items)
+
+
+class StubCache:
+    """Stand-in for config.cache"""
+
+    def __init__(self, values: dict):
+        """Initialize stub cache"""
+        self.values = values
+
+    def get(self, key, default):
+        """Get a cached value"""
+        return self.values.get(key, default)
+
+
+class StubConfig:
+    """Stand-in for the pytest config the plugin reads"""
+
+    def __init__(self, rootdir: Path, impact_map: dict):
+        """Initialize stub config"""
+        self.rootpath = rootdir
+        self.cache = StubCache({IMPACT_MAP_KEY: {"tests": impact_map}})
+        self.hook = StubHook()
+
+
+class TestChangedLines:
+    """Hunk parsing of git diff --unified=0"""
+
+    def test_changed_lines_from_fixture_diff(self, rootdir, monkeypatch):
+        """Test that hunks become line sets and new, deleted and untracked files whole-file changes"""
+        monkeypatch.setattr(impact.subprocess, "run", git_output(FIXTURE_DIFF, "pages/draft_page.py\n"))
+
+        changes = changed_lines("HEAD", rootdir)
+
+        assert changes == {
+            "pages/sample_page.py": {4, 12, 18, 19},
+            "tests/test_new.py": None,
+            "pages/old_page.py": None,
+            "README.md": {11, 12},
+            "pages/draft_page.py": None,
+        }
+
+
+class TestPageIndex:
+    """Static index of the page modules"""
+
+    def test_symbols_at_changed_lines(self, rootdir):
+        """Test that changed lines map to the definitions covering them, decorators included"""
+        index = PageIndex(rootdir)
+
+        assert index.symbols_at("pages/sample_page.py", {15}) == {SEARCH}
+        assert index.symbols_at("pages/sample_page.py", {18}) == {RESULTS}
+        assert index.symbols_at("pages/sample_page.py", {4, 10}) == {
+            "pages/sample_page.py::SEARCH_SCRIPT", "pages/sample_page.py::SamplePage.SEARCH_INPUT"
+        }
+
+    def test_symbols_at_outside_definitions_is_whole_file(self, rootdir):
+        """Test that a change to imports or a whole-file change selects every symbol of the module"""
+        index = PageIndex(rootdir)
+        every_symbol = {symbol.key for symbol in index.symbols["pages/sample_page.py"]}
+
+        assert index.symbols_at("pages/sample_page.py", {2}) == every_symbol
+        assert index.symbols_at("pages/sample_page.py", None) == every_symbol
+        assert index.symbols_at("pages/missing_page.py", {1}) == set()
+
+    def test_closure_follows_constants(self, rootdir):
+        """Test that a method's symbols include the selectors and scripts it uses"""
+        index = PageIndex(rootdir)
+
+        assert index.closure({SEARCH}) == {
+            SEARCH, "pages/sample_page.py::SEARCH_SCRIPT", "pages/sample_page.py::SamplePage.SEARCH_INPUT"
+        }
+
+
+class TestImpactSelection:
+    """Deselection of tests a diff cannot affect"""
+
+    IMPACT_MAP = {
+        "tests/test_search.py::test_search": [SEARCH],
+        "tests/test_search.py::test_results": [RESULTS],
+        "tests/test_smoke.py::test_results_smoke": [RESULTS],
+        "tests/test_smoke.py::test_results_critical": [RESULTS],
+    }
+
+    def select(self, rootdir, monkeypatch, changes: dict) -> tuple[list[str], StubConfig]:
+        """Run the selection over a fixed set of items and return the kept node ids"""
+        monkeypatch.setattr(impact, "changed_lines", lambda base, root: changes)
+        config = StubConfig(rootdir, self.IMPACT_MAP)
+        plugin = ImpactPlugin(config, "HEAD", record=False)
+        items = [
+            StubItem("tests/test_search.py::test_search"),
+            StubItem("tests/test_search.py::test_results"),
+            StubItem("tests/test_smoke.py::test_results_smoke", markers=("smoke",)),
+            StubItem("tests/test_smoke.py::test_results_critical", markers=("critical",)),
+            StubItem("tests/test_search.py::test_unmapped"),
+            StubItem("tests/test_other.py::test_other"),
+        ]
+        plugin.pytest_collection_modifyitems(None, config, items)
+        return [item.nodeid for item in items], config
+
+    def test_only_affected_unmapped_and_always_run_tests_kept(self, rootdir, monkeypatch):
+        """Test that a search() change keeps its test, unmapped tests and smoke/critical tests"""
+        selected, config = self.select(rootdir, monkeypatch, {"pages/sample_page.py": {15}})
+
+        assert selected == [
+            "tests/test_search.py::test_search",
+            "tests/test_smoke.py::test_results_smoke",
+            "tests/test_smoke.py::test_results_critical",
+            "tests/test_search.py::test_unmapped",
+            "tests/test_other.py::test_other",
+        ]
+        assert [item.nodeid for item in config.hook.deselected] == ["tests/test_search.py::test_results"]
+
+    def test_changed_test_file_is_selected(self, rootdir, monkeypatch):
+        """Test that every test of a changed test file runs"""
+        selected, _ = self.select(rootdir, monkeypatch, {"tests/test_search.py": {3}, "README.md": {1}})
+
+        assert "tests/test_search.py::test_search" in selected
+        assert "tests/test_search.py::test_results" in selected
+
+    def test_change_outside_pages_selects_everything(self, rootdir, monkeypatch):
+        """Test that a change to the framework itself keeps every test"""
+        selected, config = self.select(rootdir, monkeypatch, {"utils/waits.py": {10}})
+
+        assert len(selected) == 6
+        assert not config.hook.deselected
@@ -0,0 +1,77 @@
+"""
+Network Tracker Unit Tests
+Lazy attachment and bounded request records, driven by stub page events
+"""
+from pages.automation_page import AutomationPage
+from pages.network_tracker import NetworkTracker, find_network_tracker
+
+
+class StubRequest:
+    """Stand-in for a Playwright Request"""
+
+    def __init__(self, url: str, resource_type: str = "fetch"):
+        """Initialize stub request"""
+        self.url = url
+        self.resource_type = resource_type
+
+
+class StubPage:
+    """Stand-in for a Playwright Page that lets the test emit request events"""
+
+    def __init__(self):
+        """Initialize stub page"""
+        self.listeners: dict[str, list] = {}
+
+    def on(self, event: str, handler) -> None:
+        """Register an event listener"""
+        self.listeners.setdefault(event, []).append(handler)
+
+    def emit(self, event: str, request: StubRequest) -> None:
+        """Call the listeners of an event"""
+        for handler in self.listeners.get(event, []):
+            handler(request)
+
+
+class TestNetworkTracker:
+    """Request tracking of a page"""
+
+    def test_tracker_attached_on_first_use(self):
+        """Test that creating a page object adds no request listeners until the tracker is used"""
+        stub_page = StubPage()
+        automation_page = AutomationPage(stub_page)
+        assert find_network_tracker(stub_page) is None
+        assert not stub_page.listeners
+
+        assert automation_page.network is automation_page.network
+        assert set(stub_page.listeners) == {"request", "requestfinished", "requestfailed"}
+
+    def test_records_capped_and_counts_kept(self):
+        """Test that only the most recent requests are kept while the counts cover every request"""
+        stub_page = StubPage()
+        tracker = NetworkTracker(stub_page, max_records=3)
+        for index in range(10):
+            request = StubRequest(f"https://ultimateqa.com/api/{index}", "xhr" if index % 2 else "fetch")
+            stub_page.emit("request", request)
+            stub_page.emit("requestfailed" if index == 9 else "requestfinished", request)
+
+        stats = tracker.stats()
+        assert len(tracker.records) == 3
+        assert [record["url"][-1] for record in tracker.records] == ["7", "8", "9"]
+        assert stats["requests"] == 10
+        assert stats["failed"] == 1
+        assert stats["by_type"] == {"fetch": 5, "xhr": 5}
+        assert stats["in_flight"] == 0
+
+    def test_reset_keeps_requests_in_flight(self):
+        """Test that reset forgets finished requests but keeps tracking the ones still in flight"""
+        stub_page = StubPage()
+        tracker = NetworkTracker(stub_page)
+        finished, pending = StubRequest("https://ultimateqa.com/a"), StubRequest("https://ultimateqa.com/b")
+        stub_page.emit("request", finished)
+        stub_page.emit("request", pending)
+        stub_page.emit("requestfinished", finished)
+
+        tracker.reset()
+        assert tracker.stats()["requests"] == 1
+        stub_page.emit("requestfinished", pending)
+        assert tracker.in_flight_count == 0
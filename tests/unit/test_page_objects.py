@@ -0,0 +1,127 @@
+"""
+Page Object Unit Tests
+Selector translation, selector validation, locator caching and sync/async API parity, without a browser
+"""
+import inspect
+
+import pytest
+from pages.async_base_page import AsyncBasePage
+from pages.automation_page import AutomationPage
+from pages.base_page import BasePage
+from pages.selectors import selector_problems, to_css_query
+
+
+class StubPage:
+    """Stand-in for a Playwright Page that records locator lookups"""
+
+    def __init__(self):
+        """Initialize stub page"""
+        self.locator_calls: list[str] = []
+
+    def on(self, event: str, handler) -> None:
+        """Accept event listeners without emitting events"""
+
+    def locator(self, selector: str) -> object:
+        """Return a new stand-in Locator for every call"""
+        self.locator_calls.append(selector)
+        return object()
+
+
+class TestSelectorTranslation:
+    """In-page CSS translation of Playwright selectors"""
+
+    @pytest.mark.parametrize("selector, expected", [
+        ("h1", ("h1", None)),
+        ("a[href$='/complicated-page']", ("a[href$='/complicated-page']", None)),
+        ("h1:has-text('Automation Practice')", ("h1", "Automation Practice")),
+        ('button:has-text("Submit")', ("button", "Submit")),
+        (":has-text('Result')", ("*", "Result")),
+    ])
+    def test_css_selectors_translated(self, selector, expected):
+        """Test that plain CSS and a trailing :has-text filter become a CSS query plus text"""
+        assert to_css_query(selector) == expected
+
+    @pytest.mark.parametrize("selector", [
+        "//div[@id='main']",
+        "text=Sign in",
+        "internal:role=button",
+        "div >> text=Result",
+        "li:visible",
+        "h1, h2:has-text('Title')",
+    ])
+    def test_playwright_only_selectors_left_to_playwright(self, selector):
+        """Test that XPath, engine prefixes, chains and Playwright-only pseudo-classes are not translated"""
+        assert to_css_query(selector) is None
+
+
+class TestSelectorValidation:
+    """Static checks of page object selectors"""
+
+    @pytest.mark.parametrize("selector", [
+        "h1",
+        "h1:has-text('Automation Practice')",
+        "[role='alert'], .form-error, .alert-danger",
+        "form >> button[type='submit']",
+    ])
+    def test_valid_selectors_pass(self, selector):
+        """Test that well-formed, narrowed selectors report no problems"""
+        assert selector_problems(selector) == []
+
+    @pytest.mark.parametrize("selector, problem", [
+        ("  ", "empty selector"),
+        ("div[data-id='x'", "unbalanced"),
+        ("a[title='x]", "unbalanced"),
+        ("form >> ", "empty '>>' segment"),
+        (":has-text('Result')", "scans every element"),
+        ("li:has-text('')", "matches every element"),
+    ])
+    def test_problems_reported(self, selector, problem):
+        """Test that malformed and whole-DOM-scanning selectors are reported"""
+        assert any(problem in found for found in selector_problems(selector))
+
+    def test_expensive_selector_rejected_at_class_creation(self):
+        """Test that a :has-text selector without an element type fails when the page class is defined"""
+        with pytest.raises(ValueError, match="SEARCH_RESULT"):
+            type("SearchPage", (AutomationPage,), {"SEARCH_RESULT": ":has-text('Result')"})
+
+
+class TestLocatorCache:
+    """Per-page-object Locator cache"""
+
+    def test_locators_cached_per_selector(self):
+        """Test that a selector resolves to the same Locator object on every lookup"""
+        stub_page = StubPage()
+        automation_page = AutomationPage(stub_page)
+
+        heading = automation_page._get_element(AutomationPage.PAGE_HEADING)
+        assert automation_page._get_element(AutomationPage.PAGE_HEADING) is heading
+        assert automation_page._get_element(heading) is heading
+        assert automation_page._get_element(AutomationPage.PAGE_TITLE) is not heading
+        assert stub_page.locator_calls == [AutomationPage.PAGE_HEADING, AutomationPage.PAGE_TITLE]
+        assert automation_page._locators == {
+            AutomationPage.PAGE_HEADING: heading,
+            AutomationPage.PAGE_TITLE: automation_page._get_element(AutomationPage.PAGE_TITLE),
+        }
+
+
+class TestAsyncParity:
+    """AsyncBasePage offers the same page object API as BasePage"""
+
+    # Built on sync-only machinery (request listeners, DOM snapshots and timing reads tied to the sync Page)
+    SYNC_ONLY = {"assert_performance_budget", "collect_performance_metrics", "network", "snapshot",
+                 "wait_for_network_quiet"}
+
+    @staticmethod
+    def public_names(cls) -> set:
+        """Public attribute names of a class"""
+        return {name for name in dir(cls) if not name.startswith("_")}
+
+    def test_public_methods_match(self):
+        """Test that every public BasePage method has an async counterpart and vice versa"""
+        assert self.public_names(BasePage) - self.SYNC_ONLY == self.public_names(AsyncBasePage)
+
+    def test_parameters_match(self):
+        """Test that counterparts take the same parameters"""
+        for name in self.public_names(AsyncBasePage):
+            sync_parameters = list(inspect.signature(getattr(BasePage, name)).parameters)
+            assert list(inspect.signature(getattr(AsyncBasePage, name)).parameters) == sync_parameters, name
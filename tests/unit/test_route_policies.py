@@ -0,0 +1,34 @@
+"""
+Route Policy Unit Tests
+Policy selection by marker and override
+"""
+import pytest
+
+from utils.route_policies import POLICIES, select_policy
+
+
+class TestPolicySelection:
+    """Which policy a test runs with"""
+
+    @pytest.mark.parametrize("markers, expected", [
+        ({"regression"}, "block-media"),
+        ({"ui"}, "block-third-party"),
+        ({"regression", "ui"}, "block-media"),
+        ({"smoke"}, None),
+        ({"smoke", "critical"}, None),
+        (set(), None),
+    ])
+    def test_marker_defaults(self, markers, expected):
+        """Test that suite markers only select the conservative policies"""
+        policy = select_policy(markers)
+        assert (policy.name if policy else None) == expected
+
+    def test_first_party_only_is_opt_in(self):
+        """Test that first-party-only applies only when a test or ROUTE_POLICY asks for it"""
+        assert select_policy({"smoke"}, "first-party-only") is POLICIES["first-party-only"]
+        assert select_policy({"regression"}, "none") is None
+
+    def test_unknown_policy_rejected(self):
+        """Test that a misspelled policy name fails loudly"""
+        with pytest.raises(ValueError, match="Unknown route policy"):
+            select_policy({"smoke"}, "first-party")
@@ -0,0 +1,59 @@
+"""
+Shared Page Unit Tests
+Reuse decisions of the shared page pool, without a browser
+"""
+from utils.shared_page import SharedPage
+
+
+class StubContext:
+    """Stand-in for a Playwright BrowserContext"""
+
+    def clear_cookies(self) -> None:
+        """Accept cookie clearing"""
+
+
+class StubPage:
+    """Stand-in for a Playwright Page at a URL with a session history"""
+
+    def __init__(self, url: str, history_length: int):
+        """Initialize stub page"""
+        self.url = url
+        self.history_length = history_length
+
+    def evaluate(self, script: str, *args):
+        """Answer the history probe and the reset script"""
+        if script.strip().startswith("() => window.history.length"):
+            return self.history_length
+        return [self.url, self.history_length]
+
+
+class TestSharedPageReset:
+    """Reset of a shared page between tests"""
+
+    def landed_page(self) -> tuple[SharedPage, StubPage]:
+        """Shared page that navigated to its home URL once"""
+        page = StubPage("https://ultimateqa.com/automation/", history_length=2)
+        shared_page = SharedPage("tests/test_smoke.py::TestBasicFunctionality", StubContext(), page)
+        shared_page.navigated("https://ultimateqa.com/automation")
+        return shared_page, page
+
+    def test_untouched_page_is_parked_for_reuse(self):
+        """Test that a page still at its landing URL and history is reused without navigating"""
+        shared_page, _ = self.landed_page()
+
+        assert shared_page.reset()
+        assert shared_page.reuse_navigation("https://ultimateqa.com/automation")
+
+    def test_page_with_grown_history_is_replaced(self):
+        """Test that a page that navigated away and came back is not reused"""
+        shared_page, page = self.landed_page()
+        page.history_length = 4
+
+        assert not shared_page.reset()
+
+    def test_page_elsewhere_is_replaced(self):
+        """Test that a page left at another URL is not reused"""
+        shared_page, page = self.landed_page()
+        page.url = "https://ultimateqa.com/complicated-page/"
+
+        assert not shared_page.reset()
@@ -0,0 +1,271 @@
+"""
+Action Timing
+Opt-in per-action timing of page object methods (wall time, waiting vs executing, outcome)
+"""
+import functools
+import inspect
+import json
+import time
+
+from playwright.sync_api import Error, Locator, TimeoutError as PlaywrightTimeoutError
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+class ActionTimer:
+    """Collects the timed actions of one test"""
+
+    def __init__(self, test_id: str):
+        """
+        Initialize action timer
+
+        Args:
+            test_id: Pytest node id of the test
+        """
+        self.test_id = test_id
+        self.events: list[dict] = []
+        self.stack: list[dict] = []
+
+    def to_jsonl(self) -> bytes:
+        """
+        Serialize the events as JSON lines
+
+        Returns:
+            One JSON object per action, in call order
+        """
+        return "".join(json.dumps(event) + "\n" for event in self.events).encode("utf-8")
+
+    def summary(self) -> dict:
+        """
+        Aggregate the events per action
+
+        Returns:
+            Dict mapping action name to {'calls', 'total_ms', 'wait_ms', 'exec_ms', 'errors'}
+        """
+        totals: dict[str, dict] = {}
+        for event in self.events:
+            entry = totals.setdefault(
+                event["action"], {"calls": 0, "total_ms": 0.0, "wait_ms": 0.0, "exec_ms": 0.0, "errors": 0}
+            )
+            entry["calls"] += 1
+            entry["total_ms"] += event["duration_ms"]
+            entry["wait_ms"] += event["wait_ms"]
+            entry["exec_ms"] += event["exec_ms"]
+            entry["errors"] += event["outcome"] != "ok"
+        return {
+            action: {name: round(value, 1) if isinstance(value, float) else value for name, value in entry.items()}
+            for action, entry in totals.items()
+        }
+
+
+class ActionTiming:
+    """Holds the timer of the running test (tests run one at a time per worker)"""
+
+    def __init__(self):
+        """Initialize with no active timer"""
+        self.timer: ActionTimer | None = None
+
+    def start(self, test_id: str) -> ActionTimer:
+        """
+        Start timing page object actions for a test
+
+        Args:
+            test_id: Pytest node id of the test
+
+        Returns:
+            Active ActionTimer
+        """
+        self.timer = ActionTimer(test_id)
+        return self.timer
+
+    def stop(self) -> ActionTimer | None:
+        """
+        Stop timing page object actions
+
+        Returns:
+            The timer that was active, or None
+        """
+        timer, self.timer = self.timer, None
+        return timer
+
+
+# Action timing state of this process
+_timing = ActionTiming()
+
+
+def start_action_timing(test_id: str) -> ActionTimer:
+    """
+    Start timing page object actions for a test
+
+    Args:
+        test_id: Pytest node id of the test
+
+    Returns:
+        Active ActionTimer
+    """
+    return _timing.start(test_id)
+
+
+def stop_action_timing() -> ActionTimer | None:
+    """
+    Stop timing page object actions
+
+    Returns:
+        The timer that was active, or None
+    """
+    return _timing.stop()
+
+
+def record_wait(
+    name: str,
+    target: str | None,
+    duration_ms: float,
+    outcome: str = "ok",
+    error: str | None = None
+) -> None:
+    """
+    Record a wait made outside a page object method (e.g. utils.waits) while action timing is active
+
+    The wait counts as waiting time of the page object action it runs in, if any.
+
+    Args:
+        name: Wait name
+        target: What was waited for
+        duration_ms: Time the wait actually took
+        outcome: 'ok', 'timeout' or 'error'
+        error: First line of the error message
+    """
+    timer = _timing.timer
+    if timer is None:
+        return
+    if timer.stack:
+        timer.stack[-1]["wait_ms"] += duration_ms
+    timer.events.append({
+        "action": name,
+        "page": None,
+        "kind": "wait",
+        "target": target,
+        "depth": len(timer.stack),
+        "duration_ms": round(duration_ms, 2),
+        "wait_ms": round(duration_ms, 2),
+        "exec_ms": 0.0,
+        "outcome": outcome,
+        "error": error,
+    })
+
+
+def _target(args: tuple) -> str | None:
+    """Describe the selector or URL an action was called with"""
+    if not args:
+        return None
+    first = args[0]
+    if isinstance(first, (str, Locator)):
+        return str(first)
+    if isinstance(first, (list, tuple)):
+        return ", ".join(str(item) for item in first)
+    return None
+
+
+def _probe(page_object, locator, timeout: float, frame: dict) -> float:
+    """
+    Wait for a locator to resolve to an attached element, counting the wait in the action's frame
+
+    Args:
+        page_object: Page object of the action
+        locator: Element locator
+        timeout: Caller's timeout in milliseconds
+        frame: Timing frame of the action
+
+    Returns:
+        Milliseconds spent waiting
+
+    Raises:
+        PlaywrightTimeoutError: If no element is attached within timeout
+    """
+    started = time.perf_counter()
+    try:
+        page_object._get_element(locator).first.wait_for(state="attached", timeout=timeout)
+    except PlaywrightTimeoutError:
+        raise
+    except Error:
+        # Other failures (e.g. a malformed selector) are reported by the action itself
+        pass
+    finally:
+        probe_ms = (time.perf_counter() - started) * 1000
+        frame["wait_ms"] += probe_ms
+    return probe_ms
+
+
+def timed_action(kind: str = "action", probe: bool = False):
+    """
+    Record a page object method while action timing is active
+
+    Wall time is split into time spent waiting and executing: waits and
+    assertions count as waiting, nested waits count towards their caller, and
+    with probe=True the time to resolve the locator to an attached element is
+    measured separately before the action runs. The probe waits no longer than
+    the caller's timeout and the action gets what is left of it, so timing
+    never lengthens a call; a probe timeout fails the action right away, as
+    the action would have failed on the same missing element. Only methods
+    taking a timeout can be probed: any other method would wait its full
+    timeout again after the probe. Without an active timer the method is
+    called directly.
+
+    Args:
+        kind: 'navigation', 'action', 'query', 'wait' or 'assertion'
+        probe: Resolve the locator (first argument) before the action to measure selector waiting
+
+    Returns:
+        Decorator
+
+    Raises:
+        TypeError: If probe is set on a method without a timeout parameter
+    """
+    def decorator(method):
+        signature = inspect.signature(method)
+        if probe and "timeout" not in signature.parameters:
+            raise TypeError(f"timed_action(probe=True) needs a timeout parameter on {method.__qualname__}")
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            timer = _timing.timer
+            if timer is None:
+                return method(self, *args, **kwargs)
+
+            frame = {"wait_ms": 0.0}
+            timer.stack.append(frame)
+            outcome, error = "ok", None
+            started = time.perf_counter()
+            try:
+                if probe and args and self._snapshot_entry(args[0]) is None:
+                    bound = signature.bind_partial(self, *args, **kwargs)
+                    timeout = bound.arguments.get("timeout") or self.timeout
+                    probe_ms = _probe(self, args[0], timeout, frame)
+                    bound.arguments["timeout"] = max(1, timeout - probe_ms)
+                    return method(*bound.args, **bound.kwargs)
+                return method(self, *args, **kwargs)
+            except Exception as e:
+                outcome = "timeout" if "Timeout" in type(e).__name__ else "error"
+                error = str(e).splitlines()[0] if str(e) else type(e).__name__
+                raise
+            finally:
+                duration_ms = (time.perf_counter() - started) * 1000
+                timer.stack.pop()
+                wait_ms = duration_ms if kind in ("wait", "assertion") else min(frame["wait_ms"], duration_ms)
+                if timer.stack:
+                    timer.stack[-1]["wait_ms"] += wait_ms
+                timer.events.append({
+                    "action": method.__name__,
+                    "page": type(self).__name__,
+                    "kind": kind,
+                    "target": _target(args),
+                    "depth": len(timer.stack),
+                    "duration_ms": round(duration_ms, 2),
+                    "wait_ms": round(wait_ms, 2),
+                    "exec_ms": round(duration_ms - wait_ms, 2),
+                    "outcome": outcome,
+                    "error": error,
+                })
+        return wrapper
+    return decorator
@@ -0,0 +1,192 @@
+"""
+Artifact Writer
+Writes failure artifacts and Allure attachments on a bounded background thread pool
+"""
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from contextlib import ExitStack
+from functools import lru_cache
+from pathlib import Path
+from uuid import uuid4
+
+from utils.config_reader import config
+from utils.logger import get_logger
+
+# Optional allure import
+try:
+    import allure
+    from allure_commons import plugin_manager
+    ALLURE_AVAILABLE = True
+except ImportError:
+    ALLURE_AVAILABLE = False
+
+logger = get_logger(__name__)
+
+# Returned by _register_allure_attachment when allure-pytest has no deferred attach (see requirements.txt pin)
+SYNC_ATTACH = "sync"
+
+
+def _register_allure_attachment(name: str, attachment_type, extension: str | None = None) -> str | None:
+    """
+    Add an attachment entry to the running Allure test (must run on the test's thread)
+
+    The entry only references a file name in the results directory; the file
+    itself is copied later with the report_attached_file hook. Allure has no
+    public API for this, so it relies on AllureReporter._attach of the pinned
+    allure-pytest and reports SYNC_ATTACH when that is missing or has changed.
+
+    Args:
+        name: Attachment name
+        attachment_type: allure.attachment_type member or MIME type
+        extension: File extension for MIME-type attachments
+
+    Returns:
+        Attachment file name in the results directory, SYNC_ATTACH, or None if Allure is not reporting
+    """
+    if not ALLURE_AVAILABLE:
+        return None
+    for plugin in plugin_manager.get_plugins():
+        allure_logger = getattr(plugin, "allure_logger", None)
+        if allure_logger is not None:
+            try:
+                return allure_logger._attach(uuid4(), name=name, attachment_type=attachment_type, extension=extension)
+            except KeyError:
+                # No test or fixture is running
+                return None
+            except (AttributeError, TypeError) as e:
+                logger.debug("Deferred Allure attach unavailable, attaching synchronously: %s", e)
+                return SYNC_ATTACH
+    return None
+
+
+def _completed_future() -> Future:
+    """Future of work already done on the caller's thread"""
+    future = Future()
+    future.set_result(None)
+    return future
+
+
+class ArtifactWriter:
+    """Bounded background writer for screenshots, traces and their Allure attachments"""
+
+    def __init__(self, max_workers: int = 2, max_pending: int = 8):
+        """
+        Initialize artifact writer
+
+        Args:
+            max_workers: Writer threads
+            max_pending: Artifacts queued or in progress before submit blocks the caller
+        """
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="artifact-writer")
+        self.slots = threading.BoundedSemaphore(max_pending)
+        self.futures: list[Future] = []
+        self.lock = threading.Lock()
+
+    def write(
+        self,
+        path: str | Path,
+        data: bytes,
+        allure_name: str | None = None,
+        attachment_type=None,
+        extension: str | None = None
+    ) -> Future:
+        """
+        Write bytes to disk in the background, optionally attaching the file to Allure
+
+        Args:
+            path: Destination file
+            data: File content (e.g. PNG bytes from page.screenshot())
+            allure_name: Attachment name, or None to skip Allure
+            attachment_type: allure.attachment_type member or MIME type
+            extension: File extension for MIME-type attachments
+
+        Returns:
+            Future completed when the file (and attachment) is written
+        """
+        file_name = _register_allure_attachment(allure_name, attachment_type, extension) if allure_name else None
+        if file_name == SYNC_ATTACH:
+            self._write(Path(path), data, None)
+            allure.attach.file(str(path), name=allure_name, attachment_type=attachment_type, extension=extension)
+            return _completed_future()
+        return self._submit(self._write, Path(path), data, file_name)
+
+    def attach(self, path: str | Path, allure_name: str, attachment_type=None, extension: str | None = None) -> Future:
+        """
+        Attach an existing file to Allure by path; the copy happens in the background
+
+        Args:
+            path: File already on disk (e.g. a saved trace)
+            allure_name: Attachment name
+            attachment_type: allure.attachment_type member or MIME type
+            extension: File extension for MIME-type attachments
+
+        Returns:
+            Future completed when the attachment is copied
+        """
+        file_name = _register_allure_attachment(allure_name, attachment_type, extension)
+        if file_name == SYNC_ATTACH:
+            allure.attach.file(str(path), name=allure_name, attachment_type=attachment_type, extension=extension)
+            return _completed_future()
+        return self._submit(self._copy_attachment, Path(path), file_name)
+
+    def _submit(self, function, *args) -> Future:
+        """Queue work, blocking while max_pending artifacts are in flight"""
+        with ExitStack() as stack:
+            stack.enter_context(self.slots)
+            future = self.executor.submit(function, *args)
+            # The slot is released when the work is done; it is released right away if submit fails
+            slot = stack.pop_all()
+        future.add_done_callback(lambda done: slot.close())
+        with self.lock:
+            self.futures.append(future)
+        return future
+
+    def _write(self, path: Path, data: bytes, file_name: str | None) -> None:
+        """Write a file and copy it into the Allure results"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+        logger.info("Artifact saved: %s", path)
+        self._copy_attachment(path, file_name)
+
+    @staticmethod
+    def _copy_attachment(path: Path, file_name: str | None) -> None:
+        """Copy a file into the Allure results under its registered name"""
+        if file_name is not None:
+            plugin_manager.hook.report_attached_file(source=str(path), file_name=file_name)
+
+    def flush(self, timeout: float | None = None) -> int:
+        """
+        Wait for queued artifacts
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            Number of artifacts that failed to write
+        """
+        with self.lock:
+            futures, self.futures = self.futures, []
+        done, not_done = wait(futures, timeout=timeout)
+        failures = [future.exception() for future in done if future.exception() is not None]
+        for error in failures:
+            logger.error("Artifact write failed: %s", error)
+        if not_done:
+            logger.warning("%d artifacts still being written after %s s", len(not_done), timeout)
+        return len(failures) + len(not_done)
+
+    def close(self) -> None:
+        """Flush and stop the writer threads"""
+        self.flush()
+        self.executor.shutdown(wait=True)
+
+
+@lru_cache(maxsize=None)
+def get_artifact_writer() -> ArtifactWriter:
+    """
+    Get the process-wide artifact writer (one per xdist worker)
+
+    Returns:
+        ArtifactWriter sized by ARTIFACT_WRITER_THREADS
+    """
+    workers = config.artifact_writer_threads
+    return ArtifactWriter(max_workers=workers, max_pending=workers * 4)
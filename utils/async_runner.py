@@ -0,0 +1,66 @@
+"""
+Async Runner
+Runs coroutines on one event loop per worker, in a dedicated thread
+"""
+import asyncio
+import threading
+from typing import Any, Coroutine
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class AsyncRunner:
+    """Event loop running in a background thread, driven from synchronous tests"""
+
+    def __init__(self, name: str = "async-runner"):
+        """
+        Initialize async runner and start its event loop
+
+        Args:
+            name: Name of the loop thread
+        """
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run_loop, name=name, daemon=True)
+        self._thread.start()
+        logger.info("Started event loop thread: %s", name)
+
+    def _run_loop(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def run(self, coroutine: Coroutine, timeout: float | None = None) -> Any:
+        """
+        Run a coroutine on the loop and wait for its result
+
+        Args:
+            coroutine: Coroutine to run
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            Coroutine result
+        """
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result(timeout)
+
+    def gather(self, *coroutines: Coroutine, timeout: float | None = None) -> list:
+        """
+        Run several coroutines concurrently and wait for all results
+
+        Args:
+            *coroutines: Coroutines to run
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            List of results in the order given
+        """
+        async def _gather():
+            return await asyncio.gather(*coroutines)
+        return self.run(_gather(), timeout)
+
+    def close(self) -> None:
+        """Stop the loop and its thread"""
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self.loop.close()
+        logger.info("Stopped event loop thread: %s", self._thread.name)
@@ -0,0 +1,109 @@
+"""
+Authenticated Storage State Cache
+Logs each test user in once, persists cookies and localStorage on disk and shares them across xdist workers
+"""
+import json
+import os
+import re
+import time
+from pathlib import Path
+from typing import Callable
+
+from utils.file_lock import FileLock
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def cookies_expired(state: dict, now: float | None = None) -> bool:
+    """
+    Check if any persistent cookie of a storage state has expired
+
+    Args:
+        state: Storage state (as returned by BrowserContext.storage_state())
+        now: Unix time to compare against (defaults to the current time)
+
+    Returns:
+        True if a cookie with an expiry date is past it
+    """
+    now = time.time() if now is None else now
+    return any(0 < cookie.get("expires", -1) <= now for cookie in state.get("cookies", []))
+
+
+class StorageStateCache:
+    """On-disk storage states per test user, refreshed after a TTL, on cookie expiry or when invalidated"""
+
+    def __init__(self, directory: str | Path, ttl_seconds: float):
+        """
+        Initialize storage state cache
+
+        Args:
+            directory: Directory holding <user>.json state files (keep it out of version control)
+            ttl_seconds: Age after which a state is logged in again
+        """
+        self.directory = Path(directory)
+        self.ttl_seconds = ttl_seconds
+
+    def path_for(self, user_key: str) -> Path:
+        """
+        Get the state file of a user
+
+        Args:
+            user_key: User identifier (e.g. role or email)
+
+        Returns:
+            Path of the state file
+        """
+        return self.directory / f"{re.sub(r'[^A-Za-z0-9_.-]', '_', user_key)}.json"
+
+    def _fresh(self, path: Path) -> bool:
+        """Check that a state file exists, is within the TTL and holds no expired cookies"""
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl_seconds:
+                return False
+            return not cookies_expired(json.loads(path.read_text(encoding="utf-8")))
+        except (FileNotFoundError, ValueError):
+            return False
+
+    def get(self, user_key: str, login: Callable[[], dict]) -> Path:
+        """
+        Get a fresh storage state for a user, logging in if needed
+
+        Only one process logs a user in; the others wait on the lock and reuse
+        the state it wrote.
+
+        Args:
+            user_key: User identifier
+            login: Performs the login and returns the storage state dict
+
+        Returns:
+            Path to pass as storage_state when creating a context
+        """
+        path = self.path_for(user_key)
+        if self._fresh(path):
+            return path
+
+        with FileLock(path.with_suffix(".lock")):
+            # Another worker may have logged in while we waited for the lock
+            if self._fresh(path):
+                return path
+            started = time.perf_counter()
+            state = login()
+            temporary = path.with_suffix(f".{os.getpid()}.tmp")
+            temporary.write_text(json.dumps(state), encoding="utf-8")
+            os.replace(temporary, path)
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            logger.info("Logged in %s in %.0f ms, storage state saved", user_key, elapsed_ms)
+        return path
+
+    def invalidate(self, user_key: str) -> None:
+        """
+        Drop a user's state (e.g. the application no longer accepts the session)
+
+        Args:
+            user_key: User identifier
+        """
+        path = self.path_for(user_key)
+        with FileLock(path.with_suffix(".lock")):
+            path.unlink(missing_ok=True)
+        logger.info("Storage state of %s invalidated", user_key)
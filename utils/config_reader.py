@@ -60,11 +60,96 @@ class ConfigReader:
         """Get trace on failure setting"""
         return os.getenv("TRACE_ON_FAILURE", "true").lower() == "true"
 
+    @property
+    def trace_mode(self) -> str:
+        """Get trace mode (off, on, retain-on-failure, on-first-retry; default follows TRACE_ON_FAILURE)"""
+        return os.getenv("TRACE_MODE") or ("retain-on-failure" if self.trace_on_failure else "off")
+
+    @property
+    def trace_level(self) -> str:
+        """Get trace level (full, snapshots, screenshots)"""
+        return os.getenv("TRACE_LEVEL", "full")
+
     @property
     def video_on_failure(self) -> bool:
         """Get video on failure setting"""
         return os.getenv("VIDEO_ON_FAILURE", "false").lower() == "true"
 
+    @property
+    def performance_metrics(self) -> bool:
+        """Get performance metrics setting (collect navigation/paint/resource timing after navigate, opt-in)"""
+        return os.getenv("PERFORMANCE_METRICS", "false").lower() == "true"
+
+    @property
+    def navigation_quiet_ms(self) -> int:
+        """Get quiet period (ms) of first-party traffic BasePage.navigate waits for (0 = DOMContentLoaded only)"""
+        return int(os.getenv("NAVIGATION_QUIET_MS", "0"))
+
+    @property
+    def action_timing(self) -> bool:
+        """Get per-action timing setting (JSON lines per test in reports/action_timing)"""
+        return os.getenv("ACTION_TIMING", "false").lower() == "true"
+
+    @property
+    def artifact_writer_threads(self) -> int:
+        """Get number of background threads writing failure artifacts"""
+        return int(os.getenv("ARTIFACT_WRITER_THREADS", "2"))
+
+    @property
+    def offline_mode(self) -> bool:
+        """Get offline mode setting (serve pages from local snapshots)"""
+        return os.getenv("OFFLINE_MODE", "false").lower() == "true"
+
+    @property
+    def route_policy(self) -> str | None:
+        """Get route policy override (policy name, 'none' to disable, unset = per marker)"""
+        return os.getenv("ROUTE_POLICY") or None
+
+    @property
+    def context_pool_size(self) -> int:
+        """Get number of warm browser contexts per worker (0 = one fresh context per test)"""
+        return int(os.getenv("CONTEXT_POOL_SIZE", "0"))
+
+    @property
+    def context_pool_max_uses(self) -> int:
+        """Get number of tests a pooled context serves before it is recycled"""
+        return int(os.getenv("CONTEXT_POOL_MAX_USES", "20"))
+
+    @property
+    def test_username(self) -> str:
+        """Get test account username (overrides the 'user' role of test_data/test_users.json)"""
+        return os.getenv("TEST_USERNAME", "")
+
+    @property
+    def test_password(self) -> str:
+        """Get test account password"""
+        return os.getenv("TEST_PASSWORD", "")
+
+    @property
+    def auth_state_dir(self) -> str:
+        """Get directory of cached logged-in storage states (one JSON file per test user)"""
+        return os.getenv("AUTH_STATE_DIR", ".auth")
+
+    @property
+    def auth_state_ttl_minutes(self) -> int:
+        """Get minutes a cached login is reused before logging in again"""
+        return int(os.getenv("AUTH_STATE_TTL_MINUTES", "30"))
+
+    @property
+    def data_pool_size(self) -> int:
+        """Get number of pre-generated records per data pool (split between xdist workers)"""
+        return int(os.getenv("DATA_POOL_SIZE", "1000"))
+
+    @property
+    def data_pool_seed(self) -> int:
+        """Get seed of the pre-generated data pools (same seed = same data on every machine)"""
+        return int(os.getenv("DATA_POOL_SEED", "20240101"))
+
+    @property
+    def data_pool_dir(self) -> str:
+        """Get directory of cached data pools (one JSON file per schema, size and seed)"""
+        return os.getenv("DATA_POOL_DIR", ".data_pools")
+
     @property
     def parallel_workers(self) -> int:
         """Get number of parallel workers"""
@@ -0,0 +1,161 @@
+"""
+Context Pool
+Per-worker pool of pre-warmed browser contexts, reset between tests and recycled periodically
+"""
+import time
+from collections import deque
+from typing import Callable
+
+from playwright.sync_api import BrowserContext, Error, Page
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Clears localStorage, sessionStorage and IndexedDB of the page's origin before the page is closed
+CLEAR_STORAGE_SCRIPT = """async () => {
+    try {
+        window.localStorage.clear();
+        window.sessionStorage.clear();
+    } catch (e) {}
+    try {
+        const databases = await indexedDB.databases();
+        await Promise.all(databases.map(database => new Promise(resolve => {
+            const request = indexedDB.deleteDatabase(database.name);
+            request.onsuccess = request.onerror = request.onblocked = () => resolve();
+        })));
+    } catch (e) {}
+}"""
+
+
+class PooledContext:
+    """A browser context owned by a ContextPool, with a pre-opened page"""
+
+    def __init__(self, context: BrowserContext):
+        """
+        Initialize pooled context
+
+        Args:
+            context: Browser context
+        """
+        self.context = context
+        self.page: Page | None = context.new_page()
+        self.uses = 0
+        self.checkout_ms = 0.0
+
+    def take_page(self) -> Page:
+        """
+        Get the pre-opened page (or a new one if it was already taken)
+
+        Returns:
+            Page object
+        """
+        page, self.page = self.page, None
+        return page if page is not None and not page.is_closed() else self.context.new_page()
+
+    def reset(self) -> None:
+        """
+        Clear cookies, permissions, routes and storage, then pre-open the next page
+
+        Storage is cleared through the context's open pages, so the test page
+        must still be open when the context is checked in.
+        """
+        for page in self.context.pages:
+            try:
+                page.evaluate(CLEAR_STORAGE_SCRIPT)
+            except Error:
+                pass
+            page.close()
+        self.context.clear_cookies()
+        self.context.clear_permissions()
+        self.context.unroute_all(behavior="ignoreErrors")
+        self.page = self.context.new_page()
+
+    def close(self) -> None:
+        """Close the context"""
+        try:
+            self.context.close()
+        except Error as e:
+            logger.warning("Closing pooled context failed: %s", e)
+
+
+class ContextPool:
+    """Pool of warm browser contexts for one worker"""
+
+    def __init__(self, new_context: Callable[[], BrowserContext], size: int = 1, max_uses: int = 20):
+        """
+        Initialize context pool
+
+        Args:
+            new_context: Factory creating a context from browser_context_args
+            size: Number of contexts kept warm
+            max_uses: Tests served by a context before it is recycled
+        """
+        self.new_context = new_context
+        self.size = max(1, size)
+        self.max_uses = max_uses
+        self.idle: deque[PooledContext] = deque()
+
+    def warm(self) -> None:
+        """Create contexts until the pool is full"""
+        started = time.perf_counter()
+        created = 0
+        while len(self.idle) < self.size:
+            self.idle.append(PooledContext(self.new_context()))
+            created += 1
+        if created:
+            logger.info("Warmed %d browser contexts in %.1f ms", created, (time.perf_counter() - started) * 1000)
+
+    def checkout(self) -> PooledContext:
+        """
+        Take a warm context out of the pool
+
+        Returns:
+            PooledContext (created on the spot if the pool is empty)
+        """
+        started = time.perf_counter()
+        pooled = self.idle.popleft() if self.idle else PooledContext(self.new_context())
+        pooled.uses += 1
+        pooled.checkout_ms = (time.perf_counter() - started) * 1000
+        logger.info("Context checkout: %.1f ms (use %d/%d)", pooled.checkout_ms, pooled.uses, self.max_uses)
+        return pooled
+
+    def checkin(self, pooled: PooledContext, failed: bool) -> dict:
+        """
+        Return a context after a test: reset it, or recycle it after a failure or max_uses
+
+        Args:
+            pooled: Context taken with checkout
+            failed: Whether the test failed
+
+        Returns:
+            Dictionary with use count, checkout/checkin cost in ms and the checkin action
+        """
+        started = time.perf_counter()
+        if failed or pooled.uses >= self.max_uses:
+            pooled.close()
+            self.warm()
+            action = "recycled after failure" if failed else "recycled after max uses"
+        else:
+            try:
+                pooled.reset()
+                self.idle.append(pooled)
+                action = "reset"
+            except Error as e:
+                logger.warning("Context reset failed, recycling: %s", e)
+                pooled.close()
+                self.warm()
+                action = "recycled after failed reset"
+        checkin_ms = (time.perf_counter() - started) * 1000
+        logger.info("Context checkin: %s in %.1f ms", action, checkin_ms)
+        return {
+            "uses": pooled.uses,
+            "checkout_ms": round(pooled.checkout_ms, 1),
+            "checkin_ms": round(checkin_ms, 1),
+            "action": action,
+        }
+
+    def close(self) -> None:
+        """Close every idle context"""
+        while self.idle:
+            self.idle.popleft().close()
@@ -0,0 +1,250 @@
+"""
+Data Pools
+Seeded test data generated once per data version, cached on disk column by column and sliced per xdist worker
+"""
+import hashlib
+import json
+import os
+import time
+import zlib
+from pathlib import Path
+
+from utils.config_reader import config
+from utils.file_lock import FileLock
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Bump to regenerate every cached pool (e.g. after changing how values are post-processed)
+POOL_FORMAT_VERSION = 1
+
+
+class DataSchema:
+    """Named set of columns, each generated by a Faker provider"""
+
+    def __init__(self, name: str, fields: dict[str, tuple], locale: str = "en_US"):
+        """
+        Initialize data schema
+
+        Args:
+            name: Schema name (part of the cache file name)
+            fields: Column -> (provider, kwargs); 'unique.email' style providers draw without repeats
+            locale: Faker locale
+        """
+        self.name = name
+        self.fields = fields
+        self.locale = locale
+
+    def fingerprint(self) -> str:
+        """
+        Hash of everything that changes the generated values
+
+        Returns:
+            Short hex digest of columns, providers, locale, Faker version and pool format
+        """
+        from importlib.metadata import version
+
+        definition = {
+            "fields": {column: [provider, kwargs] for column, (provider, kwargs) in self.fields.items()},
+            "locale": self.locale,
+            "faker": version("faker"),
+            "format": POOL_FORMAT_VERSION,
+        }
+        return hashlib.sha1(json.dumps(definition, sort_keys=True).encode()).hexdigest()[:12]
+
+
+USER_SCHEMA = DataSchema("users", {
+    "first_name": ("first_name", {}),
+    "last_name": ("last_name", {}),
+    "email": ("unique.email", {}),
+    "phone": ("phone_number", {}),
+    "address": ("address", {}),
+    "company": ("company", {}),
+    "job_title": ("job", {}),
+})
+
+CONTACT_SCHEMA = DataSchema("contact_form", {
+    "name": ("name", {}),
+    "message": ("text", {"max_nb_chars": 200}),
+})
+
+
+def generate_columns(schema: DataSchema, size: int, seed: int) -> dict[str, list]:
+    """
+    Generate a pool column by column
+
+    Each column is seeded from (seed, column name), so adding a column does not
+    change the values of the others.
+
+    Args:
+        schema: Data schema
+        size: Records per column
+        seed: Pool seed
+
+    Returns:
+        Column -> list of values
+    """
+    from faker import Faker
+
+    fake = Faker(schema.locale)
+    columns = {}
+    for column, (provider, kwargs) in schema.fields.items():
+        fake.seed_instance(seed ^ zlib.crc32(column.encode()))
+        fake.unique.clear()
+        generate = fake
+        for attribute in provider.split("."):
+            generate = getattr(generate, attribute)
+        columns[column] = [generate(**kwargs) for _ in range(size)]
+    return columns
+
+
+def worker_slice(size: int, worker: str | None = None, worker_count: int | None = None) -> range:
+    """
+    Get the record indices reserved for an xdist worker
+
+    Args:
+        size: Pool size
+        worker: Worker id like 'gw2' (defaults to PYTEST_XDIST_WORKER; None = whole pool)
+        worker_count: Number of workers (defaults to PYTEST_XDIST_WORKER_COUNT)
+
+    Returns:
+        Contiguous range that does not overlap any other worker's
+    """
+    worker = worker if worker is not None else os.getenv("PYTEST_XDIST_WORKER")
+    worker_count = worker_count or int(os.getenv("PYTEST_XDIST_WORKER_COUNT", "1"))
+    if not worker or worker_count <= 1:
+        return range(size)
+    index = int(worker.lstrip("gw"))
+    return range(size * index // worker_count, size * (index + 1) // worker_count)
+
+
+class DataPool:
+    """Pre-generated records of one schema, handed out from this worker's slice"""
+
+    def __init__(self, schema: DataSchema, columns: dict[str, list], seed: int, indices: range):
+        """
+        Initialize data pool
+
+        Args:
+            schema: Data schema
+            columns: Column -> values
+            seed: Seed the columns were generated with
+            indices: Records this process may hand out
+        """
+        self.schema = schema
+        self.columns = columns
+        self.seed = seed
+        self.indices = indices
+        self._cursor = 0
+        self._wrapped = False
+
+    def __len__(self) -> int:
+        """Number of records in the whole pool"""
+        return len(next(iter(self.columns.values()), []))
+
+    def record(self, index: int) -> dict:
+        """
+        Get one record
+
+        Args:
+            index: Record index in the whole pool
+
+        Returns:
+            Column -> value
+        """
+        return {column: values[index] for column, values in self.columns.items()}
+
+    def take(self, count: int = 1) -> list[dict]:
+        """
+        Take the next records of this worker's slice
+
+        Records are unique across workers until a slice is used up; it then
+        starts over (logged once) rather than failing the test.
+
+        Args:
+            count: Number of records
+
+        Returns:
+            List of records
+        """
+        records = []
+        for _ in range(count):
+            if self._cursor >= len(self.indices):
+                if not self._wrapped:
+                    logger.warning(
+                        "Data pool '%s' slice of %d records used up, reusing records (raise DATA_POOL_SIZE)",
+                        self.schema.name, len(self.indices),
+                    )
+                    self._wrapped = True
+                self._cursor = 0
+            records.append(self.record(self.indices[self._cursor]))
+            self._cursor += 1
+        return records
+
+    def next(self) -> dict:
+        """
+        Take the next record of this worker's slice
+
+        Returns:
+            Record
+        """
+        return self.take(1)[0]
+
+
+def load_pool(schema: DataSchema, size: int, seed: int, directory: str | Path) -> dict[str, list]:
+    """
+    Load a pool from the disk cache, generating it once if missing
+
+    The file name holds the schema fingerprint, size and seed, so any change
+    produces a new data version. Concurrent workers wait for the one generating.
+
+    Args:
+        schema: Data schema
+        size: Records per column
+        seed: Pool seed
+        directory: Cache directory
+
+    Returns:
+        Column -> list of values
+    """
+    path = Path(directory) / f"{schema.name}-{schema.fingerprint()}-{size}-{seed}.json"
+    if path.exists():
+        return json.loads(path.read_text(encoding="utf-8"))
+
+    with FileLock(path.with_suffix(".lock")):
+        if path.exists():
+            return json.loads(path.read_text(encoding="utf-8"))
+        started = time.perf_counter()
+        columns = generate_columns(schema, size, seed)
+        temporary = path.with_suffix(f".{os.getpid()}.tmp")
+        temporary.write_text(json.dumps(columns), encoding="utf-8")
+        os.replace(temporary, path)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        logger.info("Generated data pool %s (%d records) in %.0f ms", path.name, size, elapsed_ms)
+    return columns
+
+
+# (schema name, size, seed, directory) -> pool of this process
+_pools: dict[tuple, DataPool] = {}
+
+
+def get_data_pool(schema: DataSchema, size: int | None = None, seed: int | None = None) -> DataPool:
+    """
+    Get the pool of a schema for this process
+
+    Args:
+        schema: Data schema
+        size: Records in the pool (defaults to DATA_POOL_SIZE)
+        seed: Pool seed (defaults to DATA_POOL_SEED)
+
+    Returns:
+        DataPool handing out this worker's slice
+    """
+    size = size if size is not None else config.data_pool_size
+    seed = seed if seed is not None else config.data_pool_seed
+    key = (schema.name, size, seed, config.data_pool_dir)
+    pool = _pools.get(key)
+    if pool is None:
+        columns = load_pool(schema, size, seed, config.data_pool_dir)
+        pool = _pools[key] = DataPool(schema, columns, seed, worker_slice(size))
+    return pool
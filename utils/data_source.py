@@ -0,0 +1,309 @@
+"""
+Streaming Data Sources
+Lazily iterated JSON-lines, CSV, XLSX and multi-document YAML records for data-driven parametrization
+"""
+import csv
+import hashlib
+import json
+import os
+import pickle
+import re
+import tempfile
+from pathlib import Path
+from typing import Iterator
+
+# pytest cache key prefix of the ids and offsets collected per data file
+INDEX_CACHE_PREFIX = "sdet/data_index"
+
+# Directory (in the pytest cache or the temp dir) of record copies for formats that cannot be seeked
+SPILL_DIR = "sdet_data_sources"
+
+# Columns used as test id when no id_field is given
+DEFAULT_ID_FIELDS = ("id", "test_id", "case_id")
+
+SUFFIXES = (".jsonl", ".ndjson", ".json", ".csv", ".xlsx", ".xlsm", ".yaml", ".yml")
+
+
+def _scan_jsonl(path: Path) -> Iterator[tuple[int, dict]]:
+    """One JSON object per line (blank lines skipped), with the byte offset of each line"""
+    with open(path, "rb") as f:
+        while True:
+            offset = f.tell()
+            line = f.readline()
+            if not line:
+                return
+            if line.strip():
+                yield offset, json.loads(line)
+
+
+def _scan_csv(path: Path) -> Iterator[tuple[int, dict]]:
+    """Header row gives the keys (values stay strings), with the seek position of each row"""
+    with open(path, encoding="utf-8", newline="") as f:
+        # readline keeps tell() usable; a row may span lines inside quotes
+        reader = csv.DictReader(iter(f.readline, ""))
+        if reader.fieldnames is None:
+            return
+        while True:
+            offset = f.tell()
+            row = next(reader, None)
+            if row is None:
+                return
+            yield offset, row
+
+
+def _iter_jsonl(path: Path, sheet: str | None) -> Iterator[dict]:
+    """One JSON object per line; blank lines are skipped"""
+    return (record for _, record in _scan_jsonl(path))
+
+
+def _iter_json(path: Path, sheet: str | None) -> Iterator[dict]:
+    """A JSON array (or an object with one list value); read whole, prefer .jsonl for large sets"""
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    if isinstance(data, dict):
+        data = next((value for value in data.values() if isinstance(value, list)), [data])
+    yield from data
+
+
+def _iter_csv(path: Path, sheet: str | None) -> Iterator[dict]:
+    """Header row gives the keys; values stay strings"""
+    return (record for _, record in _scan_csv(path))
+
+
+def _iter_xlsx(path: Path, sheet: str | None) -> Iterator[dict]:
+    """Workbook opened read-only (rows streamed from the XML); first row of the sheet is the header"""
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        worksheet = workbook[sheet] if sheet else workbook.active
+        rows = worksheet.iter_rows(values_only=True)
+        header = [str(cell) if cell is not None else f"column_{index}" for index, cell in enumerate(next(rows, ()))]
+        for row in rows:
+            if any(cell is not None for cell in row):
+                yield dict(zip(header, row))
+    finally:
+        workbook.close()
+
+
+def _iter_yaml(path: Path, sheet: str | None) -> Iterator[dict]:
+    """Every document of a multi-document stream is a record; a document holding a list yields its items"""
+    import yaml
+
+    with open(path, encoding="utf-8") as f:
+        for document in yaml.safe_load_all(f):
+            if isinstance(document, list):
+                yield from document
+            elif document is not None:
+                yield document
+
+
+_READERS = {
+    ".jsonl": _iter_jsonl,
+    ".ndjson": _iter_jsonl,
+    ".json": _iter_json,
+    ".csv": _iter_csv,
+    ".xlsx": _iter_xlsx,
+    ".xlsm": _iter_xlsx,
+    ".yaml": _iter_yaml,
+    ".yml": _iter_yaml,
+}
+
+# Formats whose records can be read back by seeking the source file itself
+_SCANNERS = {
+    ".jsonl": _scan_jsonl,
+    ".ndjson": _scan_jsonl,
+    ".csv": _scan_csv,
+}
+
+
+def iter_records(path: str | Path, sheet: str | None = None) -> Iterator[dict]:
+    """
+    Iterate the records of a data file without loading it whole
+
+    Args:
+        path: .jsonl/.ndjson, .csv, .xlsx/.xlsm, .yaml/.yml (multi-document) or .json file
+        sheet: Worksheet name for Excel files (defaults to the active sheet)
+
+    Returns:
+        Iterator of record dicts
+
+    Raises:
+        ValueError: If the file type is not supported
+    """
+    path = Path(path)
+    reader = _READERS.get(path.suffix.lower())
+    if reader is None:
+        raise ValueError(f"Unsupported data file '{path.name}'. Supported: {', '.join(SUFFIXES)}")
+    return reader(path, sheet)
+
+
+def record_id(record: dict, index: int, id_field: str | None = None) -> str:
+    """
+    Build the test id of a record
+
+    Args:
+        record: Record
+        index: Position in the file (0-based)
+        id_field: Column holding the id (defaults to the first of DEFAULT_ID_FIELDS present)
+
+    Returns:
+        The id column's value, or 'row<N>' (1-based) when there is none
+    """
+    fields = (id_field,) if id_field else DEFAULT_ID_FIELDS
+    value = next((record[field] for field in fields if record.get(field) not in (None, "")), None)
+    if value is None:
+        return f"row{index + 1}"
+    return re.sub(r"\s+", "_", str(value).strip())
+
+
+class DataSource:
+    """
+    A data file indexed once at collection: test ids plus the seek offset of every record
+
+    JSON-lines and CSV records are read back by seeking the file itself. XLSX,
+    YAML and JSON records are copied to a pickle spill file while indexing and
+    read back from there, so any test order costs one seek per record.
+    """
+
+    def __init__(self, path: str | Path, sheet: str | None = None, id_field: str | None = None):
+        """
+        Initialize data source
+
+        Args:
+            path: Data file
+            sheet: Worksheet name for Excel files
+            id_field: Column used as test id
+        """
+        self.path = Path(path)
+        self.sheet = sheet
+        self.id_field = id_field
+        self._index: dict | None = None
+        self._csv_header: list[str] | None = None
+
+    def fingerprint(self) -> str:
+        """
+        Hash of the file version and read options (index cache key)
+
+        Returns:
+            Short hex digest of path, size, mtime, sheet and id_field
+        """
+        stat = self.path.stat()
+        key = f"{self.path.resolve()}|{stat.st_size}|{stat.st_mtime_ns}|{self.sheet}|{self.id_field}"
+        return hashlib.sha1(key.encode()).hexdigest()[:16]
+
+    def _scan(self, spill_path: Path) -> Iterator[tuple[int, dict]]:
+        """Yield (offset, record); formats without usable offsets are copied to spill_path as they stream"""
+        scanner = _SCANNERS.get(self.path.suffix.lower())
+        if scanner is not None:
+            yield from scanner(self.path)
+            return
+
+        spill_path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = spill_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(temporary, "wb") as f:
+            for record in iter_records(self.path, self.sheet):
+                offset = f.tell()
+                pickle.dump(record, f, protocol=pickle.HIGHEST_PROTOCOL)
+                yield offset, record
+        os.replace(temporary, spill_path)
+
+    def _build_index(self, cache=None) -> dict:
+        """Scan the file once for ids and offsets, reusing the cached index while the file is unchanged"""
+        fingerprint = self.fingerprint()
+        cache_key = f"{INDEX_CACHE_PREFIX}/{fingerprint}"
+        index = cache.get(cache_key, None) if cache is not None else None
+        if index is not None and (index["spill"] is None or Path(index["spill"]).exists()):
+            return index
+
+        spill_dir = cache.mkdir(SPILL_DIR) if cache is not None else Path(tempfile.gettempdir()) / SPILL_DIR
+        spill_path = Path(spill_dir) / f"{fingerprint}.pickle"
+        ids, offsets, seen = [], [], {}
+        for position, (offset, record) in enumerate(self._scan(spill_path)):
+            test_id = record_id(record, position, self.id_field)
+            seen[test_id] = seen.get(test_id, 0) + 1
+            ids.append(test_id if seen[test_id] == 1 else f"{test_id}-{seen[test_id]}")
+            offsets.append(offset)
+
+        spill = None if self.path.suffix.lower() in _SCANNERS else str(spill_path)
+        index = {"ids": ids, "offsets": offsets, "spill": spill}
+        if cache is not None:
+            cache.set(cache_key, index)
+        return index
+
+    def ids(self, limit: int | None = None, cache=None) -> list[str]:
+        """
+        Get the test id of every record (only ids and offsets are kept in memory)
+
+        Duplicate ids get a '-2', '-3'... suffix so every id stays unique and stable.
+
+        Args:
+            limit: Only the first N records
+            cache: config.cache to reuse the index while the file is unchanged (every xdist worker collects)
+
+        Returns:
+            Test ids in file order
+        """
+        if self._index is None:
+            self._index = self._build_index(cache)
+        ids = self._index["ids"]
+        return ids[:limit] if limit is not None else ids
+
+    def record(self, index: int) -> dict:
+        """
+        Get one record by seeking to its offset (any test order costs the same)
+
+        Args:
+            index: Record position (0-based)
+
+        Returns:
+            Record
+
+        Raises:
+            IndexError: If the file has fewer records
+        """
+        if self._index is None:
+            self._index = self._build_index()
+        offsets = self._index["offsets"]
+        if not 0 <= index < len(offsets):
+            raise IndexError(f"{self.path.name} has no record {index}")
+        offset = offsets[index]
+
+        if self._index["spill"] is not None:
+            with open(self._index["spill"], "rb") as f:
+                f.seek(offset)
+                return pickle.load(f)
+
+        if self.path.suffix.lower() == ".csv":
+            with open(self.path, encoding="utf-8", newline="") as f:
+                if self._csv_header is None:
+                    self._csv_header = next(csv.reader(iter(f.readline, "")))
+                f.seek(offset)
+                return next(csv.DictReader(iter(f.readline, ""), fieldnames=self._csv_header))
+
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            return json.loads(f.readline())
+
+
+# (path, sheet, id_field) -> data source of this process
+_sources: dict[tuple, DataSource] = {}
+
+
+def get_data_source(path: str | Path, sheet: str | None = None, id_field: str | None = None) -> DataSource:
+    """
+    Get the shared data source of a file
+
+    Args:
+        path: Data file
+        sheet: Worksheet name for Excel files
+        id_field: Column used as test id
+
+    Returns:
+        DataSource
+    """
+    key = (str(Path(path).resolve()), sheet, id_field)
+    source = _sources.get(key)
+    if source is None:
+        source = _sources[key] = DataSource(path, sheet, id_field)
+    return source
@@ -0,0 +1,261 @@
+"""
+Duration Scheduler
+Per-test duration history and longest-processing-time (LPT) scheduling for pytest-xdist
+"""
+import heapq
+from functools import lru_cache
+from statistics import median
+
+# pytest cache key of the duration history (.pytest_cache/v/sdet/test_durations)
+HISTORY_KEY = "sdet/test_durations"
+
+# Seconds assumed for a test when nothing is known about it or its neighbours
+DEFAULT_ESTIMATE = 1.0
+
+# Weight of the latest run in the moving average
+SMOOTHING = 0.5
+
+
+def _estimate_groups(nodeid: str) -> list[str]:
+    """
+    Get the groups a test's estimate can fall back to, closest first
+
+    Args:
+        nodeid: Pytest node id, e.g. 'tests/test_a.py::TestA::test_b[1]'
+
+    Returns:
+        e.g. ['tests/test_a.py::TestA::test_b', 'tests/test_a.py::TestA', 'tests/test_a.py']
+    """
+    base = nodeid.split("[", 1)[0]
+    parts = base.split("::")
+    return [base] + ["::".join(parts[:end]) for end in range(len(parts) - 1, 0, -1)]
+
+
+class DurationHistory:
+    """Moving average of each test's total time (setup + call + teardown, including reruns)"""
+
+    def __init__(self, durations: dict | None = None):
+        """
+        Initialize duration history
+
+        Args:
+            durations: Mapping of node id to seconds
+        """
+        self.durations = dict(durations or {})
+
+    @classmethod
+    def load(cls, cache) -> "DurationHistory":
+        """
+        Load the history from the pytest cache
+
+        Args:
+            cache: config.cache, or None when the cache provider is disabled
+
+        Returns:
+            DurationHistory (empty on first run)
+        """
+        return cls(cache.get(HISTORY_KEY, {}) if cache is not None else {})
+
+    def save(self, cache) -> None:
+        """
+        Store the history in the pytest cache
+
+        Args:
+            cache: config.cache, or None when the cache provider is disabled
+        """
+        if cache is not None:
+            cache.set(HISTORY_KEY, self.durations)
+
+    def record(self, nodeid: str, seconds: float) -> None:
+        """
+        Add a run of a test
+
+        Args:
+            nodeid: Pytest node id
+            seconds: Total time of the run
+        """
+        previous = self.durations.get(nodeid)
+        self.durations[nodeid] = seconds if previous is None else previous + SMOOTHING * (seconds - previous)
+
+    def estimate_all(self, nodeids: list[str]) -> list[float]:
+        """
+        Estimate the duration of each test
+
+        Tests without history get the mean of their closest known group (other
+        parametrizations, then class, then module), else the median of all known
+        tests. Tests that were rerun keep the rerun time in their average.
+
+        Args:
+            nodeids: Pytest node ids
+
+        Returns:
+            Estimated seconds per test, in the same order
+        """
+        group_totals: dict[str, list[float]] = {}
+        for nodeid, seconds in self.durations.items():
+            for group in _estimate_groups(nodeid):
+                totals = group_totals.setdefault(group, [0.0, 0])
+                totals[0] += seconds
+                totals[1] += 1
+        fallback = median(self.durations.values()) if self.durations else DEFAULT_ESTIMATE
+
+        estimates = []
+        for nodeid in nodeids:
+            seconds = self.durations.get(nodeid)
+            if seconds is None:
+                known = next((group_totals[group] for group in _estimate_groups(nodeid) if group in group_totals), None)
+                seconds = known[0] / known[1] if known else fallback
+            estimates.append(seconds)
+        return estimates
+
+
+def lpt_makespan(estimates: list[float], workers: int) -> float:
+    """
+    Simulate LPT assignment of estimated durations
+
+    Args:
+        estimates: Seconds per test
+        workers: Number of workers
+
+    Returns:
+        Time until the last worker finishes
+    """
+    loads = [0.0] * max(1, workers)
+    for seconds in sorted(estimates, reverse=True):
+        heapq.heapreplace(loads, loads[0] + seconds)
+    return max(loads)
+
+
+class DurationSchedulingMixin:
+    """
+    xdist scheduler behaviour dispatching the longest estimated tests first to whichever worker is free
+
+    Each worker holds two tests (it needs to know its next test before running
+    the current one); every completed test is replaced by the longest pending one.
+    Tests of one class may land on different workers, so class-scoped fixtures
+    are set up more often than with --dist=loadscope.
+    """
+
+    def __init__(self, config, log=None, history: DurationHistory | None = None, on_schedule=None):
+        """
+        Initialize duration scheduling
+
+        Args:
+            config: Pytest config
+            log: xdist log producer
+            history: Duration history used for estimates
+            on_schedule: Called with (collection, estimates, workers) once the order is fixed
+        """
+        super().__init__(config, log)
+        self.history = history or DurationHistory()
+        self.on_schedule = on_schedule
+
+    def schedule(self) -> None:
+        """Order the collection longest-first and start two tests per worker"""
+        assert self.collection_is_completed
+
+        # Initial distribution already happened, reschedule on all nodes
+        if self.collection is not None:
+            for node in self.nodes:
+                self.check_schedule(node)
+            return
+
+        if not self._check_nodes_have_same_collection():
+            self.log("**Different tests collected, aborting run**")
+            return
+
+        self.collection = next(iter(self.node2collection.values()))
+        estimates = self.history.estimate_all(self.collection)
+        self.pending[:] = sorted(range(len(self.collection)), key=lambda index: estimates[index], reverse=True)
+        if self.on_schedule is not None:
+            self.on_schedule(self.collection, estimates, len(self.nodes))
+        if not self.collection:
+            return
+
+        for _ in range(2):
+            for node in self.nodes:
+                self._send_tests(node, 1)
+
+        if not self.pending:
+            for node in self.nodes:
+                node.shutdown()
+
+    def check_schedule(self, node, duration: float = 0) -> None:
+        """Top the worker up to two tests with the longest pending ones"""
+        if node.shutting_down:
+            return
+        if self.pending:
+            missing = 2 - len(self.node2pending[node])
+            if missing > 0:
+                self._send_tests(node, missing)
+        else:
+            node.shutdown()
+        self.log("num items waiting for node:", len(self.pending))
+
+
+@lru_cache(maxsize=None)
+def _duration_scheduling_class() -> type:
+    """Combine the mixin with xdist's LoadScheduling, importing xdist.scheduler only when a run is distributed"""
+    from xdist.scheduler import LoadScheduling
+    return type("DurationScheduling", (DurationSchedulingMixin, LoadScheduling), {"__module__": __name__})
+
+
+def __getattr__(name: str):
+    """Expose DurationScheduling without importing xdist.scheduler (~130 ms) in single-process runs"""
+    if name == "DurationScheduling":
+        return _duration_scheduling_class()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class DurationSchedulerPlugin:
+    """Records test durations and provides DurationScheduling when --duration-schedule is set"""
+
+    def __init__(self, config):
+        """
+        Initialize plugin
+
+        Args:
+            config: Pytest config
+        """
+        self.config = config
+        self.cache = getattr(config, "cache", None)
+        self.history = DurationHistory.load(self.cache)
+        self.run_totals: dict[str, float] = {}
+        self.predicted: dict | None = None
+
+    def pytest_xdist_make_scheduler(self, config, log):
+        """Replace xdist's scheduler when duration scheduling is requested"""
+        if not config.getoption("duration_schedule"):
+            return None
+        return _duration_scheduling_class()(config, log, self.history, self._on_schedule)
+
+    def _on_schedule(self, collection: list[str], estimates: list[float], workers: int) -> None:
+        """Remember the predicted makespan for the terminal summary"""
+        self.predicted = {
+            "tests": len(collection),
+            "known": sum(nodeid in self.history.durations for nodeid in collection),
+            "workers": workers,
+            "total": sum(estimates),
+            "makespan": lpt_makespan(estimates, workers),
+        }
+
+    def pytest_runtest_logreport(self, report):
+        """Add up the phases (and reruns) of every test"""
+        self.run_totals[report.nodeid] = self.run_totals.get(report.nodeid, 0.0) + report.duration
+
+    def pytest_sessionfinish(self, session):
+        """Fold this run into the history"""
+        for nodeid, seconds in self.run_totals.items():
+            self.history.record(nodeid, seconds)
+        self.history.save(self.cache)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        """Show the estimated schedule"""
+        if self.predicted is None:
+            return
+        predicted = self.predicted
+        terminalreporter.write_sep("-", "duration scheduling")
+        terminalreporter.write_line(
+            f"{predicted['known']}/{predicted['tests']} tests with history; estimated {predicted['total']:.1f} s "
+            f"of work, LPT makespan {predicted['makespan']:.1f} s on {predicted['workers']} workers"
+        )
@@ -0,0 +1,88 @@
+"""
+File Lock
+Cross-process lock shared by the storage state cache and the data pools (no browser dependencies)
+"""
+import os
+import random
+import time
+from pathlib import Path
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Retry backoff while another process holds the lock: 50 ms doubling up to 1 s, +/-25% jitter
+INITIAL_DELAY = 0.05
+MAX_DELAY = 1.0
+JITTER = 0.25
+
+
+class FileLock:
+    """
+    Cross-process lock on a lock file created with O_CREAT | O_EXCL
+
+    Works the same on Linux, macOS and Windows and on shared CI volumes. A lock
+    older than stale_after seconds (a crashed worker) is broken.
+    """
+
+    def __init__(self, path: str | Path, timeout: float = 120, stale_after: float = 300):
+        """
+        Initialize file lock
+
+        Args:
+            path: Lock file path
+            timeout: Seconds to wait for the lock
+            stale_after: Seconds after which an abandoned lock is removed
+        """
+        self.path = Path(path)
+        self.timeout = timeout
+        self.stale_after = stale_after
+
+    def acquire(self) -> None:
+        """
+        Take the lock, waiting with backoff while another process holds it
+
+        Raises:
+            TimeoutError: If the lock could not be taken within timeout
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        deadline = time.monotonic() + self.timeout
+        delay = INITIAL_DELAY
+        while True:
+            try:
+                descriptor = os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                os.write(descriptor, str(os.getpid()).encode())
+                os.close(descriptor)
+                return
+            except FileExistsError:
+                self._break_if_stale()
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"Could not lock {self.path} within {self.timeout:.0f} s")
+            # Jitter keeps waiting workers from retrying in lockstep
+            time.sleep(delay * random.uniform(1 - JITTER, 1 + JITTER))
+            delay = min(delay * 2, MAX_DELAY)
+
+    def _break_if_stale(self) -> None:
+        """Remove the lock file if its holder has not released it for stale_after seconds"""
+        try:
+            if time.time() - self.path.stat().st_mtime > self.stale_after:
+                logger.warning("Breaking stale lock %s", self.path)
+                self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+    def release(self) -> None:
+        """Release the lock"""
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+    def __enter__(self) -> "FileLock":
+        """Acquire the lock"""
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Release the lock"""
+        self.release()
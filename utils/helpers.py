@@ -45,10 +45,12 @@ def wait_for_condition(
     """
     Wait for a condition to be true
 
+    Checks immediately, then re-checks with backoff (10 ms growing to poll_interval)
+
     Args:
         condition: Function that returns boolean
         timeout: Maximum time to wait in seconds
-        poll_interval: Time between checks in seconds
+        poll_interval: Longest time between checks in seconds
         error_message: Error message if timeout
 
     Returns:
@@ -57,12 +59,14 @@ def wait_for_condition(
     Raises:
         TimeoutError: If condition not met within timeout
     """
-    end_time = time.time() + timeout
-    while time.time() < end_time:
-        if condition():
-            return True
-        time.sleep(poll_interval)
-    raise TimeoutError(error_message)
+    # Imported here: utils.waits loads playwright, which the other helpers do not need
+    from utils.waits import wait_until
+
+    try:
+        wait_until(condition, timeout * 1000, error_message, max_delay=poll_interval)
+    except TimeoutError:
+        raise TimeoutError(error_message) from None
+    return True
 
 
 def retry_on_exception(
@@ -74,10 +78,13 @@ def retry_on_exception(
     """
     Retry function on exception
 
+    Delays start at a quarter of 'delay' and double (with jitter) up to 'delay',
+    so a briefly failing call is retried quickly.
+
     Args:
         func: Function to retry
         max_attempts: Maximum number of attempts
-        delay: Delay between attempts in seconds
+        delay: Longest delay between attempts in seconds
         exceptions: Tuple of exceptions to catch
 
     Returns:
@@ -86,14 +93,17 @@ def retry_on_exception(
     Raises:
         Last exception if all attempts fail
     """
+    from utils.waits import backoff_delays
+
     last_exception = None
+    delays = backoff_delays(initial=delay / 4, maximum=delay)
     for attempt in range(max_attempts):
         try:
             return func()
         except exceptions as e:
             last_exception = e
             if attempt < max_attempts - 1:
-                time.sleep(delay)
+                time.sleep(next(delays))
     raise last_exception  # type: ignore
 
 
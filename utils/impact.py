@@ -0,0 +1,380 @@
+"""
+Test Impact Analysis
+Records the page object symbols each test touches and selects the tests affected by a git diff
+"""
+import ast
+import functools
+import importlib
+import inspect
+import re
+import subprocess
+import textwrap
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# pytest cache key of the impact map (.pytest_cache/v/sdet/impact_map)
+IMPACT_MAP_KEY = "sdet/impact_map"
+
+# Package holding the page objects (relative to the rootdir)
+PAGES_DIR = "pages"
+
+# Tests always selected
+ALWAYS_RUN_MARKERS = ("smoke", "critical")
+
+# Changed files that never affect test outcomes (docs, benchmarks and the framework's own output)
+IGNORED_PATTERNS = (
+    re.compile(r".*\.md$"),
+    re.compile(r"^(docs|benchmarks|reports|logs|screenshots|traces|allure-results)/"),
+)
+
+HUNK_PATTERN = re.compile(r"^@@ -\d+(?:,\d+)? \+(?P<start>\d+)(?:,(?P<count>\d+))? @@")
+
+# Methods called by the running test (filled by instrumented page classes)
+_touched: set[str] = set()
+
+
+class Symbol:
+    """A top-level or class-level definition in a page module"""
+
+    def __init__(self, key: str, name: str, start: int, end: int, is_method: bool, references: set):
+        """
+        Initialize symbol
+
+        Args:
+            key: 'pages/<file>.py::Class.name' or 'pages/<file>.py::name'
+            name: Short name
+            start: First line (including decorators)
+            end: Last line
+            is_method: True for functions defined in a class
+            references: Names used in the definition
+        """
+        self.key = key
+        self.name = name
+        self.start = start
+        self.end = end
+        self.is_method = is_method
+        self.references = references
+
+
+def _references(node: ast.AST) -> set:
+    """Collect names and attribute names used in a definition"""
+    names = set()
+    for child in ast.walk(node):
+        if isinstance(child, ast.Name):
+            names.add(child.id)
+        elif isinstance(child, ast.Attribute):
+            names.add(child.attr)
+    return names
+
+
+def _first_line(node: ast.AST) -> int:
+    """First line of a definition, including its decorators"""
+    decorators = getattr(node, "decorator_list", [])
+    return min([node.lineno] + [decorator.lineno for decorator in decorators])
+
+
+def _definitions(body: list, prefix: str, relative: str, in_class: bool):
+    """Yield Symbols for the functions, classes' members and assignments of a module or class body"""
+    for node in body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            yield Symbol(
+                f"{relative}::{prefix}{node.name}", node.name, _first_line(node), node.end_lineno,
+                in_class, _references(node)
+            )
+        elif isinstance(node, ast.ClassDef):
+            yield from _definitions(node.body, f"{node.name}.", relative, True)
+        elif isinstance(node, (ast.Assign, ast.AnnAssign)):
+            targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+            for target in targets:
+                # Module state such as 'logger' is not tracked; changing it counts as a whole-file change
+                if isinstance(target, ast.Name) and (prefix or target.id.isupper()):
+                    yield Symbol(
+                        f"{relative}::{prefix}{target.id}", target.id, node.lineno, node.end_lineno,
+                        False, _references(node.value) if node.value is not None else set()
+                    )
+
+
+class PageIndex:
+    """Static index of the page modules: symbols, their line ranges and what they reference"""
+
+    def __init__(self, rootdir: Path):
+        """
+        Parse every module of the pages package
+
+        Args:
+            rootdir: Project root
+        """
+        self.rootdir = rootdir
+        self.symbols: dict[str, list[Symbol]] = {}
+        for path in sorted((rootdir / PAGES_DIR).glob("*.py")):
+            relative = path.relative_to(rootdir).as_posix()
+            tree = ast.parse(path.read_text(encoding="utf-8-sig"))
+            self.symbols[relative] = list(_definitions(tree.body, "", relative, False))
+
+        # Non-method symbols by short name (selector constants, scripts, helper functions)
+        self.by_name: dict[str, list[str]] = {}
+        self.references: dict[str, set] = {}
+        for symbols in self.symbols.values():
+            for symbol in symbols:
+                self.references[symbol.key] = symbol.references
+                if not symbol.is_method:
+                    self.by_name.setdefault(symbol.name, []).append(symbol.key)
+
+    def closure(self, keys: set, names: set = frozenset()) -> set:
+        """
+        Expand symbols with the constants, scripts and helpers they use, transitively
+
+        Args:
+            keys: Symbol keys (e.g. recorded method calls)
+            names: Extra referenced names (e.g. constants used directly by a test)
+
+        Returns:
+            Set of symbol keys
+        """
+        result = set(keys)
+        pending = set(names)
+        for key in keys:
+            pending |= self.references.get(key, set())
+        while pending:
+            for key in self.by_name.get(pending.pop(), []):
+                if key not in result:
+                    result.add(key)
+                    pending |= self.references.get(key, set())
+        return result
+
+    def symbols_at(self, relative: str, lines: set | None) -> set:
+        """
+        Get the symbols of a page module covering changed lines
+
+        Args:
+            relative: Page module path relative to the rootdir
+            lines: Changed line numbers, or None for a whole-file change
+
+        Returns:
+            Symbol keys; every symbol of the file if a change falls outside all of them (imports, docstring)
+        """
+        symbols = self.symbols.get(relative, [])
+        if lines is None:
+            return {symbol.key for symbol in symbols}
+        hit = set()
+        for line in lines:
+            covering = [symbol.key for symbol in symbols if symbol.start <= line <= symbol.end]
+            if not covering:
+                return {symbol.key for symbol in symbols}
+            hit.update(covering)
+        return hit
+
+
+def _instrumented(function, key: str):
+    """Wrap a page object function so calls are recorded"""
+    if inspect.iscoroutinefunction(function):
+        @functools.wraps(function)
+        async def async_wrapper(*args, **kwargs):
+            _touched.add(key)
+            return await function(*args, **kwargs)
+        return async_wrapper
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        _touched.add(key)
+        return function(*args, **kwargs)
+    return wrapper
+
+
+def instrument_page_classes(index: PageIndex) -> int:
+    """
+    Wrap every method of the page classes so the running test's calls are recorded
+
+    Args:
+        index: Page index (methods are looked up by module and qualified name)
+
+    Returns:
+        Number of methods instrumented
+    """
+    count = 0
+    for relative, symbols in index.symbols.items():
+        module = importlib.import_module(relative[:-3].replace("/", "."))
+        for symbol in symbols:
+            if not symbol.is_method:
+                continue
+            class_name = symbol.key.split("::", 1)[1].split(".", 1)[0]
+            owner = getattr(module, class_name, None)
+            member = vars(owner).get(symbol.name) if owner is not None else None
+            if isinstance(member, staticmethod):
+                setattr(owner, symbol.name, staticmethod(_instrumented(member.__func__, symbol.key)))
+            elif isinstance(member, classmethod):
+                setattr(owner, symbol.name, classmethod(_instrumented(member.__func__, symbol.key)))
+            elif inspect.isfunction(member):
+                setattr(owner, symbol.name, _instrumented(member, symbol.key))
+            else:
+                continue
+            count += 1
+    return count
+
+
+def changed_lines(base: str, rootdir: Path) -> dict[str, set | None]:
+    """
+    Get the lines changed since a git revision, including untracked files
+
+    Args:
+        base: Git revision to diff against (e.g. 'HEAD', 'origin/main')
+        rootdir: Repository root
+
+    Returns:
+        Mapping of path (relative to rootdir) to changed line numbers, None for whole-file changes
+    """
+    diff = subprocess.run(
+        ["git", "diff", "--unified=0", "--no-color", "--no-renames", base, "--"],
+        cwd=rootdir, capture_output=True, text=True, check=True
+    ).stdout
+    changes: dict[str, set | None] = {}
+    old_path = current = None
+    for line in diff.splitlines():
+        if line.startswith("--- "):
+            old_path = line[6:] if line.startswith("--- a/") else None
+        elif line.startswith("+++ "):
+            # Deleted files only have an old path; deleted and new files count as whole-file changes
+            current = line[6:] if line.startswith("+++ b/") else old_path
+            changes[current] = set() if old_path is not None and line.startswith("+++ b/") else None
+        elif line.startswith("@@") and current is not None and changes.get(current) is not None:
+            match = HUNK_PATTERN.match(line)
+            start = int(match.group("start"))
+            count = int(match.group("count") or 1)
+            # Pure deletions (count 0) are attributed to the line before the removed block
+            changes[current].update(range(start, start + count) if count else {max(start, 1)})
+
+    untracked = subprocess.run(
+        ["git", "ls-files", "--others", "--exclude-standard"],
+        cwd=rootdir, capture_output=True, text=True, check=True
+    ).stdout
+    for path in untracked.splitlines():
+        changes[path] = None
+    return changes
+
+
+def _test_constant_names(item) -> set:
+    """Names referenced in the source of a test function (e.g. selector constants used directly)"""
+    try:
+        return _references(ast.parse(textwrap.dedent(inspect.getsource(item.function))))
+    except (OSError, TypeError, SyntaxError, AttributeError):
+        return set()
+
+
+class ImpactPlugin:
+    """Records touched symbols per test and deselects tests a diff cannot affect"""
+
+    def __init__(self, config, base: str | None, record: bool):
+        """
+        Initialize impact plugin
+
+        Args:
+            config: Pytest config
+            base: Git revision to select against, or None to run everything
+            record: Record touched symbols and refresh the impact map
+        """
+        self.config = config
+        self.base = base
+        self.record = record
+        self.rootdir = Path(str(config.rootpath))
+        self.cache = getattr(config, "cache", None)
+        self.index = PageIndex(self.rootdir)
+        stored = self.cache.get(IMPACT_MAP_KEY, {}) if self.cache is not None else {}
+        self.impact_map: dict[str, list[str]] = stored.get("tests", {})
+        self.recorded: dict[str, list[str]] = {}
+        self.selection_note: str | None = None
+        if record:
+            logger.info("Impact recording: instrumented %d page object methods", instrument_page_classes(self.index))
+
+    def affected_symbols(self) -> tuple[set | None, set]:
+        """
+        Map the diff to page symbols
+
+        Returns:
+            Tuple of (changed symbol keys or None if the change can affect anything, changed test files)
+        """
+        symbols, test_files = set(), set()
+        for path, lines in changed_lines(self.base, self.rootdir).items():
+            if any(pattern.match(path) for pattern in IGNORED_PATTERNS):
+                continue
+            if path.startswith(f"{PAGES_DIR}/") and path.endswith(".py"):
+                symbols |= self.index.symbols_at(path, lines)
+            elif re.match(r"^tests/test_[^/]*\.py$", path):
+                test_files.add(path)
+            else:
+                logger.info("Impact selection: %s may affect any test, running everything", path)
+                return None, test_files
+        return symbols, test_files
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(self, session, config, items):
+        """Keep the affected tests, tests without a recorded map and the always-run markers"""
+        if self.base is None:
+            return
+        symbols, test_files = self.affected_symbols()
+        if symbols is None:
+            self.selection_note = "change outside pages/ and tests/, all tests selected"
+            return
+
+        selected, deselected = [], []
+        for item in items:
+            touched = self.impact_map.get(item.nodeid)
+            if (
+                touched is None
+                or item.nodeid.split("::", 1)[0] in test_files
+                or any(item.get_closest_marker(marker) for marker in ALWAYS_RUN_MARKERS)
+                or symbols.intersection(touched)
+            ):
+                selected.append(item)
+            else:
+                deselected.append(item)
+
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+            items[:] = selected
+        self.selection_note = (
+            f"{len(selected)} of {len(selected) + len(deselected)} tests affected by "
+            f"{len(symbols)} changed page symbols and {len(test_files)} changed test files since {self.base}"
+        )
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_setup(self, item):
+        """Start recording the test's calls"""
+        _touched.clear()
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_runtest_teardown(self, item):
+        """Attach the test's touched symbols to its teardown report (read by the controller under xdist)"""
+        if self.record:
+            touched = self.index.closure(set(_touched), _test_constant_names(item))
+            item.user_properties.append(("impact_symbols", sorted(touched)))
+
+    def pytest_runtest_logreport(self, report):
+        """Collect touched symbols from teardown reports"""
+        if report.when != "teardown":
+            return
+        for name, value in report.user_properties:
+            if name == "impact_symbols":
+                self.recorded[report.nodeid] = value
+
+    def pytest_sessionfinish(self, session):
+        """Merge this run's recordings into the impact map (controller / single process only)"""
+        if not self.record or hasattr(self.config, "workerinput") or self.cache is None:
+            return
+        self.impact_map.update(self.recorded)
+        updated = datetime.now().isoformat(timespec="seconds")
+        self.cache.set(IMPACT_MAP_KEY, {"updated": updated, "tests": self.impact_map})
+
+    def pytest_terminal_summary(self, terminalreporter):
+        """Show what the impact selection did"""
+        if self.selection_note or self.recorded:
+            terminalreporter.write_sep("-", "test impact")
+        if self.selection_note:
+            terminalreporter.write_line(self.selection_note)
+        if self.recorded:
+            terminalreporter.write_line(f"Impact map refreshed for {len(self.recorded)} tests")
@@ -1,11 +1,24 @@
 """
 Custom Logger Configuration
-Provides colored console and file logging
+Provides colored console and file logging through one queue-based pipeline per process
 """
+import atexit
 import logging
+import os
+import queue
 import sys
-from pathlib import Path
+import threading
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
+from pathlib import Path
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# Log file -> QueueHandler feeding that file's listener (one writer per file per process)
+_queue_handlers: dict[str | None, QueueHandler] = {}
+_listeners: list[QueueListener] = []
+_pipeline_lock = threading.Lock()
 
 
 class ColoredFormatter(logging.Formatter):
@@ -22,11 +35,71 @@ class ColoredFormatter(logging.Formatter):
     }
 
     def format(self, record):
-        """Format log record with colors"""
+        """Format log record with colors (on a copy, so other handlers see the plain record)"""
         log_color = self.COLORS.get(record.levelname, self.COLORS['RESET'])
-        record.levelname = f"{log_color}{record.levelname}{self.COLORS['RESET']}"
-        record.name = f"{self.COLORS['RESET']}{record.name}{self.COLORS['RESET']}"
-        return super().format(record)
+        colored = logging.makeLogRecord(record.__dict__)
+        colored.levelname = f"{log_color}{record.levelname}{self.COLORS['RESET']}"
+        colored.name = f"{self.COLORS['RESET']}{record.name}{self.COLORS['RESET']}"
+        return super().format(colored)
+
+
+class ConsoleHandler(logging.StreamHandler):
+    """Stream handler that drops records once its stream is closed (xdist workers close stdout before atexit)"""
+
+    def emit(self, record):
+        """Write the record unless the stream is already closed"""
+        if not getattr(self.stream, "closed", False):
+            super().emit(record)
+
+
+def _queue_handler(log_file: str | None) -> QueueHandler:
+    """
+    Get the queue handler for a log file, starting its listener on first use
+
+    Records are formatted into plain messages by the caller and written to the
+    console and file by the listener thread, so logging calls never wait on I/O.
+
+    Args:
+        log_file: Log file path, or None for console only
+
+    Returns:
+        QueueHandler shared by every logger writing to log_file
+    """
+    with _pipeline_lock:
+        handler = _queue_handlers.get(log_file)
+        if handler is not None:
+            return handler
+
+        console_handler = ConsoleHandler(sys.stdout)
+        console_handler.setFormatter(ColoredFormatter(LOG_FORMAT, datefmt=DATE_FORMAT))
+        handlers = [console_handler]
+
+        if log_file:
+            log_path = Path(log_file)
+            log_path.parent.mkdir(parents=True, exist_ok=True)
+            file_handler = logging.FileHandler(log_file, encoding='utf-8')
+            file_handler.setFormatter(logging.Formatter(LOG_FORMAT, datefmt=DATE_FORMAT))
+            handlers.append(file_handler)
+
+        log_queue = queue.SimpleQueue()
+        listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        listener.start()
+        _listeners.append(listener)
+
+        handler = QueueHandler(log_queue)
+        _queue_handlers[log_file] = handler
+        return handler
+
+
+def shutdown_logging() -> None:
+    """Write out queued records and stop the listener threads"""
+    with _pipeline_lock:
+        while _listeners:
+            _listeners.pop().stop()
+        _queue_handlers.clear()
+
+
+atexit.register(shutdown_logging)
 
 
 def setup_logger(
@@ -51,35 +124,26 @@ def setup_logger(
     if logger.handlers:
         return logger
 
+    # Records below the logger level are dropped before a LogRecord is created
     logger.setLevel(level)
-
-    # Console handler with colors
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(level)
-    console_formatter = ColoredFormatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
-
-    # File handler (optional)
-    if log_file:
-        log_path = Path(log_file)
-        log_path.parent.mkdir(parents=True, exist_ok=True)
-
-        file_handler = logging.FileHandler(log_file, encoding='utf-8')
-        file_handler.setLevel(level)
-        file_formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
+    logger.addHandler(_queue_handler(log_file))
 
     return logger
 
 
+def default_log_file() -> str:
+    """
+    Get the daily log file of this process (one file per xdist worker)
+
+    Returns:
+        Log file path
+    """
+    timestamp = datetime.now().strftime("%Y%m%d")
+    worker = os.getenv("PYTEST_XDIST_WORKER")
+    suffix = f"_{worker}" if worker else ""
+    return str(Path("logs") / f"test_automation_{timestamp}{suffix}.log")
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Get or create logger with default configuration
@@ -90,12 +154,7 @@ def get_logger(name: str) -> logging.Logger:
     Returns:
         Logger instance
     """
-    # Create logs directory if it doesn't exist
-    log_dir = Path("logs")
-    log_dir.mkdir(exist_ok=True)
-
-    # Create log file with timestamp
-    timestamp = datetime.now().strftime("%Y%m%d")
-    log_file = log_dir / f"test_automation_{timestamp}.log"
-
-    return setup_logger(name, str(log_file))
+    logger = logging.getLogger(name)
+    if logger.handlers:
+        return logger
+    return setup_logger(name, default_log_file())
@@ -0,0 +1,126 @@
+"""
+Offline Site
+Serves captured page snapshots in place of the live site
+"""
+from functools import lru_cache
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from playwright.sync_api import BrowserContext, Route
+
+from utils.helpers import get_project_root
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Hosts whose pages are served from snapshots
+SNAPSHOT_HOSTS = ("ultimateqa.com", "www.ultimateqa.com")
+
+# Local hosts (e.g. the stub server) are allowed through untouched
+LOCAL_HOSTS = ("127.0.0.1", "localhost")
+
+# URL path -> snapshot file (relative to the project root)
+SNAPSHOTS = {
+    "/automation": "scripts/page_content.html",
+    "/complicated-page": "test_data/snapshots/complicated_page.html",
+    "/fake-landing-page": "test_data/snapshots/fake_landing_page.html",
+    "/fake-pricing-page": "test_data/snapshots/fake_pricing_page.html",
+}
+
+
+def normalize_path(path: str) -> str:
+    """
+    Normalize a URL path for snapshot lookup
+
+    Args:
+        path: URL path
+
+    Returns:
+        Path without trailing slash ("/" for the root)
+    """
+    return path.rstrip("/") or "/"
+
+
+class OfflineSite:
+    """In-memory snapshot site used to fulfill navigations without network access"""
+
+    def __init__(self, snapshots: dict[str, str] | None = None, hosts: tuple = SNAPSHOT_HOSTS):
+        """
+        Initialize offline site
+
+        Args:
+            snapshots: Mapping of URL path to snapshot file
+            hosts: Host names served from snapshots
+        """
+        self.hosts = hosts
+        self.pages: dict[str, bytes] = {}
+        root = get_project_root()
+        for path, file_name in (snapshots or SNAPSHOTS).items():
+            self.pages[normalize_path(path)] = Path(root, file_name).read_bytes()
+        logger.info("Loaded %d offline snapshots", len(self.pages))
+
+    def lookup(self, url: str) -> bytes | None:
+        """
+        Get the snapshot body for a URL
+
+        Args:
+            url: Request URL
+
+        Returns:
+            Snapshot body or None if the URL is not part of the snapshot site
+        """
+        parts = urlsplit(url)
+        if parts.hostname not in self.hosts:
+            return None
+        return self.pages.get(normalize_path(parts.path))
+
+    def install(self, context: BrowserContext) -> None:
+        """
+        Route all requests of a browser context through the snapshot site
+
+        Args:
+            context: Browser context
+        """
+        context.route("**/*", self._handle_route)
+
+    async def install_async(self, context) -> None:
+        """
+        Route all requests of an async browser context through the snapshot site
+
+        Args:
+            context: playwright.async_api BrowserContext
+        """
+        await context.route("**/*", self._handle_route_async)
+
+    def _handle_route(self, route: Route) -> None:
+        """Fulfill snapshot documents, pass local traffic through and abort everything else"""
+        if urlsplit(route.request.url).hostname in LOCAL_HOSTS:
+            route.continue_()
+            return
+        body = self.lookup(route.request.url)
+        if body is None:
+            route.abort("internetdisconnected")
+            return
+        route.fulfill(status=200, content_type="text/html; charset=utf-8", body=body)
+
+    async def _handle_route_async(self, route) -> None:
+        """Async variant of _handle_route"""
+        if urlsplit(route.request.url).hostname in LOCAL_HOSTS:
+            await route.continue_()
+            return
+        body = self.lookup(route.request.url)
+        if body is None:
+            await route.abort("internetdisconnected")
+            return
+        await route.fulfill(status=200, content_type="text/html; charset=utf-8", body=body)
+
+
+@lru_cache(maxsize=1)
+def get_offline_site() -> OfflineSite:
+    """
+    Get the process-wide offline site (snapshots are read once per worker)
+
+    Returns:
+        OfflineSite instance
+    """
+    return OfflineSite()
@@ -0,0 +1,195 @@
+"""
+Route Policies
+Declarative request blocking for browser contexts, with per-test savings accounting
+"""
+from urllib.parse import urlsplit
+
+from playwright.sync_api import BrowserContext, Request, Route
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Domains (and their subdomains) treated as first-party
+FIRST_PARTY_DOMAINS = ("ultimateqa.com", "127.0.0.1", "localhost")
+
+# Typical transfer size per resource type, used to estimate bytes saved by blocking (blocked responses are
+# never downloaded, so their real size is unknown)
+RESOURCE_SIZE_ESTIMATES = {
+    "document": 60_000,
+    "stylesheet": 20_000,
+    "script": 40_000,
+    "image": 50_000,
+    "media": 500_000,
+    "font": 40_000,
+    "xhr": 3_000,
+    "fetch": 3_000,
+    "websocket": 0,
+    "eventsource": 1_000,
+    "manifest": 1_000,
+    "texttrack": 5_000,
+    "other": 5_000,
+}
+
+MEDIA_RESOURCE_TYPES = ("image", "media", "font")
+
+
+def is_first_party(url: str, domains: tuple = FIRST_PARTY_DOMAINS) -> bool:
+    """
+    Check if a URL belongs to a first-party domain
+
+    Args:
+        url: Request URL
+        domains: First-party domains
+
+    Returns:
+        True if the host is one of the domains or a subdomain of one
+    """
+    host = urlsplit(url).hostname or ""
+    return any(host == domain or host.endswith(f".{domain}") for domain in domains)
+
+
+class RoutePolicy:
+    """Declarative description of which requests to block"""
+
+    def __init__(
+        self,
+        name: str,
+        block_resource_types: tuple = (),
+        block_third_party: bool = False,
+        allow_resource_types: tuple | None = None,
+        first_party_domains: tuple = FIRST_PARTY_DOMAINS
+    ):
+        """
+        Initialize route policy
+
+        Args:
+            name: Policy name
+            block_resource_types: Resource types blocked regardless of origin
+            block_third_party: Block every request outside first_party_domains
+            allow_resource_types: If set, block every resource type not listed
+            first_party_domains: Domains treated as first-party
+        """
+        self.name = name
+        self.block_resource_types = block_resource_types
+        self.block_third_party = block_third_party
+        self.allow_resource_types = allow_resource_types
+        self.first_party_domains = first_party_domains
+
+    def should_block(self, request: Request) -> bool:
+        """
+        Check if a request is blocked by this policy
+
+        Args:
+            request: Playwright request
+
+        Returns:
+            True if the request should be aborted
+        """
+        resource_type = request.resource_type
+        if resource_type in self.block_resource_types:
+            return True
+        if self.allow_resource_types is not None and resource_type not in self.allow_resource_types:
+            return True
+        return self.block_third_party and not is_first_party(request.url, self.first_party_domains)
+
+    def __repr__(self) -> str:
+        return f"RoutePolicy({self.name!r})"
+
+
+POLICIES = {
+    "block-third-party": RoutePolicy("block-third-party", block_third_party=True),
+    "block-media": RoutePolicy("block-media", block_resource_types=MEDIA_RESOURCE_TYPES),
+    "first-party-only": RoutePolicy(
+        "first-party-only",
+        block_third_party=True,
+        allow_resource_types=("document", "script", "stylesheet"),
+    ),
+}
+
+# Policy applied by suite marker, in priority order. first-party-only also drops fonts, images and XHR the
+# page may need, so it is never a default: tests opt in with @pytest.mark.route_policy("first-party-only")
+MARKER_POLICIES = (
+    ("regression", "block-media"),
+    ("ui", "block-third-party"),
+)
+
+
+def select_policy(marker_names: set, override: str | None = None) -> RoutePolicy | None:
+    """
+    Select the route policy for a test
+
+    Args:
+        marker_names: Names of the markers on the test
+        override: Policy name forced by a route_policy marker or ROUTE_POLICY ('none' disables)
+
+    Returns:
+        RoutePolicy or None if nothing should be blocked
+    """
+    if override:
+        if override == "none":
+            return None
+        if override not in POLICIES:
+            raise ValueError(f"Unknown route policy '{override}'. Available: {', '.join(POLICIES)}")
+        return POLICIES[override]
+    for marker_name, policy_name in MARKER_POLICIES:
+        if marker_name in marker_names:
+            return POLICIES[policy_name]
+    return None
+
+
+class RouteBlocker:
+    """Applies a RoutePolicy to a browser context and counts what it saved"""
+
+    def __init__(self, policy: RoutePolicy):
+        """
+        Initialize route blocker
+
+        Args:
+            policy: Policy to enforce
+        """
+        self.policy = policy
+        self.blocked_requests = 0
+        self.bytes_saved = 0
+        self.blocked_by_type: dict[str, int] = {}
+
+    def install(self, context: BrowserContext) -> None:
+        """
+        Route all requests of a browser context through the policy
+
+        Args:
+            context: Browser context
+        """
+        context.route("**/*", self._handle_route)
+
+    def _handle_route(self, route: Route) -> None:
+        """Abort blocked requests and hand everything else to the next handler"""
+        request = route.request
+        if not self.policy.should_block(request):
+            route.fallback()
+            return
+        resource_type = request.resource_type
+        self.blocked_requests += 1
+        self.bytes_saved += RESOURCE_SIZE_ESTIMATES.get(resource_type, RESOURCE_SIZE_ESTIMATES["other"])
+        self.blocked_by_type[resource_type] = self.blocked_by_type.get(resource_type, 0) + 1
+        route.abort("blockedbyclient")
+
+    def reset_counts(self) -> None:
+        """Start counting from zero (for contexts reused across tests)"""
+        self.blocked_requests = 0
+        self.bytes_saved = 0
+        self.blocked_by_type = {}
+
+    def summary(self) -> dict:
+        """
+        Get the savings for the current test
+
+        Returns:
+            Dictionary with policy name, blocked request count and estimated bytes saved
+        """
+        return {
+            "policy": self.policy.name,
+            "blocked_requests": self.blocked_requests,
+            "estimated_bytes_saved": self.bytes_saved,
+            "blocked_by_type": dict(self.blocked_by_type),
+        }
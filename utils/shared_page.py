@@ -0,0 +1,202 @@
+"""
+Shared Page Pool
+Keeps one page per test class or module alive for read-only tests
+"""
+from collections import OrderedDict
+from typing import Callable
+from weakref import WeakKeyDictionary
+
+from playwright.sync_api import BrowserContext, Error, Page
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Resets scroll position and storage, then reports where the page is and how long its session history is
+RESET_SCRIPT = """() => {
+    window.scrollTo(0, 0);
+    try {
+        window.localStorage.clear();
+        window.sessionStorage.clear();
+    } catch (e) {}
+    return [window.location.href, window.history.length];
+}"""
+
+# Page -> SharedPage for pages owned by a pool
+_shared_pages: "WeakKeyDictionary[Page, SharedPage]" = WeakKeyDictionary()
+
+
+def get_shared_page(page: Page) -> "SharedPage | None":
+    """
+    Get the shared-page state of a page
+
+    Args:
+        page: Playwright Page object
+
+    Returns:
+        SharedPage if the page is owned by a pool, None otherwise
+    """
+    return _shared_pages.get(page)
+
+
+class SharedPage:
+    """A page reused across the tests of one class or module"""
+
+    def __init__(self, key: str, context: BrowserContext, page: Page):
+        """
+        Initialize shared page
+
+        Args:
+            key: Node id of the owning class or module
+            context: Browser context owning the page
+            page: Playwright Page object
+        """
+        self.key = key
+        self.context = context
+        self.page = page
+        self.home_url: str | None = None
+        self.landed_url: str | None = None
+        self.landed_history: int | None = None
+        self.parked = False
+        self.dirty = False
+        self.uses = 0
+        self.route_blocker = None
+
+    def reuse_navigation(self, url: str) -> bool:
+        """
+        Check if a navigation can be skipped because the reset page is already there
+
+        Args:
+            url: URL about to be navigated to
+
+        Returns:
+            True if the page is parked at url
+        """
+        if self.parked and url == self.home_url:
+            self.parked = False
+            return True
+        return False
+
+    def navigated(self, url: str) -> None:
+        """
+        Record a navigation (the first one defines the home URL)
+
+        Args:
+            url: URL navigated to
+        """
+        self.parked = False
+        if self.home_url is None:
+            self.home_url = url
+            self.landed_url = self.page.url
+            self.landed_history = self.page.evaluate("() => window.history.length")
+        elif url != self.home_url:
+            self.dirty = True
+
+    def mark_dirty(self) -> None:
+        """Mark the page as mutated so it is not reused"""
+        self.dirty = True
+
+    def reset(self) -> bool:
+        """
+        Cheap reset between tests: scroll position, storage and cookies
+
+        Session history cannot be cleared, so a page whose history grew since
+        it landed (a test navigated away and back, or pushed history entries)
+        is not reused: go_back() or go_forward() in the next test could reach
+        the previous test's pages. An unchanged history holds the same
+        entries as a freshly landed page.
+
+        Returns:
+            True if the page is back at its home URL with its landing history and can be reused
+        """
+        try:
+            self.context.clear_cookies()
+            url, history_length = self.page.evaluate(RESET_SCRIPT)
+        except Error as e:
+            logger.warning("Shared page reset failed: %s", e)
+            return False
+        if self.landed_url is not None and url != self.landed_url:
+            return False
+        if self.landed_history is not None and history_length != self.landed_history:
+            logger.info("Shared page history changed since landing, replacing the page")
+            return False
+        self.parked = self.home_url is not None
+        return True
+
+    def close(self) -> None:
+        """Close the page and its context"""
+        _shared_pages.pop(self.page, None)
+        try:
+            self.context.close()
+        except Error as e:
+            logger.warning("Closing shared context failed: %s", e)
+
+
+class SharedPagePool:
+    """Pool of shared pages keyed by test class or module"""
+
+    def __init__(self, new_context: Callable[[], BrowserContext], max_entries: int = 4):
+        """
+        Initialize shared page pool
+
+        Args:
+            new_context: Factory creating a browser context for a new shared page
+            max_entries: Maximum number of shared pages kept open per worker
+        """
+        self.new_context = new_context
+        self.max_entries = max_entries
+        self.entries: "OrderedDict[str, SharedPage]" = OrderedDict()
+
+    def checkout(self, key: str) -> tuple[SharedPage, bool]:
+        """
+        Get the shared page for a class or module, resetting or replacing it as needed
+
+        Args:
+            key: Node id of the owning class or module
+
+        Returns:
+            Tuple of (shared page, created) where created is True for a fresh page
+        """
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+            if entry.reset():
+                entry.uses += 1
+                logger.info("Reusing shared page for %s (use %d)", key, entry.uses)
+                return entry, False
+            self.discard(entry)
+
+        while len(self.entries) >= self.max_entries:
+            _, oldest = self.entries.popitem(last=False)
+            oldest.close()
+
+        context = self.new_context()
+        entry = SharedPage(key, context, context.new_page())
+        entry.uses = 1
+        _shared_pages[entry.page] = entry
+        self.entries[key] = entry
+        logger.info("Created shared page for %s", key)
+        return entry, True
+
+    def checkin(self, entry: SharedPage, failed: bool) -> None:
+        """
+        Return a shared page after a test
+
+        Args:
+            entry: Shared page
+            failed: Whether the test failed (failed or mutated pages are discarded)
+        """
+        if failed or entry.dirty:
+            logger.info("Discarding shared page for %s (%s)", entry.key, "failed" if failed else "mutated")
+            self.discard(entry)
+
+    def discard(self, entry: SharedPage) -> None:
+        """Close a shared page and drop it from the pool"""
+        self.entries.pop(entry.key, None)
+        entry.close()
+
+    def close(self) -> None:
+        """Close every shared page"""
+        for entry in list(self.entries.values()):
+            entry.close()
+        self.entries.clear()
@@ -0,0 +1,242 @@
+"""
+Startup Profile
+Import time per module, fixture setup cost and framework startup overhead until the first test, with a budget check
+"""
+import os
+import sys
+import time
+from importlib.abc import MetaPathFinder
+
+import pytest
+
+# Environment flag passed to xdist workers (they inherit the controller's environment)
+PROFILE_ENV = "STARTUP_PROFILE"
+
+# Rows shown per table in the terminal summary
+TOP_ROWS = 15
+
+
+class ImportProfiler(MetaPathFinder):
+    """Times module execution of every import made after install(), like python -X importtime"""
+
+    def __init__(self):
+        """Initialize import profiler"""
+        self.timings: dict[str, dict] = {}
+        self._stack: list[list] = []
+
+    def find_spec(self, fullname, path, target=None):
+        """Find the module with the remaining finders and wrap its loader"""
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                    spec.loader = _TimedLoader(spec.loader, self)
+                return spec
+        return None
+
+    def record(self, name: str, cumulative_ms: float, children_ms: float) -> None:
+        """Store a module's import time"""
+        self.timings[name] = {
+            "module": name,
+            "self_ms": round(cumulative_ms - children_ms, 2),
+            "cumulative_ms": round(cumulative_ms, 2),
+        }
+
+    def top(self, count: int = TOP_ROWS) -> list[dict]:
+        """
+        Get the slowest imports
+
+        Args:
+            count: Number of rows
+
+        Returns:
+            Import timings sorted by self time, slowest first
+        """
+        return sorted(self.timings.values(), key=lambda timing: timing["self_ms"], reverse=True)[:count]
+
+    def install(self) -> None:
+        """Start timing imports"""
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+
+    def uninstall(self) -> None:
+        """Stop timing imports"""
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+
+class _TimedLoader:
+    """Loader wrapper timing exec_module (nested imports are subtracted for self time)"""
+
+    def __init__(self, loader, profiler: ImportProfiler):
+        self._loader = loader
+        self._profiler = profiler
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        """Delegate module creation"""
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        """Execute the module and record how long it took"""
+        stack = self._profiler._stack
+        stack.append([module.__name__, 0.0])
+        started = time.perf_counter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            cumulative_ms = (time.perf_counter() - started) * 1000
+            name, children_ms = stack.pop()
+            if stack:
+                stack[-1][1] += cumulative_ms
+            self._profiler.record(name, cumulative_ms, children_ms)
+
+
+_profiler: ImportProfiler | None = None
+
+# Process CPU time (ms) when conftest started importing the framework
+_framework_started_ms: float | None = None
+
+
+def startup_profile_requested() -> bool:
+    """Check the command line, PYTEST_ADDOPTS and the worker environment for --startup-profile"""
+    return (
+        "--startup-profile" in sys.argv
+        or "--startup-profile" in os.getenv("PYTEST_ADDOPTS", "")
+        or os.getenv(PROFILE_ENV) == "1"
+    )
+
+
+def install_import_profiler() -> ImportProfiler | None:
+    """
+    Mark the start of the framework's startup and time imports if --startup-profile was requested
+
+    Called from the root conftest.py, which pytest loads before tests/conftest.py imports the framework.
+    Everything before (interpreter, pytest, third-party plugins) is outside
+    the framework's control and reported separately.
+
+    Returns:
+        The active ImportProfiler, or None
+    """
+    global _profiler, _framework_started_ms
+    if _framework_started_ms is None:
+        _framework_started_ms = time.process_time() * 1000
+    if _profiler is None and startup_profile_requested():
+        _profiler = ImportProfiler()
+        _profiler.install()
+    return _profiler
+
+
+class StartupProfilePlugin:
+    """Reports import times, fixture setup cost and startup overhead; fails the run only over an explicit budget"""
+
+    def __init__(self, config, budget_ms: float | None = None):
+        """
+        Initialize startup profile plugin
+
+        Args:
+            config: Pytest config
+            budget_ms: Allowed framework CPU time (conftest import to first test) per process; None = report only
+        """
+        self.config = config
+        self.budget_ms = budget_ms
+        self.profiler = _profiler
+        self.startup_ms: float | None = None
+        self.fixture_totals: dict[str, list] = {}
+        self.startups: dict[str, dict] = {}
+        if self.profiler is not None:
+            os.environ[PROFILE_ENV] = "1"
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_fixture_setup(self, fixturedef, request):
+        """Time each fixture setup and attach it to the test that triggered it"""
+        started = time.perf_counter()
+        yield
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        item = getattr(request, "_pyfuncitem", None)
+        if item is not None:
+            item.user_properties.append(("fixture_setup", [fixturedef.argname, fixturedef.scope, elapsed_ms]))
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_setup(self, item):
+        """Take the process's CPU time when its first test starts"""
+        if self.startup_ms is not None:
+            return
+        self.startup_ms = time.process_time() * 1000
+        if self.profiler is not None:
+            self.profiler.uninstall()
+        framework_started_ms = _framework_started_ms if _framework_started_ms is not None else 0.0
+        item.user_properties.append(("startup", {
+            "cpu_ms": round(self.startup_ms, 1),
+            "framework_ms": round(self.startup_ms - framework_started_ms, 1),
+            "imports": self.profiler.top() if self.profiler is not None else [],
+        }))
+
+    def pytest_runtest_logreport(self, report):
+        """Collect startup and fixture timings from teardown reports (also sent by xdist workers)"""
+        if report.when != "teardown":
+            return
+        worker = getattr(report, "node", None)
+        process = getattr(worker, "gateway", None).id if worker is not None else "main"
+        for name, value in report.user_properties:
+            if name == "startup":
+                self.startups[process] = value
+            elif name == "fixture_setup":
+                fixture, scope, elapsed_ms = value
+                totals = self.fixture_totals.setdefault(f"{fixture} ({scope})", [0, 0.0])
+                totals[0] += 1
+                totals[1] += elapsed_ms
+
+    @property
+    def over_budget(self) -> list[str]:
+        """Processes whose framework startup exceeded the budget (none without a budget)"""
+        if self.budget_ms is None:
+            return []
+        return [process for process, startup in self.startups.items() if startup["framework_ms"] > self.budget_ms]
+
+    def pytest_sessionfinish(self, session):
+        """Fail the run if a process started over budget"""
+        if not hasattr(self.config, "workerinput") and self.over_budget and session.exitstatus == 0:
+            session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+    def pytest_terminal_summary(self, terminalreporter):
+        """Show startup overhead, the slowest imports and fixture setup costs"""
+        if not self.startups:
+            return
+        terminalreporter.write_sep("-", "startup profile")
+        over_budget = self.over_budget
+        for process, startup in sorted(self.startups.items()):
+            if self.budget_ms is None:
+                status = "no budget set"
+            else:
+                status = f"budget {self.budget_ms:.0f} ms, {'over budget' if process in over_budget else 'ok'}"
+            terminalreporter.write_line(
+                f"{process}: framework {startup['framework_ms']:.0f} ms CPU from conftest import to the first test "
+                f"({status}); {startup['cpu_ms'] - startup['framework_ms']:.0f} ms before it in Python, pytest "
+                f"and plugins"
+            )
+        if self.profiler is not None:
+            terminalreporter.write_line("Import timing adds overhead; check budgets without --startup-profile")
+
+        slowest = max(self.startups.values(), key=lambda startup: startup["framework_ms"])
+        if slowest["imports"]:
+            terminalreporter.write_line("")
+            terminalreporter.write_line(f"{'import':<50}{'self ms':>10}{'cumulative ms':>16}")
+            for timing in slowest["imports"]:
+                terminalreporter.write_line(
+                    f"{timing['module']:<50}{timing['self_ms']:>10.1f}{timing['cumulative_ms']:>16.1f}"
+                )
+
+        if self.fixture_totals:
+            terminalreporter.write_line("")
+            terminalreporter.write_line(f"{'fixture setup':<50}{'setups':>10}{'total ms':>16}")
+            ranked = sorted(self.fixture_totals.items(), key=lambda entry: entry[1][1], reverse=True)
+            for fixture, (setups, total_ms) in ranked[:TOP_ROWS]:
+                terminalreporter.write_line(f"{fixture:<50}{setups:>10}{total_ms:>16.1f}")
+
+        for process in over_budget:
+            terminalreporter.write_line(f"{process} exceeded the startup budget", red=True)
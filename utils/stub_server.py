@@ -0,0 +1,218 @@
+"""
+Stub Server
+Local threaded HTTP server hosting page snapshots with injectable network conditions
+"""
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+from utils.logger import get_logger
+from utils.offline_site import get_offline_site, normalize_path
+
+logger = get_logger(__name__)
+
+# Throttled responses are written in slices of this duration
+THROTTLE_SLICE_SECONDS = 0.05
+
+
+class RouteProfile:
+    """Network conditions applied to a route"""
+
+    def __init__(
+        self,
+        latency_ms: float = 0,
+        jitter_ms: float = 0,
+        bandwidth_kbps: float | None = None,
+        error_rate: float = 0.0,
+        error_status: int = 503
+    ):
+        """
+        Initialize route profile
+
+        Args:
+            latency_ms: Delay before the response starts, in milliseconds
+            jitter_ms: Random extra delay (0..jitter_ms) added to the latency
+            bandwidth_kbps: Throughput cap in kilobytes per second (None = unlimited)
+            error_rate: Probability (0..1) of answering with error_status
+            error_status: HTTP status used for injected errors
+        """
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.bandwidth_kbps = bandwidth_kbps
+        self.error_rate = error_rate
+        self.error_status = error_status
+
+    def delay_seconds(self, rng: random.Random) -> float:
+        """Get the delay for one response in seconds"""
+        jitter = rng.uniform(0, self.jitter_ms) if self.jitter_ms else 0
+        return (self.latency_ms + jitter) / 1000
+
+    def __repr__(self) -> str:
+        return (
+            f"RouteProfile(latency_ms={self.latency_ms}, jitter_ms={self.jitter_ms}, "
+            f"bandwidth_kbps={self.bandwidth_kbps}, error_rate={self.error_rate})"
+        )
+
+
+class _StubRequestHandler(BaseHTTPRequestHandler):
+    """Request handler serving pages from the owning StubServer"""
+
+    # HTTP/1.1 keeps connections alive between requests
+    protocol_version = "HTTP/1.1"
+    server: "_StubHTTPServer"
+
+    def do_GET(self) -> None:  # noqa: N802 (BaseHTTPRequestHandler naming)
+        """Serve a GET request"""
+        self._serve(send_body=True)
+
+    def do_HEAD(self) -> None:  # noqa: N802 (BaseHTTPRequestHandler naming)
+        """Serve a HEAD request"""
+        self._serve(send_body=False)
+
+    def _serve(self, send_body: bool) -> None:
+        stub = self.server.stub
+        path = normalize_path(urlsplit(self.path).path)
+        profile = stub.profile_for(path)
+
+        delay = profile.delay_seconds(stub.rng)
+        if delay:
+            time.sleep(delay)
+
+        body = stub.pages.get(path)
+        if body is None:
+            self._send_status(404, path)
+        elif profile.error_rate and stub.rng.random() < profile.error_rate:
+            self._send_status(profile.error_status, path)
+        else:
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            if send_body:
+                self._write_body(body, profile.bandwidth_kbps)
+            stub.record(path, len(body))
+
+    def _send_status(self, status: int, path: str) -> None:
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+        self.server.stub.record(path, 0, status)
+
+    def _write_body(self, body: bytes, bandwidth_kbps: float | None) -> None:
+        if not bandwidth_kbps:
+            self.wfile.write(body)
+            return
+        slice_size = max(1, int(bandwidth_kbps * 1024 * THROTTLE_SLICE_SECONDS))
+        for start in range(0, len(body), slice_size):
+            self.wfile.write(body[start:start + slice_size])
+            self.wfile.flush()
+            time.sleep(THROTTLE_SLICE_SECONDS)
+
+    def log_message(self, format, *args) -> None:  # pylint: disable=redefined-builtin
+        """Route access logs through the framework logger"""
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+
+class _StubHTTPServer(ThreadingHTTPServer):
+    """Threaded HTTP server with a deep accept backlog"""
+
+    daemon_threads = True
+    request_queue_size = 1024
+
+    def __init__(self, address: tuple, stub: "StubServer"):
+        self.stub = stub
+        super().__init__(address, _StubRequestHandler)
+
+
+class StubServer:
+    """Local stand-in for the practice site, served from memory"""
+
+    def __init__(
+        self,
+        pages: dict[str, bytes] | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        seed: int | None = None
+    ):
+        """
+        Initialize stub server
+
+        Args:
+            pages: Mapping of URL path to response body (defaults to the offline snapshots)
+            host: Interface to bind
+            port: Port to bind (0 = any free port)
+            seed: Seed for jitter and error injection
+        """
+        self.pages = {normalize_path(path): body for path, body in (pages or get_offline_site().pages).items()}
+        self.rng = random.Random(seed)
+        self.default_profile = RouteProfile()
+        self.profiles: dict[str, RouteProfile] = {}
+        self.stats: dict[str, dict] = {}
+        self._stats_lock = threading.Lock()
+        self._httpd = _StubHTTPServer((host, port), self)
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        """Base URL of the running server"""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def url_for(self, path: str) -> str:
+        """
+        Get the absolute URL for a path
+
+        Args:
+            path: URL path (e.g. '/automation')
+
+        Returns:
+            Absolute URL on the stub server
+        """
+        return f"{self.url}/{path.lstrip('/')}"
+
+    def start(self) -> "StubServer":
+        """Start serving in a background thread"""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="stub-server", daemon=True)
+        self._thread.start()
+        logger.info("Stub server listening on %s", self.url)
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and release the port"""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        logger.info("Stub server stopped")
+
+    def set_profile(self, profile: RouteProfile, path: str | None = None) -> None:
+        """
+        Apply network conditions to one route or to all routes
+
+        Args:
+            profile: Network conditions
+            path: URL path (None = default for every route)
+        """
+        if path is None:
+            self.default_profile = profile
+        else:
+            self.profiles[normalize_path(path)] = profile
+        logger.info("Stub server profile for %s: %s", path or "*", profile)
+
+    def reset_profiles(self) -> None:
+        """Remove all injected network conditions"""
+        self.default_profile = RouteProfile()
+        self.profiles.clear()
+
+    def profile_for(self, path: str) -> RouteProfile:
+        """Get the network conditions for a normalized path"""
+        return self.profiles.get(path, self.default_profile)
+
+    def record(self, path: str, size: int, status: int = 200) -> None:
+        """Record a served response"""
+        with self._stats_lock:
+            entry = self.stats.setdefault(path, {"requests": 0, "bytes": 0, "errors": 0})
+            entry["requests"] += 1
+            entry["bytes"] += size
+            if status >= 400:
+                entry["errors"] += 1
@@ -3,12 +3,35 @@ Test Data Management
 Handles test data generation and loading
 """
 import json
-import yaml
+from functools import lru_cache
 from pathlib import Path
-from faker import Faker
+from typing import Iterator
 
+from utils.config_reader import config
+from utils.data_pool import CONTACT_SCHEMA, USER_SCHEMA, get_data_pool
+from utils.data_source import iter_records
 
-fake = Faker()
+
+@lru_cache(maxsize=None)
+def get_faker():
+    """
+    Get the shared Faker instance, created on first use
+
+    Importing faker and building its providers takes ~100 ms, which every
+    xdist worker would otherwise pay at collection time.
+
+    Returns:
+        Faker instance
+    """
+    from faker import Faker
+    return Faker()
+
+
+def __getattr__(name: str):
+    """Keep 'from utils.test_data import fake' working without creating Faker at import time"""
+    if name == "fake":
+        return get_faker()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class TestDataManager:
@@ -39,9 +62,25 @@ class TestDataManager:
         Returns:
             Dictionary with loaded data
         """
+        import yaml
+
         with open(file_path, encoding='utf-8') as f:
             return yaml.safe_load(f)
 
+    @staticmethod
+    def iter_records(file_path: str, sheet: str | None = None) -> Iterator[dict]:
+        """
+        Iterate the records of a JSON-lines, CSV, XLSX or multi-document YAML file without loading it whole
+
+        Args:
+            file_path: Path to the data file
+            sheet: Worksheet name for Excel files
+
+        Returns:
+            Iterator of record dicts
+        """
+        return iter_records(file_path, sheet)
+
     @staticmethod
     def save_json(data: dict, file_path: str) -> None:
         """
@@ -57,7 +96,7 @@ class TestDataManager:
 
 
 class ContactFormData:
-    """Test data for contact form"""
+    """Test data for contact form (drawn from the seeded contact_form data pool)"""
 
     @staticmethod
     def get_valid_data() -> dict:
@@ -67,10 +106,7 @@ class ContactFormData:
         Returns:
             Dictionary with valid test data
         """
-        return {
-            "name": fake.name(),
-            "message": fake.text(max_nb_chars=200)
-        }
+        return get_data_pool(CONTACT_SCHEMA).next()
 
     @staticmethod
     def get_invalid_name_data() -> dict:
@@ -82,7 +118,7 @@ class ContactFormData:
         """
         return {
             "name": "",  # Empty name
-            "message": fake.text(max_nb_chars=200)
+            "message": get_data_pool(CONTACT_SCHEMA).next()["message"]
         }
 
     @staticmethod
@@ -94,7 +130,7 @@ class ContactFormData:
             Dictionary with invalid message data
         """
         return {
-            "name": fake.name(),
+            "name": get_data_pool(CONTACT_SCHEMA).next()["name"],
             "message": ""  # Empty message
         }
 
@@ -106,9 +142,10 @@ class ContactFormData:
         Returns:
             Dictionary with boundary test data
         """
+        messages = [record["message"] for record in get_data_pool(CONTACT_SCHEMA).take(40)]
         return {
             "name": "A" * 100,  # Very long name
-            "message": fake.text(max_nb_chars=5000)  # Very long message
+            "message": " ".join(messages)[:5000]  # Very long message
         }
 
     @staticmethod
@@ -133,18 +170,13 @@ class UserData:
         """
         Get random user data
 
+        Users come from the seeded users data pool: the same DATA_POOL_SEED gives
+        the same users on every machine, and no two xdist workers get the same one.
+
         Returns:
             Dictionary with user data
         """
-        return {
-            "first_name": fake.first_name(),
-            "last_name": fake.last_name(),
-            "email": fake.email(),
-            "phone": fake.phone_number(),
-            "address": fake.address(),
-            "company": fake.company(),
-            "job_title": fake.job()
-        }
+        return get_data_pool(USER_SCHEMA).next()
 
     @staticmethod
     def get_multiple_users(count: int = 5) -> list:
@@ -157,4 +189,26 @@ class UserData:
         Returns:
             List of user dictionaries
         """
-        return [UserData.get_random_user() for _ in range(count)]
+        return get_data_pool(USER_SCHEMA).take(count)
+
+    @staticmethod
+    def get_test_user(role: str = "user") -> dict:
+        """
+        Get a registered test account by role
+
+        TEST_USERNAME/TEST_PASSWORD, when set, replace the credentials of the 'user' role.
+
+        Args:
+            role: Role from test_data/test_users.json ('admin', 'user')
+
+        Returns:
+            Dictionary with name, email, password and role
+        """
+        users = TestDataManager.load_json(Path(__file__).parent.parent / "test_data" / "test_users.json")["users"]
+        user = next((user for user in users if user["role"] == role), None)
+        if user is None:
+            roles = ", ".join(user["role"] for user in users)
+            raise ValueError(f"Unknown test user role '{role}'. Available: {roles}")
+        if role == "user" and config.test_username:
+            user = {**user, "email": config.test_username, "password": config.test_password}
+        return user
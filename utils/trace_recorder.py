@@ -0,0 +1,135 @@
+"""
+Trace Recorder
+Chunked Playwright tracing: one trace chunk per test, kept only when the trace mode asks for it
+"""
+import time
+from weakref import WeakKeyDictionary
+
+from playwright.sync_api import BrowserContext
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# What each trace level records (sources are the most expensive part)
+TRACE_LEVELS = {
+    "full": {"screenshots": True, "snapshots": True, "sources": True},
+    "snapshots": {"screenshots": True, "snapshots": True, "sources": False},
+    "screenshots": {"screenshots": True, "snapshots": False, "sources": False},
+}
+
+# off: no tracing; on: keep every chunk; retain-on-failure: keep chunks of failed tests;
+# on-first-retry: record only reruns (pytest-rerunfailures) and keep them
+TRACE_MODES = ("off", "on", "retain-on-failure", "on-first-retry")
+
+# Context -> TraceRecorder
+_recorders: "WeakKeyDictionary[BrowserContext, TraceRecorder]" = WeakKeyDictionary()
+
+
+def should_record(mode: str, execution_count: int = 1) -> bool:
+    """
+    Check if a test run is traced at all
+
+    Args:
+        mode: Trace mode
+        execution_count: 1 for the first run, >1 for reruns
+
+    Returns:
+        True if a chunk should be recorded
+    """
+    if mode not in TRACE_MODES:
+        raise ValueError(f"Unknown trace mode '{mode}'. Available: {', '.join(TRACE_MODES)}")
+    if mode == "off":
+        return False
+    if mode == "on-first-retry":
+        return execution_count > 1
+    return True
+
+
+def should_keep(mode: str, failed: bool) -> bool:
+    """
+    Check if a recorded chunk is written to disk
+
+    Args:
+        mode: Trace mode
+        failed: Whether the test failed
+
+    Returns:
+        True if the chunk should be saved
+    """
+    return mode != "retain-on-failure" or failed
+
+
+class TraceRecorder:
+    """Starts tracing once per context and records one chunk per test"""
+
+    def __init__(self, context: BrowserContext, level: str = "full"):
+        """
+        Initialize trace recorder
+
+        Args:
+            context: Browser context
+            level: Trace level (see TRACE_LEVELS)
+        """
+        if level not in TRACE_LEVELS:
+            raise ValueError(f"Unknown trace level '{level}'. Available: {', '.join(TRACE_LEVELS)}")
+        self.context = context
+        self.level = level
+        self.started = False
+        self.recording = False
+        self.chunk_ms = 0.0
+
+    def start_chunk(self, title: str) -> None:
+        """
+        Start the chunk of a test (starting tracing on first use)
+
+        Args:
+            title: Chunk title shown in the trace viewer
+        """
+        started = time.perf_counter()
+        if not self.started:
+            self.context.tracing.start(**TRACE_LEVELS[self.level])
+            self.started = True
+        self.context.tracing.start_chunk(title=title)
+        self.recording = True
+        self.chunk_ms = (time.perf_counter() - started) * 1000
+
+    def stop_chunk(self, path: str | None = None) -> float:
+        """
+        Stop the current chunk, saving it if a path is given and discarding it otherwise
+
+        Args:
+            path: Trace file path or None
+
+        Returns:
+            Time spent starting and stopping the test's chunk in milliseconds; recording slows the
+            test's own actions too, which only a traced vs untraced comparison shows (benchmarks.run)
+        """
+        if not self.recording:
+            return 0.0
+        started = time.perf_counter()
+        if path:
+            self.context.tracing.stop_chunk(path=path)
+        else:
+            self.context.tracing.stop_chunk()
+        self.recording = False
+        self.chunk_ms += (time.perf_counter() - started) * 1000
+        return self.chunk_ms
+
+
+def get_trace_recorder(context: BrowserContext, level: str = "full") -> TraceRecorder:
+    """
+    Get the trace recorder of a context, creating it on first use
+
+    Args:
+        context: Browser context
+        level: Trace level for a new recorder
+
+    Returns:
+        TraceRecorder bound to the context
+    """
+    recorder = _recorders.get(context)
+    if recorder is None:
+        recorder = TraceRecorder(context, level)
+        _recorders[context] = recorder
+    return recorder
@@ -0,0 +1,186 @@
+"""
+Wait Engine
+Event-driven waits on browser state plus adaptive polling for Python-side conditions, all under one deadline
+"""
+import random
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator
+
+from playwright.sync_api import Locator, Page
+
+from utils.action_timing import record_wait
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Backoff of Python-side polling: first re-check after 10 ms, doubling up to 500 ms, +/-25% jitter
+INITIAL_DELAY = 0.01
+MAX_DELAY = 0.5
+BACKOFF_FACTOR = 2.0
+JITTER = 0.25
+
+
+class Deadline:
+    """A single time budget shared by every step of a wait"""
+
+    def __init__(self, timeout_ms: float):
+        """
+        Initialize deadline
+
+        Args:
+            timeout_ms: Budget in milliseconds
+        """
+        self.timeout_ms = timeout_ms
+        self.started = time.monotonic()
+        self.expires = self.started + timeout_ms / 1000
+
+    @property
+    def remaining_ms(self) -> float:
+        """Milliseconds left (0 once expired)"""
+        return max(0.0, (self.expires - time.monotonic()) * 1000)
+
+    @property
+    def elapsed_ms(self) -> float:
+        """Milliseconds since the deadline was created"""
+        return (time.monotonic() - self.started) * 1000
+
+    @property
+    def expired(self) -> bool:
+        """True once the budget is used up"""
+        return time.monotonic() >= self.expires
+
+
+def backoff_delays(
+    initial: float = INITIAL_DELAY,
+    maximum: float = MAX_DELAY,
+    factor: float = BACKOFF_FACTOR,
+    jitter: float = JITTER
+) -> Iterator[float]:
+    """
+    Generate exponentially growing delays with jitter
+
+    Args:
+        initial: First delay in seconds
+        maximum: Upper bound of a delay in seconds (before jitter)
+        factor: Growth per step
+        jitter: Relative random spread (0.25 = +/-25%) so parallel workers do not poll in lockstep
+
+    Yields:
+        Delays in seconds
+    """
+    delay = initial
+    while True:
+        yield delay * random.uniform(1 - jitter, 1 + jitter)
+        delay = min(delay * factor, maximum)
+
+
+@contextmanager
+def timed_wait(name: str, target: str | None = None):
+    """
+    Record how long a wait actually took (action timing event and debug log)
+
+    Args:
+        name: Wait name
+        target: What is waited for
+    """
+    started = time.perf_counter()
+    outcome, error = "ok", None
+    try:
+        yield
+    except Exception as e:
+        outcome = "timeout" if "Timeout" in type(e).__name__ else "error"
+        error = str(e).splitlines()[0] if str(e) else type(e).__name__
+        raise
+    finally:
+        duration_ms = (time.perf_counter() - started) * 1000
+        record_wait(name, target, duration_ms, outcome, error)
+        logger.debug("%s(%s) took %.0f ms (%s)", name, target or "", duration_ms, outcome)
+
+
+def wait_until(
+    condition: Callable[[], Any],
+    timeout_ms: float = 30000,
+    description: str = "condition",
+    initial_delay: float = INITIAL_DELAY,
+    max_delay: float = MAX_DELAY
+) -> Any:
+    """
+    Wait for a Python-side condition with adaptive backoff
+
+    The condition is checked immediately, so a condition that already holds
+    costs nothing; re-checks start fast and back off with jitter. Prefer the
+    browser-side waits below for anything observable in the page.
+
+    Args:
+        condition: Callable returning a truthy value when done
+        timeout_ms: Overall deadline in milliseconds
+        description: Used in the timeout message
+        initial_delay: First delay in seconds
+        max_delay: Largest delay in seconds
+
+    Returns:
+        The truthy value returned by the condition
+
+    Raises:
+        TimeoutError: If the condition is still falsy at the deadline
+    """
+    deadline = Deadline(timeout_ms)
+    with timed_wait("wait_until", description):
+        delays = backoff_delays(initial_delay, max_delay)
+        while True:
+            result = condition()
+            if result:
+                return result
+            if deadline.expired:
+                raise TimeoutError(f"{description} not met within {timeout_ms:.0f} ms")
+            time.sleep(min(next(delays), deadline.remaining_ms / 1000))
+
+
+def wait_for_url_change(page: Page, from_url: str, timeout_ms: float = 30000, wait_until: str = "commit") -> str:
+    """
+    Wait until the page has navigated away from a URL (resolved by navigation events)
+
+    Args:
+        page: Playwright Page
+        from_url: URL before the action that triggers the navigation
+        timeout_ms: Deadline in milliseconds
+        wait_until: Load state of the new document to wait for ('commit', 'domcontentloaded', 'load')
+
+    Returns:
+        The new URL
+    """
+    with timed_wait("wait_for_url_change", from_url):
+        page.wait_for_url(lambda url: url != from_url, wait_until=wait_until, timeout=timeout_ms)
+    return page.url
+
+
+def wait_for_page_condition(page: Page, expression: str, arg: Any = None, timeout_ms: float = 30000) -> Any:
+    """
+    Wait for a predicate evaluated in the page (re-checked on each animation frame)
+
+    Args:
+        page: Playwright Page
+        expression: JavaScript function, e.g. "() => window.appReady === true"
+        arg: Argument passed to the function
+        timeout_ms: Deadline in milliseconds
+
+    Returns:
+        The truthy value returned by the predicate
+    """
+    with timed_wait("wait_for_page_condition", expression):
+        handle = page.wait_for_function(expression, arg=arg, timeout=timeout_ms)
+    return handle.json_value()
+
+
+def wait_for_element_state(locator: Locator, state: str = "visible", timeout_ms: float = 30000) -> None:
+    """
+    Wait for an element state (resolved by DOM mutation observers in the browser)
+
+    Args:
+        locator: Element locator
+        state: 'attached', 'detached', 'visible' or 'hidden'
+        timeout_ms: Deadline in milliseconds
+    """
+    with timed_wait("wait_for_element_state", f"{locator} {state}"):
+        locator.wait_for(state=state, timeout=timeout_ms)